@@ -1,38 +1,119 @@
 import tkinter as tk
-from tkinter import messagebox
 import random
 import os
-
-# Pillow for reliable image loading
-from PIL import Image, ImageTk
+import sys
+import time
+import atexit
+from collections import deque
+
+# shared helpers (instrument.py) live in the portfolio folder one level up;
+# launcher.py has already put it on sys.path, a direct run adds it here
+PORTFOLIO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PORTFOLIO not in sys.path:
+    sys.path.append(PORTFOLIO)
+from instrument import timed, install as install_instrumentation  # noqa: E402
+from attemptlog import AttemptLogger  # noqa: E402
+from adaptive import AdaptiveEngine  # noqa: E402
+from leaderboard import Leaderboard  # noqa: E402
+from questionbank import LEVEL_RANGES  # noqa: E402
+from quizengine import (QuizSession, QUESTIONS_PER_PLAY,  # noqa: E402
+                        INVALID, CORRECT, WRONG, RESTARTED)
 
 
 # ----------------------------
 # GLOBAL STATE
 # ----------------------------
 bg_img = None            # background image
-wrong_questions = []     # list of questions where you made at least one mistake
-questionMarkedWrong = False  # avoids logging same question multiple times
+bg_item = None           # the one canvas item that shows bg_img
+bg_size = None           # (width, height) bg_img was scaled to
+resize_job = None        # pending debounced rescale (root.after id)
+session = None          # QuizSession holding score, attempts and wrong answers
+player = "Player"        # name typed on the menu, kept for the next play
+root = canvas = None     # created by buildApp()
+animator = attemptLog = leaderboard = None
+
+# set QUIZ_SEED to replay the exact same sequence of quizzes
+sessionRng = random.Random(os.environ.get("QUIZ_SEED"))
+adaptiveEngine = AdaptiveEngine(rng=sessionRng)  # learns across plays this run
+
+# QUIZ_SPEED=<n> answers n questions automatically with effects switched
+# off, for load testing (e.g. QUIZ_SPEED=5000 python Excercise1.py)
+SPEED_ANSWERS = int(os.environ.get("QUIZ_SPEED", "0") or 0)
+SPEED_MODE = SPEED_ANSWERS > 0
 
 
 # ----------------------------
 # LOAD BACKGROUND IMAGE
 # ----------------------------
-def loadBackground():
+BG_SOURCE = "backgrounddark.png"
+BG_CACHE_DIR = ".bgcache"
+BG_CACHE_MAX_FILES = 8       # scaled copies kept; the least recently used go first
+
+
+def cachedBackgroundPath(width, height):
     """
-    Load backgrounddark.png using Pillow.
-    If anything fails, bg_img stays None and we use a solid color.
+    Path of the pre-scaled copy of the background for this size.
+    The source file's mtime is part of the name, so editing the image
+    automatically misses the old cache entries.
     """
-    global bg_img
-
     script_dir = os.path.dirname(os.path.abspath(__file__))
-    img_path = os.path.join(script_dir, "backgrounddark.png")
+    src = os.path.join(script_dir, BG_SOURCE)
+    mtime = os.stat(src).st_mtime_ns
+    name = f"{os.path.splitext(BG_SOURCE)[0]}_{width}x{height}_{mtime}.png"
+    return src, os.path.join(script_dir, BG_CACHE_DIR, name)
+
+
+def trimBackgroundCache(cache_dir, stamp, keep):
+    """
+    Drop copies made from an older version of the source image, then the
+    least recently used sizes until at most `keep` are left. A copy's mtime
+    is refreshed whenever it is loaded, so mtime order is use order.
+    """
+    current = []
+    for name in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, name)
+        if name.endswith(stamp):
+            current.append((os.stat(path).st_mtime_ns, path))
+        else:
+            os.remove(path)
+    current.sort(reverse=True)
+    for _, path in current[keep:]:
+        os.remove(path)
+
+
+def loadBackground(width=500, height=500):
+    """
+    Load backgrounddark.png scaled to the given size.
+    A scaled copy is kept on disk (for the BG_CACHE_MAX_FILES most recently
+    used sizes), so later launches just read that PNG with Tk and never
+    decode/resize the original (Pillow is only imported on a cache miss).
+    If anything fails, bg_img stays None and we use a solid color.
+    """
+    global bg_img, bg_size
 
     try:
-        img = Image.open(img_path)                    # open the image file
-        img = img.resize((500, 500), Image.LANCZOS)   # resize to window size
-        bg_img = ImageTk.PhotoImage(img)              # convert to Tk image
-        print("Loaded background:", img_path)
+        src, cached = cachedBackgroundPath(width, height)
+        if not os.path.exists(cached):
+            # Pillow for reliable resizing, only needed when building the cache
+            from PIL import Image
+
+            cache_dir = os.path.dirname(cached)
+            os.makedirs(cache_dir, exist_ok=True)
+            # make room for the new copy
+            trimBackgroundCache(cache_dir, cached.rsplit("_", 1)[1], BG_CACHE_MAX_FILES - 1)
+
+            img = Image.open(src)                              # open the image file
+            img = img.resize((width, height), Image.LANCZOS)   # resize to window size
+            img.save(cached)
+            print("Cached background:", cached)
+        else:
+            try:
+                os.utime(cached)              # mark as recently used for the trim
+            except OSError:
+                pass
+
+        bg_img = tk.PhotoImage(file=cached)   # Tk reads PNG natively
+        bg_size = (width, height)
         return True
     except Exception as e:
         print("Error loading background image:", e)
@@ -40,182 +121,253 @@ def loadBackground():
         return False
 
 
+def showBackground():
+    """Point the single background item at bg_img and keep it at the bottom."""
+    global bg_item
+    if not bg_img:
+        canvas.configure(bg="black")
+        return
+    if bg_item is None:
+        bg_item = canvas.create_image(0, 0, image=bg_img, anchor="nw")
+    else:
+        canvas.itemconfigure(bg_item, image=bg_img)
+    canvas.tag_lower(bg_item)
+
+
+def onResize(event):
+    """Rescale the background once the user stops resizing (debounced)."""
+    global resize_job
+    if resize_job is not None:
+        root.after_cancel(resize_job)
+    resize_job = root.after(200, lambda: rescaleBackground(event.width, event.height))
+
+
+def rescaleBackground(width, height):
+    global resize_job
+    resize_job = None
+    if (width, height) == bg_size or width < 2 or height < 2:
+        return
+    if loadBackground(width, height):
+        showBackground()
+
+
 # ----------------------------
-# MAIN MENU (startup screen)
+# SCREENS (built once, then shown/hidden)
 # ----------------------------
-def displayMenu():
-    """Show the startup screen with title and difficulty options."""
-    clear()
-
-    # Title with brain emoji
-    canvas.create_text(
-        250, 60,
-        text="🧠 Math Quiz",
-        fill="white",
-        font=("Arial", 30, "bold")
-    )
+SCREENS = ("menu", "problem", "results")
+ids = {}                 # canvas item ids of texts that change between visits
+answerEntry = None
 
-    # Subheading
-    canvas.create_text(
-        250, 105,
-        text="Choose your difficulty",
-        fill="#DDDDDD",
-        font=("Arial", 16, "italic")
-    )
 
-    # "Select Difficulty" label (subtle grey)
-    canvas.create_text(
-        250, 145,
-        text="Select Difficulty",
-        fill="#BBBBBB",
-        font=("Arial", 20, "bold")
-    )
+def makeButton(text, command, **style):
+    """Dark button matching the black & white theme."""
+    opts = dict(bg="#111111", fg="white", activebackground="#222222",
+                activeforeground=style.get("fg", "white"))
+    opts.update(style)
+    return tk.Button(root, text=text, command=command, **opts)
 
-    # Buttons styled to match black & white theme, with slight accent colors
-    btn_easy = tk.Button(
-        root,
-        text="Easy (1-digit)",
-        width=18,
-        fg="#A8FF60",          # soft green text
-        bg="#111111",
-        activebackground="#222222",
-        activeforeground="#A8FF60",
-        relief="raised",
-        command=lambda: startQuiz("easy")
-    )
 
-    btn_medium = tk.Button(
-        root,
-        text="Medium (2-digit)",
-        width=18,
-        fg="#FFD700",          # gold/yellow text
-        bg="#111111",
-        activebackground="#222222",
-        activeforeground="#FFD700",
-        relief="raised",
-        command=lambda: startQuiz("medium")
-    )
+def buildScreens():
+    """
+    Create every widget and canvas item for all three screens once.
+    Each item is tagged with its screen name so showScreen() can hide or
+    show a whole screen without creating anything new.
+    """
+    global answerEntry
+
+    # --- menu ---
+    canvas.create_text(250, 60, text="🧠 Math Quiz", fill="white",
+                       font=("Arial", 30, "bold"), tags="menu")
+    canvas.create_text(250, 105, text="Choose your difficulty", fill="#DDDDDD",
+                       font=("Arial", 16, "italic"), tags="menu")
+    canvas.create_text(250, 145, text="Select Difficulty", fill="#BBBBBB",
+                       font=("Arial", 20, "bold"), tags="menu")
+
+    # slight accent colors on the difficulty buttons
+    btn_easy = makeButton("Easy (1-digit)", lambda: startQuiz("easy"),
+                          width=18, fg="#A8FF60", relief="raised")
+    btn_medium = makeButton("Medium (2-digit)", lambda: startQuiz("medium"),
+                            width=18, fg="#FFD700", relief="raised")
+    btn_hard = makeButton("Hard (4-digit)", lambda: startQuiz("hard"),
+                          width=18, fg="#FF6B6B", relief="raised")
+    canvas.create_window(250, 190, window=btn_easy, tags="menu")
+    canvas.create_window(250, 235, window=btn_medium, tags="menu")
+    canvas.create_window(250, 280, window=btn_hard, tags="menu")
+
+    btn_adaptive = makeButton("Adaptive", lambda: startQuiz("adaptive"),
+                              width=18, fg="#7FDBFF", relief="raised")
+    canvas.create_window(250, 325, window=btn_adaptive, tags="menu")
+
+    canvas.create_text(250, 375, text="Player name", fill="#BBBBBB",
+                       font=("Arial", 12), tags="menu")
+    playerEntry = tk.Entry(root, font=("Arial", 12), width=16, justify="center")
+    playerEntry.insert(0, player)
+    ids["player_entry"] = playerEntry
+    canvas.create_window(250, 400, window=playerEntry, tags="menu")
+
+    # --- problem ---
+    canvas.create_rectangle(50, 20, 450, 35, outline="white", width=2,
+                            tags=("problem", "progress"))
+    ids["progress_fill"] = canvas.create_rectangle(50, 20, 50, 35, fill="white", width=0,
+                                                   tags=("problem", "progress"))
+    ids["question_count"] = canvas.create_text(250, 60, text="", fill="white",
+                                               font=("Arial", 22, "bold"), tags="problem")
+    ids["problem"] = canvas.create_text(250, 140, text="", fill="white",
+                                        font=("Arial", 28, "bold"), tags="problem")
+    ids["attempts"] = canvas.create_text(250, 200, text="", fill="#CCCCCC",
+                                         font=("Arial", 16), tags="problem")
 
-    btn_hard = tk.Button(
-        root,
-        text="Hard (4-digit)",
-        width=18,
-        fg="#FF6B6B",          # soft red text
-        bg="#111111",
-        activebackground="#222222",
-        activeforeground="#FF6B6B",
-        relief="raised",
-        command=lambda: startQuiz("hard")
-    )
+    answerEntry = tk.Entry(root, font=("Arial", 20), width=6, justify="center")
+    submitBtn = makeButton("Submit", isCorrect, font=("Arial", 14))
+    btn_menu = makeButton("Main Menu", displayMenu, font=("Arial", 10), fg="#CCCCCC",
+                          activeforeground="white")
+    canvas.create_window(250, 250, window=answerEntry, tags="problem")
+    canvas.create_window(250, 300, window=submitBtn, tags="problem")
+    canvas.create_window(250, 350, window=btn_menu, tags="problem")
+
+    # --- results ---
+    canvas.create_text(250, 120, text="Quiz Complete!", fill="white",
+                       font=("Arial", 30, "bold"), tags="results")
+    ids["score"] = canvas.create_text(250, 180, text="", fill="white",
+                                      font=("Arial", 24), tags="results")
+    ids["grade"] = canvas.create_text(250, 220, text="", fill="#CCCCCC",
+                                      font=("Arial", 22), tags="results")
+    ids["rank"] = canvas.create_text(250, 255, text="", fill="#FFD700",
+                                     font=("Arial", 12), tags="results")
+    ids["summary"] = canvas.create_text(250, 320, text="", fill="white",
+                                        font=("Arial", 12), justify="center", tags="results")
+
+    btn_again = makeButton("Play Again", lambda: startQuiz(session.level), width=15)
+    btn_menu2 = makeButton("Main Menu", displayMenu, width=15, fg="#CCCCCC",
+                           activeforeground="white")
+    btn_exit = makeButton("Exit", root.destroy, width=15, fg="#FF6B6B")
+    canvas.create_window(250, 380, window=btn_again, tags="results")
+    canvas.create_window(250, 420, window=btn_menu2, tags="results")
+    canvas.create_window(250, 460, window=btn_exit, tags="results")
+
+    # --- feedback overlays (shared by all screens, hidden until used;
+    #     flashEffect sizes the flash to the canvas each time) ---
+    ids["flash"] = canvas.create_rectangle(0, 0, 500, 500, fill="white", stipple="gray25",
+                                           width=0, state="hidden")
+    ids["symbol"] = canvas.create_text(250, 100, text="", font=("Arial", 40, "bold"),
+                                       state="hidden")
+    ids["toast_bg"] = canvas.create_rectangle(50, 385, 450, 435, fill="#111111",
+                                              outline="white", state="hidden")
+    ids["toast"] = canvas.create_text(250, 410, text="", font=("Arial", 12, "bold"),
+                                      justify="center", width=380, state="hidden")
+
+    for name in SCREENS:
+        canvas.itemconfigure(name, state="hidden")
+
+
+@timed
+def showScreen(name):
+    """Hide every other screen and reveal this one."""
+    for other in SCREENS:
+        if other != name:
+            canvas.itemconfigure(other, state="hidden")
+    canvas.itemconfigure(name, state="normal")
 
-    canvas.create_window(250, 190, window=btn_easy)
-    canvas.create_window(250, 235, window=btn_medium)
-    canvas.create_window(250, 280, window=btn_hard)
+
+# ----------------------------
+# MAIN MENU (startup screen)
+# ----------------------------
+@timed
+def displayMenu():
+    """Show the startup screen with title and difficulty options."""
+    showScreen("menu")
 
 
 # ----------------------------
 # QUIZ MECHANICS
 # ----------------------------
-def randomInt(level):
-    if level == "easy":
-        return random.randint(1, 9)
-    elif level == "medium":
-        return random.randint(10, 99)
-    else:
-        return random.randint(1000, 9999)
+def randomInt(level, rng=random):
+    """
+    One random value for a difficulty level, in its LEVEL_RANGES range.
+    Whole plays are generated in one batch by questionbank; this is the
+    single-value form.
+    """
+    lo, hi = LEVEL_RANGES.get(level, LEVEL_RANGES["hard"])
+    return rng.randint(lo, hi)
 
 
-def decideOperation():
-    return random.choice(["+", "-"])
+def decideOperation(rng=random):
+    """Randomly pick addition or subtraction; returns "+" or "-"."""
+    return rng.choice("+-")
 
 
 def updateProgressBar():
-    """Draw/update the top progress bar for 10 questions (white to match B/W theme)."""
-    canvas.delete("progress")
+    """Stretch the white progress bar to match finished questions (out of 10)."""
     x0, y0, x1, y1 = 50, 20, 450, 35
 
-    # Outline
-    canvas.create_rectangle(x0, y0, x1, y1,
-                            outline="white", width=2, tags="progress")
-
-    completed = max(0, questionCount - 1)
-    ratio = completed / 10
+    completed = max(0, session.questionCount - 1)
+    ratio = completed / QUESTIONS_PER_PLAY
     fill_x1 = x0 + (x1 - x0) * ratio
 
-    if completed > 0:
-        # White bar for B/W look
-        canvas.create_rectangle(x0, y0, fill_x1, y1,
-                                fill="white", width=0, tags="progress")
+    canvas.coords(ids["progress_fill"], x0, y0, fill_x1, y1)
 
 
+@timed
 def displayProblem():
-    """Show one math question."""
-    global num1, num2, op, attemptsLeft, answerEntry, submitBtn
-    global problemTextID, btn_menu, questionMarkedWrong
-
-    clear()
+    """Show the session's current question."""
     updateProgressBar()
+    canvas.itemconfigure(ids["question_count"],
+                         text=f"Question {session.questionCount}/{QUESTIONS_PER_PLAY}")
+    canvas.itemconfigure(ids["problem"], text=f"{session.text} = ?")
+    updateAttempts()
 
-    attemptsLeft = 3
-    questionMarkedWrong = False
-
-    num1 = randomInt(difficulty)
-    num2 = randomInt(difficulty)
-    op = decideOperation()
+    answerEntry.delete(0, "end")
+    showScreen("problem")
+    answerEntry.focus_set()
 
-    # Question counter
-    canvas.create_text(
-        250, 60,
-        text=f"Question {questionCount}/10",
-        fill="white",
-        font=("Arial", 22, "bold")
-    )
 
-    # Problem text
-    problemTextID = canvas.create_text(
-        250, 140,
-        text=f"{num1} {op} {num2} = ?",
-        fill="white",
-        font=("Arial", 28, "bold")
-    )
-
-    # Attempts
-    canvas.create_text(
-        250, 200,
-        text=f"Attempts Left: {attemptsLeft}",
-        fill="#CCCCCC",
-        font=("Arial", 16),
-        tags="attempts"
-    )
-
-    # Answer entry and submit button
-    answerEntry = tk.Entry(root, font=("Arial", 20), width=6, justify="center")
-    submitBtn = tk.Button(
-        root,
-        text="Submit",
-        font=("Arial", 14),
-        bg="#111111",
-        fg="white",
-        activebackground="#222222",
-        activeforeground="white",
-        command=isCorrect
-    )
+# ----------------------------
+# FEEDBACK (non-blocking, drawn on the canvas)
+# ----------------------------
+class Animator:
+    """
+    Small scheduler for on-canvas effects so feedback never blocks input.
+    Each effect owns a named slot: scheduling into a busy slot cancels the
+    old timer, so rapid answers don't stack up stale callbacks. Toasts are
+    queued (keeping only the latest few) and shown one after another.
+    """
 
-    canvas.create_window(250, 250, window=answerEntry)
-    canvas.create_window(250, 300, window=submitBtn)
-
-    # Main menu button
-    btn_menu = tk.Button(
-        root,
-        text="Main Menu",
-        font=("Arial", 10),
-        bg="#111111",
-        fg="#CCCCCC",
-        activebackground="#222222",
-        activeforeground="white",
-        command=displayMenu
-    )
-    canvas.create_window(250, 350, window=btn_menu)
+    def __init__(self, widget, maxToasts=3):
+        self.widget = widget
+        self.jobs = {}
+        self.toasts = deque(maxlen=maxToasts)
+        self.toastShowing = False
+
+    def later(self, slot, ms, fn):
+        job = self.jobs.pop(slot, None)
+        if job is not None:
+            self.widget.after_cancel(job)
+
+        def run():
+            self.jobs.pop(slot, None)
+            fn()
+
+        self.jobs[slot] = self.widget.after(ms, run)
+
+    def toast(self, text, color, ms):
+        self.toasts.append((text, color, ms))
+        if not self.toastShowing:
+            self.nextToast()
+
+    def nextToast(self):
+        if not self.toasts:
+            self.toastShowing = False
+            canvas.itemconfigure(ids["toast_bg"], state="hidden")
+            canvas.itemconfigure(ids["toast"], state="hidden")
+            return
+        text, color, ms = self.toasts.popleft()
+        self.toastShowing = True
+        canvas.itemconfigure(ids["toast"], text=text, fill=color, state="normal")
+        canvas.itemconfigure(ids["toast_bg"], outline=color, state="normal")
+        canvas.tag_raise(ids["toast_bg"])
+        canvas.tag_raise(ids["toast"])
+        # a waiting toast cuts the current one short
+        self.later("toast", ms if not self.toasts else min(ms, 400), self.nextToast)
 
 
 def flashEffect(color):
@@ -223,231 +375,193 @@ def flashEffect(color):
     Show a quick colored flash over the whole window.
     (We pass 'white' for correct, 'black' for wrong to fit B/W theme.)
     """
-    flash = canvas.create_rectangle(
-        0, 0, 500, 500,
-        fill=color,
-        stipple="gray25"
-    )
-    root.after(150, lambda: canvas.delete(flash))
+    if SPEED_MODE:
+        return
+    # cover the canvas at its current size; the window can be resized
+    canvas.coords(ids["flash"], 0, 0, canvas.winfo_width(), canvas.winfo_height())
+    canvas.itemconfigure(ids["flash"], fill=color, state="normal")
+    canvas.tag_raise(ids["flash"])
+    animator.later("flash", 150, lambda: canvas.itemconfigure(ids["flash"], state="hidden"))
 
 
 def showResultSymbol(is_correct):
     """Show a ✓ or ✗ briefly near the top."""
+    if SPEED_MODE:
+        return
     symbol = "✓" if is_correct else "✗"
     # keep some color for readability on B/W background
     color = "lightgreen" if is_correct else "red"
 
-    symbol_id = canvas.create_text(
-        250, 100,
-        text=symbol,
-        fill=color,
-        font=("Arial", 40, "bold")
-    )
-    root.after(400, lambda: canvas.delete(symbol_id))
+    canvas.itemconfigure(ids["symbol"], text=symbol, fill=color, state="normal")
+    canvas.tag_raise(ids["symbol"])
+    animator.later("symbol", 400, lambda: canvas.itemconfigure(ids["symbol"], state="hidden"))
 
 
-def updateAttempts():
-    canvas.delete("attempts")
-    canvas.create_text(
-        250, 200,
-        text=f"Attempts Left: {attemptsLeft}",
-        fill="#CCCCCC",
-        font=("Arial", 16),
-        tags="attempts"
-    )
+def showFeedback(text, color, ms=1200):
+    """Non-modal replacement for the old messagebox popups."""
+    if SPEED_MODE:
+        return
+    animator.toast(text, color, ms)
 
 
-def restartQuiz():
-    """Restart full quiz with same difficulty."""
-    global score, questionCount, wrong_questions
-    score = 0
-    questionCount = 1
-    wrong_questions = []
-    displayProblem()
+def updateAttempts():
+    canvas.itemconfigure(ids["attempts"], text=f"Attempts Left: {session.attemptsLeft}")
 
 
+@timed
 def isCorrect():
-    """Check answer, update score/attempts, log mistakes."""
-    global score, attemptsLeft, questionCount, wrong_questions, questionMarkedWrong
+    """Hand the typed answer to the session and show what happened."""
+    outcome = session.submit(answerEntry.get())
 
-    try:
-        userAns = int(answerEntry.get())
-    except ValueError:
-        messagebox.showerror("Error", "Enter a number!")
-        return
-
-    correct = num1 + num2 if op == "+" else num1 - num2
-
-    if userAns == correct:
-        score += 10
+    if outcome == INVALID:
+        showFeedback("Enter a number!", "#FF6B6B")
+    elif outcome == CORRECT:
         flashEffect("white")          # white flash for correct
         showResultSymbol(True)
-        messagebox.showinfo("Correct!", "Nice! +10 points")
-        nextQuestion()
-    else:
-        attemptsLeft -= 1
+        showFeedback("Nice! +10 points", "lightgreen", 800)
+        if session.finished:
+            leaderboard.record(session.player, session.level, session.score)
+            displayResults()
+        else:
+            displayProblem()
+    elif outcome == WRONG:
         flashEffect("black")          # black flash for wrong
         showResultSymbol(False)
-
-        if not questionMarkedWrong:
-            wrong_questions.append({
-                "qnum": questionCount,
-                "text": f"{num1} {op} {num2}",
-                "answer": correct
-            })
-            questionMarkedWrong = True
-
-        if attemptsLeft > 0:
-            messagebox.showwarning(
-                "Incorrect",
-                f"Wrong! Try again.\nAttempts left: {attemptsLeft}"
-            )
-            updateAttempts()
-        else:
-            messagebox.showerror(
-                "Incorrect",
-                f"No attempts left!\nCorrect answer was {correct}\nQuiz restarting."
-            )
-            restartQuiz()
-
-
-def nextQuestion():
-    global questionCount
-    questionCount += 1
-    if questionCount > 10:
-        displayResults()
-    else:
+        showFeedback(f"Wrong! Try again. Attempts left: {session.attemptsLeft}", "#FFD700")
+        answerEntry.delete(0, "end")
+        updateAttempts()
+    elif outcome == RESTARTED:
+        flashEffect("black")
+        showResultSymbol(False)
+        showFeedback(f"No attempts left! Correct answer was {session.lastAnswer}\nQuiz restarting.",
+                     "#FF6B6B", 2500)
         displayProblem()
 
 
+@timed
 def displayResults():
     """Show final score, grade and summary of wrong questions."""
-    clear()
-
-    if score >= 90:
-        grade = "A+"
-    elif score >= 80:
-        grade = "A"
-    elif score >= 70:
-        grade = "B"
-    elif score >= 60:
-        grade = "C"
-    else:
-        grade = "D"
-
-    canvas.create_text(
-        250, 120,
-        text="Quiz Complete!",
-        fill="white",
-        font=("Arial", 30, "bold")
-    )
-    canvas.create_text(
-        250, 180,
-        text=f"Final Score: {score}/100",
-        fill="white",
-        font=("Arial", 24)
-    )
-    canvas.create_text(
-        250, 220,
-        text=f"Grade: {grade}",
-        fill="#CCCCCC",
-        font=("Arial", 22)
+    canvas.itemconfigure(ids["score"], text=f"Final Score: {session.score}/100")
+    canvas.itemconfigure(ids["grade"], text=f"Grade: {session.grade()}")
+
+    rank, total = leaderboard.rank(session.level, session.score)
+    best_player, best_score = leaderboard.top(session.level)[0]
+    canvas.itemconfigure(
+        ids["rank"],
+        text=f"Rank #{rank} of {total} ({session.level})   Best: {best_player} {best_score}"
     )
 
-    if wrong_questions:
+    if session.wrongQuestions:
         summary_lines = ["Questions you struggled with:"]
-        for item in wrong_questions:
+        for item in session.wrongQuestions:
             summary_lines.append(
                 f"Q{item['qnum']}: {item['text']} = {item['answer']}"
             )
-        summary_text = "\n".join(summary_lines)
-
-        canvas.create_text(
-            250, 320,
-            text=summary_text,
-            fill="white",
-            font=("Arial", 12),
-            justify="center"
-        )
+        canvas.itemconfigure(ids["summary"], text="\n".join(summary_lines), fill="white")
     else:
-        canvas.create_text(
-            250, 320,
+        canvas.itemconfigure(
+            ids["summary"],
             text="Perfect! You answered everything correctly on the first try!",
-            fill="lightgreen",
-            font=("Arial", 12),
-            justify="center"
+            fill="lightgreen"
         )
 
-    btn_again = tk.Button(
-        root,
-        text="Play Again",
-        width=15,
-        bg="#111111",
-        fg="white",
-        activebackground="#222222",
-        activeforeground="white",
-        command=lambda: startQuiz(difficulty)
-    )
-    btn_menu = tk.Button(
-        root,
-        text="Main Menu",
-        width=15,
-        bg="#111111",
-        fg="#CCCCCC",
-        activebackground="#222222",
-        activeforeground="white",
-        command=displayMenu
-    )
-    btn_exit = tk.Button(
-        root,
-        text="Exit",
-        width=15,
-        bg="#111111",
-        fg="#FF6B6B",
-        activebackground="#222222",
-        activeforeground="#FF6B6B",
-        command=root.destroy
-    )
-
-    canvas.create_window(250, 380, window=btn_again)
-    canvas.create_window(250, 420, window=btn_menu)
-    canvas.create_window(250, 460, window=btn_exit)
+    showScreen("results")
 
 
+@timed
 def startQuiz(level):
-    """Initialize quiz state and show first problem."""
-    global difficulty, score, questionCount, wrong_questions
-
-    difficulty = level
-    score = 0
-    questionCount = 1
-    wrong_questions = []
-
+    """Begin a new session at this level and show the first problem."""
+    global session, player
+    player = ids["player_entry"].get().strip() or "Player"
+    session = QuizSession(level, rng=sessionRng, adaptive=adaptiveEngine,
+                          log=attemptLog, player=player)
     displayProblem()
 
 
-def clear():
-    """Clear canvas and redraw background image if available."""
-    canvas.delete("all")
-    if bg_img:
-        canvas.create_image(0, 0, image=bg_img, anchor="nw")
+# ----------------------------
+# SPEED MODE DRIVER
+# ----------------------------
+def runSpeedDriver(total, accuracy=0.8, rng=None):
+    """
+    Push `total` answers through the real isCorrect() as fast as the event
+    loop allows (one answer per idle callback), then print the throughput.
+    Roughly `accuracy` of the answers are right.
+    """
+    rng = rng or random.Random(0)
+    state = {"done": 0, "start": time.perf_counter()}
+
+    def step():
+        if state["done"] >= total:
+            took = time.perf_counter() - state["start"]
+            print(f"Speed mode: {total} answers in {took:.2f}s "
+                  f"({total / took:.0f} answers/s, {took / total * 1000:.3f} ms each)")
+            return
+        if session.finished:       # results screen: play again
+            startQuiz(session.level)
+        given = session.answer if rng.random() < accuracy else session.answer + 1
+        answerEntry.delete(0, "end")
+        answerEntry.insert(0, str(given))
+        isCorrect()
+        state["done"] += 1
+        root.after(0, step)
+
+    startQuiz("medium")
+    root.after(0, step)
 
 
 # ----------------------------
 # APP SETUP
 # ----------------------------
-root = tk.Tk()
-root.title("Maths Quiz")
-root.geometry("500x500")
+def closeStores():
+    """Flush and close the attempt log and leaderboard (at exit, or before a rebuild)."""
+    global attemptLog, leaderboard
+    if attemptLog is not None:
+        attemptLog.close()
+        attemptLog = None
+    if leaderboard is not None:
+        leaderboard.close()
+        leaderboard = None
 
-canvas = tk.Canvas(root, width=500, height=500)
-canvas.pack(fill="both", expand=True)
 
-loadBackground()
-if bg_img:
-    canvas.create_image(0, 0, image=bg_img, anchor="nw")
-else:
-    canvas.configure(bg="black")
+atexit.register(closeStores)
 
-displayMenu()
-root.mainloop()
+
+def buildApp(master):
+    """
+    Build the quiz inside master (a Tk root or Toplevel). The launcher calls
+    this again when a closed quiz window is reopened, so state tied to the
+    old window (its canvas items, pending resize, log writer and leaderboard)
+    is dropped or closed first.
+    """
+    global root, canvas, animator, attemptLog, leaderboard, bg_img, bg_item, bg_size, resize_job
+    closeStores()
+    bg_img = bg_item = bg_size = resize_job = None
+    root = master
+    root.title("Maths Quiz")
+    root.geometry("500x500")
+    install_instrumentation(root, "maths_quiz")
+
+    canvas = tk.Canvas(root, width=500, height=500)
+    canvas.pack(fill="both", expand=True)
+    animator = Animator(root)
+    attemptLog = AttemptLogger()
+    leaderboard = Leaderboard()
+
+    loadBackground()
+    showBackground()
+    canvas.bind("<Configure>", onResize)
+
+    buildScreens()
+    displayMenu()
+    if SPEED_MODE:
+        runSpeedDriver(SPEED_ANSWERS)
+
+
+def main():
+    root = tk.Tk()
+    buildApp(root)
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Adaptive difficulty for the Maths Quiz.
+
+The engine keeps rolling (exponentially weighted) averages of the
+player's accuracy and answer time, overall and per operation. Every
+answer nudges those averages and may move the digit count up or down;
+the next question is then drawn from the current digit range, with the
+weaker operation picked more often. Both steps are O(1).
+
+No Tk here, so it can be exercised with simulated players:
+
+    python adaptive.py
+"""
+import math
+import random
+
+
+DIGIT_RANGES = {
+    1: (1, 9),
+    2: (10, 99),
+    3: (100, 999),
+    4: (1000, 9999),
+}
+
+
+class AdaptiveEngine:
+    def __init__(self, rng=None, alpha=0.25, targetAccuracy=0.75, targetSeconds=8.0,
+                 startDigits=1, patience=3):
+        self.rng = rng or random.Random()
+        self.alpha = alpha                    # weight of the newest answer
+        self.targetAccuracy = targetAccuracy
+        self.targetSeconds = targetSeconds    # comfortable time per digit
+        self.patience = patience              # good/bad answers in a row before moving
+        self.digits = startDigits
+
+        self.accuracy = targetAccuracy
+        self.seconds = targetSeconds
+        self.opAccuracy = {"+": targetAccuracy, "-": targetAccuracy}
+        self.streak = 0                       # >0 doing well, <0 struggling
+
+    def nextQuestion(self):
+        """Return (num1, op, num2, answer) for the current difficulty."""
+        # practise the weaker operation more often
+        gap = self.opAccuracy["+"] - self.opAccuracy["-"]
+        pMinus = min(0.8, max(0.2, 0.5 + gap))
+        op = "-" if self.rng.random() < pMinus else "+"
+
+        lo, hi = DIGIT_RANGES[self.digits]
+        num1 = self.rng.randint(lo, hi)
+        num2 = self.rng.randint(lo, hi)
+        answer = num1 + num2 if op == "+" else num1 - num2
+        return num1, op, num2, answer
+
+    def record(self, op, correct, seconds):
+        """Feed back one answer: was it right, and how long did it take."""
+        a = self.alpha
+        self.accuracy += a * (correct - self.accuracy)
+        self.seconds += a * (seconds - self.seconds)
+        self.opAccuracy[op] += a * (correct - self.opAccuracy[op])
+
+        budget = self.targetSeconds * self.digits
+        if correct and self.accuracy >= self.targetAccuracy and self.seconds <= budget:
+            self.streak = max(self.streak, 0) + 1
+        elif (not correct and self.accuracy < self.targetAccuracy - 0.15) or self.seconds > 2 * budget:
+            self.streak = min(self.streak, 0) - 1
+
+        if self.streak >= self.patience and self.digits < max(DIGIT_RANGES):
+            self.digits += 1
+            self.streak = 0
+            self.seconds = self.targetSeconds * self.digits   # fresh timing baseline
+        elif self.streak <= -self.patience and self.digits > min(DIGIT_RANGES):
+            self.digits -= 1
+            self.streak = 0
+            self.seconds = self.targetSeconds * self.digits
+
+
+# ----------------------------
+# SIMULATED PLAYERS
+# ----------------------------
+class SimulatedPlayer:
+    """
+    A player who is reliable up to `skillDigits` and gets rapidly worse
+    beyond it. Time grows with digit count, subtraction is a bit slower.
+    """
+
+    def __init__(self, skillDigits, secondsPerDigit=3.0, rng=None):
+        self.skillDigits = skillDigits
+        self.secondsPerDigit = secondsPerDigit
+        self.rng = rng or random.Random()
+
+    def answer(self, num1, op, num2, answer):
+        digits = len(str(max(abs(num1), abs(num2))))
+        pRight = 0.95 * 0.4 ** max(0, digits - self.skillDigits)
+        seconds = self.secondsPerDigit * digits * (1.3 if op == "-" else 1.0)
+        seconds *= math.exp(self.rng.gauss(0, 0.3))
+        right = self.rng.random() < pRight
+        return (answer if right else answer + self.rng.choice((-1, 1))), seconds
+
+
+def simulate(player, engine, questions=200):
+    """Run a player against an engine; returns the digit count after each answer."""
+    trace = []
+    for _ in range(questions):
+        q = engine.nextQuestion()
+        given, seconds = player.answer(*q)
+        engine.record(q[1], given == q[3], seconds)
+        trace.append(engine.digits)
+    return trace
+
+
+if __name__ == "__main__":
+    for skill in (1, 2, 3, 4):
+        rng = random.Random(skill)
+        trace = simulate(SimulatedPlayer(skill, rng=rng), AdaptiveEngine(rng=rng))
+        settled = trace[len(trace) // 2:]
+        print(f"player skill {skill} digits -> settles around "
+              f"{sum(settled) / len(settled):.2f} digits (final {trace[-1]})")
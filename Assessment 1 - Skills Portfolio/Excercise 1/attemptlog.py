@@ -0,0 +1,153 @@
+"""
+Append-only log of every answer given in the Maths Quiz, plus analytics.
+
+Each submission becomes one CSV row in attempts.csv. Rows are handed to a
+background thread and written in batches, so the Tk event loop never
+waits on disk.
+
+    python attemptlog.py                   # stats for everyone
+    python attemptlog.py --player Sam      # stats for one player
+    python attemptlog.py --player Sam other_log.csv
+"""
+import csv
+import math
+import os
+import queue
+import sys
+import threading
+import time
+
+
+FIELDS = ("timestamp", "player", "difficulty", "question", "op",
+          "given", "correct", "attempt", "response_ms", "is_correct")
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "attempts.csv")
+
+
+# ----------------------------
+# WRITING
+# ----------------------------
+class AttemptLogger:
+    """Queue rows from the UI thread; a worker appends them in batches."""
+
+    def __init__(self, path=DEFAULT_PATH, batchSize=256, flushSeconds=1.0):
+        self.path = path
+        self.batchSize = batchSize
+        self.flushSeconds = flushSeconds
+        self.rows = queue.Queue()
+        self.worker = threading.Thread(target=self._run, name="attempt-log", daemon=True)
+        self.worker.start()
+
+    def log(self, player, difficulty, question, op, given, correct, attempt, responseSeconds):
+        """Record one answer. Cheap: just a queue put."""
+        self.rows.put((
+            round(time.time(), 3), player, difficulty, question, op,
+            given, correct, attempt, round(responseSeconds * 1000, 1), int(given == correct),
+        ))
+
+    def close(self):
+        """Flush everything still queued and stop the worker."""
+        self.rows.put(None)
+        self.worker.join()
+
+    def _run(self):
+        newFile = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+        with open(self.path, "a", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            if newFile:
+                writer.writerow(FIELDS)
+                f.flush()
+
+            done = False
+            while not done:
+                batch = []
+                try:
+                    row = self.rows.get(timeout=self.flushSeconds)
+                    while True:
+                        if row is None:
+                            done = True
+                            break
+                        batch.append(row)
+                        if len(batch) >= self.batchSize:
+                            break
+                        row = self.rows.get_nowait()
+                except queue.Empty:
+                    pass
+                if batch:
+                    writer.writerows(batch)
+                    f.flush()
+
+
+# ----------------------------
+# ANALYTICS (single streaming pass)
+# ----------------------------
+LATENCY_STEP = math.log(1.05)   # histogram buckets 5% wide
+
+
+class Summary:
+    """Accuracy counters plus a log-bucket latency histogram (constant memory)."""
+
+    def __init__(self):
+        self.answers = 0
+        self.right = 0
+        self.buckets = {}
+
+    def add(self, ms, isRight):
+        self.answers += 1
+        self.right += isRight
+        b = int(math.log(max(ms, 1.0)) / LATENCY_STEP)
+        self.buckets[b] = self.buckets.get(b, 0) + 1
+
+    def percentile(self, q):
+        target = q * self.answers
+        seen = 0
+        for b in sorted(self.buckets):
+            seen += self.buckets[b]
+            if seen >= target:
+                return math.exp((b + 1) * LATENCY_STEP)
+        return 0.0
+
+    def row(self, label):
+        acc = 100 * self.right / self.answers if self.answers else 0
+        return (f"{label:<12} {self.answers:>10,} {acc:6.1f}% "
+                f"{self.percentile(0.5):8.0f} {self.percentile(0.9):8.0f} {self.percentile(0.99):8.0f}")
+
+
+def analyse(path=DEFAULT_PATH, player=None):
+    """Stream the log once and return {group: Summary} by operation and difficulty."""
+    groups = {}
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return groups
+        col = {name: i for i, name in enumerate(header)}
+        for row in reader:
+            if player is not None and row[col["player"]] != player:
+                continue
+            ms = float(row[col["response_ms"]])
+            isRight = row[col["is_correct"]] == "1"
+            for key in ("op " + row[col["op"]], row[col["difficulty"]], "all"):
+                summary = groups.get(key)
+                if summary is None:
+                    summary = groups[key] = Summary()
+                summary.add(ms, isRight)
+    return groups
+
+
+def printReport(groups):
+    print(f"{'group':<12} {'answers':>10} {'acc':>7} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8}")
+    for key in sorted(groups, key=lambda k: (k == "all", k)):
+        print(groups[key].row(key))
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    who = None
+    if args[:1] == ["--player"]:
+        who = args[1]
+        args = args[2:]
+    start = time.perf_counter()
+    result = analyse(args[0] if args else DEFAULT_PATH, who)
+    printReport(result)
+    print(f"({time.perf_counter() - start:.2f}s)")
@@ -0,0 +1,164 @@
+"""
+Persistent Maths Quiz leaderboard, one board per difficulty.
+
+Finished plays are appended to leaderboard.csv in batches. In memory each
+board keeps only:
+  - a count of results per score (scores are 0..100), so "your rank" is a
+    sum over at most 101 counters no matter how many results exist
+  - a bounded min-heap of the best N results for the top-N list
+so neither query ever rescans the history.
+
+    python leaderboard.py                 # print the boards
+    python leaderboard.py --bench 1000000 # time updates and rank lookups
+"""
+import csv
+import heapq
+import os
+import random
+import sys
+import tempfile
+import time
+
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "leaderboard.csv")
+MAX_SCORE = 100
+
+
+def clampScore(score):
+    """Scores are percentages; anything outside 0..100 is pulled back in."""
+    return max(0, min(MAX_SCORE, int(score)))
+
+
+class Board:
+    """Top-N heap plus per-score counts for one difficulty."""
+
+    def __init__(self, topN):
+        self.topN = topN
+        self.counts = [0] * (MAX_SCORE + 1)
+        self.total = 0
+        self.best = []     # min-heap of (score, -seq, player); earlier wins ties
+        self.seq = 0
+
+    def add(self, player, score):
+        self.counts[score] += 1
+        self.total += 1
+        self.seq += 1
+        entry = (score, -self.seq, player)
+        if len(self.best) < self.topN:
+            heapq.heappush(self.best, entry)
+        elif entry > self.best[0]:
+            heapq.heapreplace(self.best, entry)
+
+    def rank(self, score):
+        """1-based rank of a score among every result on this board."""
+        return 1 + sum(self.counts[score + 1:])
+
+    def top(self):
+        return [(player, score) for score, _, player in sorted(self.best, reverse=True)]
+
+
+class Leaderboard:
+    def __init__(self, path=DEFAULT_PATH, topN=10, batchSize=32):
+        self.path = path
+        self.topN = topN
+        self.batchSize = batchSize
+        self.boards = {}
+        self.pending = []
+        self.load()
+
+    def board(self, level):
+        b = self.boards.get(level)
+        if b is None:
+            b = self.boards[level] = Board(self.topN)
+        return b
+
+    def load(self):
+        """
+        Rebuild the in-memory boards with one streaming pass over the history.
+        Bad rows are skipped; a file that can't be read at all counts as empty.
+        """
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, newline="", encoding="utf-8") as f:
+                for row in csv.reader(f):
+                    if len(row) != 4:
+                        continue
+                    _, player, level, score = row
+                    try:
+                        self.board(level).add(player, clampScore(score))
+                    except ValueError:
+                        continue
+        except (OSError, UnicodeDecodeError, csv.Error):
+            self.boards = {}
+
+    def record(self, player, level, score):
+        """Add a finished play; returns (rank, total) on its board."""
+        score = clampScore(score)
+        b = self.board(level)
+        b.add(player, score)
+        self.pending.append((round(time.time()), player, level, score))
+        if len(self.pending) >= self.batchSize:
+            self.flush()
+        return b.rank(score), b.total
+
+    def rank(self, level, score):
+        b = self.board(level)
+        return b.rank(score), b.total
+
+    def top(self, level):
+        return self.board(level).top()
+
+    def flush(self):
+        if not self.pending:
+            return
+        with open(self.path, "a", newline="", encoding="utf-8") as f:
+            csv.writer(f).writerows(self.pending)
+        self.pending.clear()
+
+    close = flush
+
+
+# ----------------------------
+# BENCHMARK
+# ----------------------------
+def bench(count):
+    path = os.path.join(tempfile.mkdtemp(), "leaderboard.csv")
+    lb = Leaderboard(path, batchSize=4096)
+    rng = random.Random(0)
+    scores = [rng.choice(range(0, 101, 10)) for _ in range(count)]
+
+    start = time.perf_counter()
+    for i, s in enumerate(scores):
+        lb.record(f"p{i}", "medium", s)
+    lb.flush()
+    took = time.perf_counter() - start
+    print(f"recorded {count:,} results in {took:.2f}s ({took / count * 1e6:.2f} us each, incl. batched writes)")
+
+    start = time.perf_counter()
+    reloaded = Leaderboard(path)
+    print(f"reloaded history in {time.perf_counter() - start:.2f}s")
+
+    lookups = 100_000
+    start = time.perf_counter()
+    for s in scores[:lookups]:
+        reloaded.rank("medium", s)
+    took = time.perf_counter() - start
+    print(f"rank lookup: {took / lookups * 1e6:.2f} us each")
+
+    start = time.perf_counter()
+    for _ in range(10_000):
+        reloaded.top("medium")
+    print(f"top-{reloaded.topN}: {(time.perf_counter() - start) / 10_000 * 1e6:.2f} us each")
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--bench":
+        bench(int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000)
+    else:
+        lb = Leaderboard()
+        for level, b in lb.boards.items():
+            print(f"{level} ({b.total} plays)")
+            for i, (player, score) in enumerate(b.top(), 1):
+                print(f"  {i:>2}. {player:<20} {score}")
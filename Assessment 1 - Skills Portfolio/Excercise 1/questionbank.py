@@ -0,0 +1,141 @@
+"""
+Batched, seedable question generation for the Maths Quiz.
+
+Instead of drawing two numbers and an operator per question, whole
+sessions (or banks of millions of questions) are generated in one call
+and stored column-wise in compact arrays. The same seed always produces
+the same questions, so sessions can be replayed and analysed.
+
+    python questionbank.py --bench            # time 10M questions per level
+    python questionbank.py --bench 1000000    # custom size
+"""
+import random
+import sys
+import time
+from array import array
+
+
+# min/max value per difficulty level
+LEVEL_RANGES = {
+    "easy": (1, 9),
+    "medium": (10, 99),
+    "hard": (1000, 9999),
+}
+
+QUESTIONS_PER_SESSION = 10
+CHUNK = 1 << 20  # generate in chunks so temporary lists stay small
+
+
+class QuestionBank:
+    """Questions stored as parallel arrays: num1, op, num2, answer."""
+
+    def __init__(self, level):
+        self.level = level
+        self.num1 = array("q")
+        self.ops = bytearray()      # b"+" or b"-" per question
+        self.num2 = array("q")
+        self.answers = array("q")
+
+    def __len__(self):
+        return len(self.answers)
+
+    def __getitem__(self, i):
+        """Return question i as (num1, op, num2, answer)."""
+        return self.num1[i], chr(self.ops[i]), self.num2[i], self.answers[i]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+
+def distinctQuestions(level, allowNegative=True):
+    """How many different questions a level can produce."""
+    lo, hi = LEVEL_RANGES[level]
+    n = hi - lo + 1
+    subtractions = n * n if allowNegative else n * (n + 1) // 2
+    return n * n + subtractions
+
+
+def generateBank(level, count, seed=None, rng=None, dedupe=False, allowNegative=True):
+    """
+    Generate `count` questions for a difficulty level in one batched call.
+
+    seed / rng     - reproducible output (pass a random.Random to share one)
+    dedupe         - never repeat the same (num1, op, num2) within the bank
+    allowNegative  - False swaps the operands of subtractions so that the
+                     answer is never negative
+    """
+    if level not in LEVEL_RANGES:
+        raise ValueError(f"Unknown level: {level}")
+    if dedupe and count > distinctQuestions(level, allowNegative):
+        raise ValueError(f"Only {distinctQuestions(level, allowNegative)} distinct {level} questions exist")
+
+    rng = rng or random.Random(seed)
+    lo, hi = LEVEL_RANGES[level]
+    values = range(lo, hi + 1)
+    span = hi - lo + 1
+
+    bank = QuestionBank(level)
+    seen = set()
+
+    while len(bank) < count:
+        k = min(CHUNK, count - len(bank))
+        a = rng.choices(values, k=k)
+        b = rng.choices(values, k=k)
+        ops = rng.choices(b"+-", k=k)   # 43 is "+", 45 is "-"
+
+        if not allowNegative:
+            for i in range(k):
+                if ops[i] == 45 and a[i] < b[i]:
+                    a[i], b[i] = b[i], a[i]
+
+        if dedupe:
+            keep = []
+            for i in range(k):
+                key = ((a[i] - lo) * span + (b[i] - lo)) * 2 + (ops[i] == 45)
+                if key not in seen:
+                    seen.add(key)
+                    keep.append(i)
+            a = [a[i] for i in keep]
+            b = [b[i] for i in keep]
+            ops = [ops[i] for i in keep]
+
+        bank.num1.extend(a)
+        bank.num2.extend(b)
+        bank.ops.extend(ops)
+        bank.answers.extend([x + y if o == 43 else x - y for x, y, o in zip(a, b, ops)])
+
+    return bank
+
+
+def generateSession(level, seed=None, rng=None, allowNegative=True):
+    """One quiz play: 10 distinct questions."""
+    return generateBank(level, QUESTIONS_PER_SESSION, seed=seed, rng=rng,
+                        dedupe=True, allowNegative=allowNegative)
+
+
+# ----------------------------
+# BENCHMARK
+# ----------------------------
+def bench(count):
+    for level in LEVEL_RANGES:
+        for allowNegative in (True, False):
+            start = time.perf_counter()
+            bank = generateBank(level, count, seed=1, allowNegative=allowNegative)
+            took = time.perf_counter() - start
+            print(f"{level:<7} allowNegative={allowNegative!s:<5} {len(bank):>10,} questions "
+                  f"in {took:6.2f}s ({len(bank) / took / 1e6:.2f}M/s)")
+
+    n = min(count, 1_000_000)
+    start = time.perf_counter()
+    generateBank("hard", n, seed=1, dedupe=True)
+    took = time.perf_counter() - start
+    print(f"hard    dedupe              {n:>10,} questions in {took:6.2f}s ({n / took / 1e6:.2f}M/s)")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--bench":
+        bench(int(sys.argv[2]) if len(sys.argv) > 2 else 10_000_000)
+    else:
+        for q in generateSession("medium"):
+            print("{} {} {} = {}".format(*q))
@@ -0,0 +1,186 @@
+"""
+The Maths Quiz rules without any Tk: questions, attempts, scoring,
+grading and the wrong-question log. Excercise1.py is a view over a
+QuizSession; scripts and tests can drive one directly.
+
+    python quizengine.py                         # 10,000 simulated plays
+    python quizengine.py --sessions 50000 --level hard --accuracy 0.6
+"""
+import argparse
+import random
+import time
+
+from questionbank import generateSession
+
+
+QUESTIONS_PER_PLAY = 10
+ATTEMPTS_PER_QUESTION = 3
+POINTS_PER_QUESTION = 10
+MAX_SIMULATED_ANSWERS = 1000   # simulatePlay gives up after this many answers
+
+# outcomes of QuizSession.submit()
+INVALID = "invalid"        # not a number, nothing changed
+CORRECT = "correct"        # moved on to the next question (or finished)
+WRONG = "wrong"            # same question, one attempt fewer
+RESTARTED = "restarted"    # out of attempts: the whole play starts again
+
+
+def gradeFor(score):
+    if score >= 90:
+        return "A+"
+    elif score >= 80:
+        return "A"
+    elif score >= 70:
+        return "B"
+    elif score >= 60:
+        return "C"
+    return "D"
+
+
+class QuizSession:
+    """
+    State machine for one player's quiz: "question" until the tenth
+    question is answered correctly, then "finished".
+    """
+
+    __slots__ = ("level", "rng", "adaptive", "log", "player", "clock",
+                 "state", "score", "questionCount", "attemptsLeft", "questions",
+                 "num1", "op", "num2", "answer", "markedWrong", "wrongQuestions",
+                 "shownAt", "lastAnswer")
+
+    def __init__(self, level, rng=None, adaptive=None, log=None, player="Player",
+                 clock=time.perf_counter):
+        self.level = level
+        self.rng = rng or random.Random()
+        self.adaptive = adaptive      # AdaptiveEngine, used when level == "adaptive"
+        self.log = log                # AttemptLogger (optional)
+        self.player = player
+        self.clock = clock
+        self.lastAnswer = None        # correct answer of the question just left
+        self.restart()
+
+    # ---- transitions ----
+    def restart(self):
+        """Start a fresh play at the same level."""
+        self.state = "question"
+        self.score = 0
+        self.questionCount = 1
+        self.wrongQuestions = []
+        if self.level == "adaptive":
+            self.questions = None     # picked one at a time from the engine
+        else:
+            self.questions = generateSession(self.level, rng=self.rng)
+        self.loadQuestion()
+
+    def loadQuestion(self):
+        if self.questions is None:
+            q = self.adaptive.nextQuestion()
+        else:
+            q = self.questions[self.questionCount - 1]
+        self.num1, self.op, self.num2, self.answer = q
+        self.attemptsLeft = ATTEMPTS_PER_QUESTION
+        self.markedWrong = False
+        self.shownAt = self.clock()
+
+    def submit(self, raw):
+        """Check an answer (string or int) and return one of the outcomes above."""
+        if self.state != "question":
+            raise RuntimeError("Quiz already finished")
+        try:
+            given = int(raw)
+        except (TypeError, ValueError):
+            return INVALID
+
+        now = self.clock()
+        seconds = now - self.shownAt
+        self.shownAt = now            # a retry is timed from this answer
+        right = given == self.answer
+
+        if self.log is not None:
+            self.log.log(self.player, self.level, self.text, self.op, given, self.answer,
+                         ATTEMPTS_PER_QUESTION + 1 - self.attemptsLeft, seconds)
+        if self.questions is None:
+            self.adaptive.record(self.op, right, seconds)
+
+        self.lastAnswer = self.answer
+        if right:
+            self.score += POINTS_PER_QUESTION
+            self.questionCount += 1
+            if self.questionCount > QUESTIONS_PER_PLAY:
+                self.state = "finished"
+            else:
+                self.loadQuestion()
+            return CORRECT
+
+        self.attemptsLeft -= 1
+        if not self.markedWrong:
+            self.wrongQuestions.append({
+                "qnum": self.questionCount,
+                "text": self.text,
+                "answer": self.answer
+            })
+            self.markedWrong = True
+
+        if self.attemptsLeft > 0:
+            return WRONG
+        self.restart()
+        return RESTARTED
+
+    # ---- read-only views ----
+    @property
+    def text(self):
+        return f"{self.num1} {self.op} {self.num2}"
+
+    @property
+    def finished(self):
+        return self.state == "finished"
+
+    def grade(self):
+        return gradeFor(self.score)
+
+
+# ----------------------------
+# SCRIPTED DRIVER
+# ----------------------------
+def simulatePlay(session, accuracy, rng, maxAnswers=MAX_SIMULATED_ANSWERS):
+    """
+    Answer until the play finishes or maxAnswers have been given (a weak
+    player keeps running out of attempts, and every restart starts the play
+    over, so it might never finish); returns how many answers it took.
+    """
+    answers = 0
+    while not session.finished and answers < maxAnswers:
+        given = session.answer if rng.random() < accuracy else session.answer + 1
+        session.submit(given)
+        answers += 1
+    return answers
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate Maths Quiz plays without a display.")
+    parser.add_argument("--sessions", type=int, default=10_000)
+    parser.add_argument("--level", default="medium", choices=["easy", "medium", "hard"])
+    parser.add_argument("--accuracy", type=float, default=0.8, help="chance each answer is right")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-answers", type=int, default=MAX_SIMULATED_ANSWERS,
+                        help="give a play up after this many answers")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    grades = {}
+    answers = 0
+    start = time.perf_counter()
+    for _ in range(args.sessions):
+        session = QuizSession(args.level, rng=rng)
+        answers += simulatePlay(session, args.accuracy, rng, args.max_answers)
+        grade = session.grade() if session.finished else "unfinished"
+        grades[grade] = grades.get(grade, 0) + 1
+    took = time.perf_counter() - start
+
+    print(f"{args.sessions:,} plays, {answers:,} answers in {took:.2f}s "
+          f"({args.sessions / took:,.0f} plays/s, {answers / took:,.0f} answers/s)")
+    print("grades:", ", ".join(f"{g}={grades[g]}" for g in sorted(grades)))
+
+
+if __name__ == "__main__":
+    main()
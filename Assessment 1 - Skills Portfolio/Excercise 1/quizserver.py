@@ -0,0 +1,200 @@
+"""
+Host many Maths Quiz players at once from a single asyncio process.
+
+Every TCP connection gets its own QuizSession (same 10 questions,
+3 attempts and A+..D grading as the Tk quiz). The protocol is plain
+text, one command per line, so `nc localhost 8765` is enough to play:
+
+    START easy|medium|hard     -> QUESTION <n> <num1> <op> <num2> <attemptsLeft> <score>
+    ANSWER <number>            -> CORRECT | WRONG <attemptsLeft> | RESTARTED <answer> | INVALID
+                                  followed by QUESTION ... or RESULT <score> <grade>
+    QUIT                       -> BYE
+
+    python quizserver.py [--port 8765]
+    python quizserver.py --loadtest 5000     # N concurrent simulated players
+"""
+import argparse
+import asyncio
+import random
+import time
+import tracemalloc
+
+from quizengine import QuizSession, INVALID, CORRECT, WRONG
+
+
+LEVELS = ("easy", "medium", "hard")
+
+
+def questionLine(session):
+    return (f"QUESTION {session.questionCount} {session.num1} {session.op} {session.num2} "
+            f"{session.attemptsLeft} {session.score}\n")
+
+
+def handleCommand(session, line, rng):
+    """Apply one protocol line; returns (session, reply text, keep connection open)."""
+    parts = line.split()
+    if not parts:
+        return session, "", True
+    cmd = parts[0].upper()
+
+    if cmd == "QUIT":
+        return session, "BYE\n", False
+    if cmd == "START":
+        level = parts[1].lower() if len(parts) > 1 else "easy"
+        if level not in LEVELS:
+            return session, f"ERROR unknown level {level}\n", True
+        session = QuizSession(level, rng=rng)
+        return session, questionLine(session), True
+    if cmd == "ANSWER":
+        if session is None or session.finished:
+            return session, "ERROR send START first\n", True
+        outcome = session.submit(parts[1] if len(parts) > 1 else "")
+        if outcome == INVALID:
+            return session, "INVALID\n", True
+        if outcome == CORRECT:
+            reply = "CORRECT\n"
+        elif outcome == WRONG:
+            reply = f"WRONG {session.attemptsLeft}\n"
+        else:
+            reply = f"RESTARTED {session.lastAnswer}\n"
+        if session.finished:
+            reply += f"RESULT {session.score} {session.grade()}\n"
+        elif outcome != WRONG:
+            reply += questionLine(session)
+        return session, reply, True
+    return session, f"ERROR unknown command {cmd}\n", True
+
+
+class QuizServer:
+    def __init__(self, seed=None):
+        self.rng = random.Random(seed)
+        self.active = 0
+        self.finished = 0
+
+    async def handle(self, reader, writer):
+        self.active += 1
+        session = None
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError):
+                    # a line longer than the stream limit: no command is that long
+                    writer.write(b"ERROR line too long\n")
+                    await writer.drain()
+                    break
+                if not line:
+                    break
+                session, reply, keepOpen = handleCommand(session, line.decode("ascii", "replace"), self.rng)
+                if reply:
+                    writer.write(reply.encode("ascii"))
+                    await writer.drain()
+                if session is not None and session.finished:
+                    self.finished += 1
+                    session = None
+                if not keepOpen:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            self.active -= 1
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def serve(self, host, port):
+        return await asyncio.start_server(self.handle, host, port, backlog=4096)
+
+
+# ----------------------------
+# LOAD TEST
+# ----------------------------
+async def simulatedPlayer(port, level, accuracy, rng, started, go):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    started.set_result(None)
+    await go.wait()   # everyone connects first, so all sessions are live together
+
+    writer.write(f"START {level}\n".encode())
+    answers = 0
+    line = (await reader.readline()).decode()
+    while True:
+        if line.startswith("RESULT"):
+            break
+        if line.startswith("QUESTION"):
+            _, _, a, op, b, _, _ = line.split()
+            right = int(a) + int(b) if op == "+" else int(a) - int(b)
+        given = right if rng.random() < accuracy else right + 1
+        writer.write(f"ANSWER {given}\n".encode())
+        answers += 1
+        line = (await reader.readline()).decode()
+        if line.startswith(("CORRECT", "RESTARTED")):
+            line = (await reader.readline()).decode()
+    writer.write(b"QUIT\n")
+    await reader.readline()
+    writer.close()
+    return answers
+
+
+async def loadTest(players, level, accuracy):
+    quiz = QuizServer(seed=0)
+    server = await quiz.serve("127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    rng = random.Random(1)
+
+    go = asyncio.Event()
+    connected = [asyncio.get_running_loop().create_future() for _ in range(players)]
+    tasks = [asyncio.create_task(simulatedPlayer(port, level, accuracy, rng, connected[i], go))
+             for i in range(players)]
+    await asyncio.gather(*connected)
+    await asyncio.sleep(0.05)   # let the server accept every connection
+    peak = quiz.active
+
+    start = time.perf_counter()
+    go.set()
+    answers = sum(await asyncio.gather(*tasks))
+    took = time.perf_counter() - start
+
+    server.close()
+    await server.wait_closed()
+    print(f"{players:,} concurrent players ({peak:,} live connections), {answers:,} answers "
+          f"in {took:.2f}s -> {answers / took:,.0f} answers/s, {quiz.finished:,} plays finished")
+
+
+def sessionFootprint(count=10_000):
+    """Average bytes allocated per QuizSession (the per-player state)."""
+    rng = random.Random(0)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    sessions = [QuizSession("hard", rng=rng) for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"~{(after - before) / len(sessions):,.0f} bytes per session")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi-player Maths Quiz server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--loadtest", type=int, metavar="PLAYERS")
+    parser.add_argument("--level", default="medium", choices=LEVELS)
+    parser.add_argument("--accuracy", type=float, default=0.8)
+    args = parser.parse_args()
+
+    if args.loadtest:
+        sessionFootprint()
+        asyncio.run(loadTest(args.loadtest, args.level, args.accuracy))
+        return
+
+    async def run():
+        server = await QuizServer().serve(args.host, args.port)
+        print(f"Maths Quiz server on {args.host}:{args.port}")
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,47 +1,97 @@
 import tkinter as tk
 from tkinter import messagebox
-import random
+import atexit
 import os
+import queue
+import sys
+import threading
+import time
 
+# shared helpers (instrument.py) live in the portfolio folder one level up;
+# launcher.py has already put it on sys.path, a direct run adds it here
+PORTFOLIO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PORTFOLIO not in sys.path:
+    sys.path.append(PORTFOLIO)
+import instrument  # noqa: E402
+from jokecorpus import JokeCorpus, parse_joke, index_is_fresh  # noqa: E402
+from jokeratings import JokeRatings, WeightedPicker  # noqa: E402
+from jokeschedule import JokeScheduler  # noqa: E402
+from jokesearch import JokeSearchIndex  # noqa: E402
 
-def load_jokes():
-    """Load jokes from randomJokes.txt in the same folder as this script."""
-    try:
-        base_path = os.path.dirname(os.path.abspath(__file__))
-        file_path = os.path.join(base_path, "randomJokes.txt")
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            jokes = [line.strip() for line in f.readlines() if line.strip()]
+APP_START = time.perf_counter()   # cold-start timings, printed with PORTFOLIO_PROFILE=1
+
+
+def default_joke_file():
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), "randomJokes.txt")
 
-        return jokes
-    except FileNotFoundError:
-        messagebox.showerror("Error", "randomJokes.txt not found in the same folder as this script.")
-        return []
 
+def first_joke(file_path):
+    """The first joke in the file, parsed straight from its first line."""
+    with open(file_path, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            if line.strip():
+                return parse_joke(line)
+    return None
 
-def parse_joke(line):
-    """Split a joke into (setup, punchline)."""
-    if "?" in line:
-        setup, punchline = line.split("?", 1)
-        return setup.strip() + "?", punchline.strip()
-    return line.strip(), "(No punchline found)"
 
+def load_in_background(file_path, inbox):
+    """
+    Worker thread: open the corpus, scheduler, rating-weighted picker and
+    search index and post each one to `inbox` as soon as it exists. If the
+    offset index has to be (re)built, the first joke is parsed and posted
+    before that starts, so the window has something to say straight away.
+    Any failure is posted as an "error" message rather than lost with the thread.
+    """
+    try:
+        if not index_is_fresh(file_path):
+            joke = first_joke(file_path)
+            if joke:
+                inbox.put(("first", joke))
+        corpus = JokeCorpus(file_path)
+        # walks every joke once before repeating; position kept in a .cursor file
+        schedule = JokeScheduler(len(corpus), corpus.path + ".cursor") if len(corpus) else None
+        inbox.put(("ready", corpus, schedule))
+        if len(corpus):
+            # built here, off the Tk thread; later rebuilds run on their own worker
+            picker = WeightedPicker(JokeRatings.open(corpus))
+            atexit.register(picker.close)
+            inbox.put(("picker", picker))
+            inbox.put(("search", JokeSearchIndex.open(corpus)))
+    except FileNotFoundError:
+        inbox.put(("error", f"{os.path.basename(file_path)} not found."))
+    except Exception as e:
+        inbox.put(("error", f"Could not load {os.path.basename(file_path)}: {e}"))
+    finally:
+        inbox.put(("done",))
 
-def build_app(root):
+
+def build_app(root, joke_file=None):
     root.title("Alexa Joke Assistant")
-    root.geometry("550x400")
+    root.geometry("550x490")
     root.config(bg="#FFF8DC")
 
-    jokes = load_jokes()
-
-    # app state kept in a dict instead of instance variables
+    # app state kept in a dict instead of instance variables;
+    # jokes/schedule/search arrive from the loader thread
     state = {
         "current_setup": "",
-        "current_punchline": ""
+        "current_punchline": "",
+        "current_id": None,
+        "query": "",
+        "results": [],
+        "result_pos": 0,
+        "jokes": None,
+        "schedule": None,
+        "search": None,
+        "picker": None,
+        "shown_first": False
     }
 
-    setup_var = tk.StringVar(value="")
+    setup_var = tk.StringVar(value="Loading jokes...")
     punchline_var = tk.StringVar(value="")
+    search_var = tk.StringVar(value="")
+    search_info_var = tk.StringVar(value="")
+    weighted_var = tk.BooleanVar(value=False)   # favour well-rated jokes over the shuffled order
 
     title_label = tk.Label(
         root, text=" Alexa Joke Assistant ",
@@ -50,6 +100,9 @@ def build_app(root):
     )
     title_label.pack(pady=(20, 10))
 
+    search_frame = tk.Frame(root, bg="#FFF8DC")
+    search_frame.pack()
+
     setup_label = tk.Label(
         root, textvariable=setup_var,
         font=("Arial", 18, "bold"),
@@ -78,44 +131,140 @@ def build_app(root):
         "pady": 5
     }
 
-    def show_joke():
-        if not jokes:
-            return
-        line = random.choice(jokes)
-        setup, punchline = parse_joke(line)
-
+    def display(setup, punchline, joke_id=None):
+        state["current_id"] = joke_id
         state["current_setup"] = setup
         state["current_punchline"] = punchline
 
         setup_var.set(setup)
         punchline_var.set("")  # clear punchline until asked
 
+    def show_joke():
+        if not state["schedule"]:
+            return
+        if weighted_var.get() and state["picker"]:
+            i = state["picker"].next()
+        else:
+            i = state["schedule"].next()
+        display(*state["jokes"].get(i), joke_id=i)
+        search_info_var.set("")
+
+    def rate_joke(thumbs_up):
+        if state["current_id"] is None or not state["picker"]:
+            return
+        state["picker"].rate(state["current_id"], thumbs_up)
+        search_info_var.set("Thanks! Rated up." if thumbs_up else "Thanks! Rated down.")
+
+    def first_shown():
+        if not state["shown_first"]:
+            state["shown_first"] = True
+            if instrument.ENABLED:
+                print(f"First joke after {(time.perf_counter() - APP_START) * 1000:.1f} ms")
+
+    def search_jokes(event=None):
+        """Show the best match; searching the same words again steps through the rest."""
+        if not state["search"]:
+            search_info_var.set("Search index still loading...")
+            return
+        query = search_var.get().strip()
+        if not query:
+            return
+        if query != state["query"]:
+            state["query"] = query
+            state["results"] = state["search"].search(query)
+            state["result_pos"] = 0
+        results = state["results"]
+        if not results:
+            display(f"No jokes found about \"{query}\".", "")
+            search_info_var.set("")
+            return
+        pos = state["result_pos"]
+        state["result_pos"] = (pos + 1) % len(results)
+        display(*state["jokes"].get(results[pos]), joke_id=results[pos])
+        search_info_var.set(f"Match {pos + 1} of {len(results)}")
+
     def show_punchline():
         if state["current_punchline"]:
             punchline_var.set(state["current_punchline"])
         else:
             punchline_var.set("No punchline available.")
 
+    search_entry = tk.Entry(search_frame, textvariable=search_var, font=("Arial", 12), width=24)
+    search_entry.grid(row=0, column=0, padx=4)
+    search_entry.bind("<Return>", search_jokes)
+    tk.Button(
+        search_frame, text="Search", command=search_jokes,
+        font=("Arial", 10, "bold"), bg="#FFB74D", activebackground="#FFA726"
+    ).grid(row=0, column=1, padx=4)
+    tk.Label(
+        search_frame, textvariable=search_info_var,
+        font=("Arial", 10, "italic"), bg="#FFF8DC", fg="#888888"
+    ).grid(row=0, column=2, padx=4)
+
     btn_frame = tk.Frame(root, bg="#FFF8DC")
     btn_frame.pack(pady=(10, 25))
 
     tk.Button(btn_frame, text="Tell me a Joke", command=show_joke, width=15, **button_style).grid(row=0, column=0, padx=8, pady=5)
     tk.Button(btn_frame, text="Show Punchline", command=show_punchline, width=15, **button_style).grid(row=0, column=1, padx=8, pady=5)
     tk.Button(btn_frame, text="Next Joke", command=show_joke, width=15, **button_style).grid(row=0, column=2, padx=8, pady=5)
+    tk.Button(btn_frame, text="Thumbs Up", command=lambda: rate_joke(True), width=15, **button_style).grid(row=1, column=0, padx=8, pady=5)
+    tk.Checkbutton(
+        btn_frame, text="Favour top-rated", variable=weighted_var,
+        font=("Arial", 10, "bold"), bg="#FFF8DC", activebackground="#FFF8DC"
+    ).grid(row=1, column=1, padx=8, pady=5)
+    tk.Button(btn_frame, text="Thumbs Down", command=lambda: rate_joke(False), width=15, **button_style).grid(row=1, column=2, padx=8, pady=5)
 
     tk.Button(
-        root, text="Quit", command=root.quit, width=12,
+        root, text="Quit", command=root.destroy, width=12,
         font=("Arial", 12, "bold"),
         bg="#FF5733", fg="white",
         activebackground="#FA0202", activeforeground="white",
         relief="raised", bd=2, padx=10, pady=5
     ).pack(pady=(10, 15))
 
-    # optional: load one joke immediately
-    show_joke()
+    def poll_loader():
+        """Take whatever the loader thread has finished (runs on the Tk thread)."""
+        try:
+            while True:
+                msg = inbox.get_nowait()
+                kind = msg[0]
+                if kind == "first" and not state["shown_first"]:
+                    display(*msg[1], joke_id=0)     # the first line is joke 0
+                    first_shown()
+                elif kind == "ready":
+                    state["jokes"], state["schedule"] = msg[1], msg[2]
+                    if instrument.ENABLED:
+                        print(f"Corpus ready after {(time.perf_counter() - APP_START) * 1000:.1f} ms")
+                    if not state["schedule"]:
+                        setup_var.set("No jokes found.")
+                    elif not state["shown_first"]:
+                        show_joke()
+                        first_shown()
+                elif kind == "picker":
+                    state["picker"] = msg[1]
+                elif kind == "search":
+                    state["search"] = msg[1]
+                elif kind == "error":
+                    setup_var.set("")
+                    messagebox.showerror("Error", msg[1])
+                elif kind == "done":
+                    return          # loader finished: stop polling
+        except queue.Empty:
+            pass
+        root.after(30, poll_loader)
 
+    # the window comes up immediately; jokes load on a worker thread
+    inbox = queue.Queue()
+    threading.Thread(target=load_in_background, args=(joke_file or default_joke_file(), inbox),
+                     daemon=True).start()
+    root.after(0, poll_loader)
 
-if __name__ == "__main__":
+
+def main():
     root = tk.Tk()
-    build_app(root)
+    build_app(root, sys.argv[1] if len(sys.argv) > 1 else None)
     root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
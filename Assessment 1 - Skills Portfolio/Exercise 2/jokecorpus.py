@@ -0,0 +1,286 @@
+"""
+Indexed joke corpus: parse randomJokes.txt once, then fetch any joke in O(1).
+
+The first time a joke file is opened every line is parsed and a small
+binary index is written next to it (randomJokes.txt.idx). Each record
+holds where the joke starts, how long it is and where its "?" is, so a
+random pick is one seek into the index plus one read from the text file,
+with no reparsing. Later launches only read the 32-byte header, so
+startup time doesn't grow with the size of the corpus. The index is
+rebuilt automatically when the joke file's size or mtime changes.
+
+Large files (or use_mmap=True) are memory-mapped together with their
+index, so a fetch is just two slices and resident memory stays flat
+however big the corpus is: only the pages actually touched are loaded.
+
+    python jokecorpus.py --bench            # 1M synthetic jokes
+    python jokecorpus.py --bench 5000000
+"""
+import io
+import mmap
+import os
+import random
+import struct
+import sys
+import tempfile
+import time
+
+
+HEADER = struct.Struct("<8sqQQ")    # magic, source mtime_ns, source size, joke count
+RECORD = struct.Struct("<QII")      # start offset, length, position of "?" (bytes)
+MAGIC = b"JOKEIDX1"
+NO_SPLIT = 0xFFFFFFFF
+MMAP_THRESHOLD = 8 * 1024 * 1024   # auto-mmap files bigger than this
+
+
+def parse_joke(line):
+    """Split a joke into (setup, punchline)."""
+    if "?" in line:
+        setup, punchline = line.split("?", 1)
+        return setup.strip() + "?", punchline.strip()
+    return line.strip(), "(No punchline found)"
+
+
+def index_path_for(path):
+    return path + ".idx"
+
+
+def source_fingerprint(path):
+    """(mtime_ns, size) of a joke file; anything keyed by joke position must match it."""
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def scan_jokes(f, offset=0):
+    """
+    Yield (start, length, split) for every non-blank line of a binary file
+    object, reading from `offset`. Offsets are absolute byte positions.
+    """
+    f.seek(offset)
+    pos = offset
+    for raw in f:
+        stripped = raw.strip()
+        if stripped:
+            start = pos + len(raw) - len(raw.lstrip())
+            split = stripped.find(b"?")
+            yield start, len(stripped), NO_SPLIT if split < 0 else split
+        pos += len(raw)
+
+
+def write_index(path, out):
+    """Stream index records for `path` into the binary file object `out`."""
+    st = os.stat(path)
+    out.write(HEADER.pack(MAGIC, 0, 0, 0))    # placeholder until the count is known
+    count = 0
+    with open(path, "rb") as f:
+        for rec in scan_jokes(f):
+            out.write(RECORD.pack(*rec))
+            count += 1
+    out.seek(0)
+    out.write(HEADER.pack(MAGIC, st.st_mtime_ns, st.st_size, count))
+
+
+def build_index(path, idx_path):
+    """Parse every line of `path` once and write the binary index."""
+    tmp = idx_path + ".tmp"
+    try:
+        with open(tmp, "wb") as out:
+            write_index(path, out)
+        os.replace(tmp, idx_path)
+    except OSError:
+        buf = io.BytesIO()        # read-only folder: keep the index in memory
+        write_index(path, buf)
+        return buf
+    return open(idx_path, "rb")
+
+
+def extend_index(path):
+    """
+    Bring the index up to date after lines were *appended* to `path`:
+    only the new bytes past the previously indexed size are parsed.
+    Falls back to a full rebuild if the index is missing or the file shrank.
+    """
+    idx_path = index_path_for(path)
+    st = os.stat(path)
+    try:
+        with open(idx_path, "r+b") as idx:
+            magic, _, indexed_size, count = HEADER.unpack(idx.read(HEADER.size))
+            if magic == MAGIC and indexed_size <= st.st_size:
+                idx.seek(HEADER.size + count * RECORD.size)
+                idx.truncate()
+                with open(path, "rb") as f:
+                    for rec in scan_jokes(f, indexed_size):
+                        idx.write(RECORD.pack(*rec))
+                        count += 1
+                idx.seek(0)
+                idx.write(HEADER.pack(MAGIC, st.st_mtime_ns, st.st_size, count))
+                return
+    except (OSError, struct.error):
+        pass
+    build_index(path, idx_path).close()
+
+
+def index_is_fresh(path, idx=None):
+    """True if the cached index matches the joke file's current size and mtime."""
+    st = os.stat(path)
+    try:
+        if idx is None:
+            with open(index_path_for(path), "rb") as f:
+                header = f.read(HEADER.size)
+        else:
+            header = idx.read(HEADER.size)
+        magic, mtime, size, _ = HEADER.unpack(header)
+    except (OSError, struct.error):
+        return False
+    return magic == MAGIC and mtime == st.st_mtime_ns and size == st.st_size
+
+
+def open_index(path):
+    """Open the cached index for `path`, rebuilding it if stale or missing."""
+    idx_path = index_path_for(path)
+    os.stat(path)   # missing joke file -> FileNotFoundError, as before
+    try:
+        idx = open(idx_path, "rb")
+        if index_is_fresh(path, idx):
+            return idx
+        idx.close()
+    except OSError:
+        pass
+    return build_index(path, idx_path)
+
+
+def map_file(f):
+    """Read-only mmap of an open file (None for empty or in-memory files)."""
+    try:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, io.UnsupportedOperation):
+        return None
+
+
+class JokeCorpus:
+    """
+    Random access to the jokes of one file through its offset index.
+    use_mmap: True/False to force a mode, None to mmap only large files.
+    """
+
+    def __init__(self, path, use_mmap=None):
+        self.path = path
+        self.index = open_index(path)
+        self.index.seek(0)
+        _, _, _, self.count = HEADER.unpack(self.index.read(HEADER.size))
+        self.text = open(path, "rb")
+
+        if use_mmap is None:
+            use_mmap = os.path.getsize(path) > MMAP_THRESHOLD
+        self.text_map = self.index_map = None
+        if use_mmap:
+            self.text_map = map_file(self.text)
+            self.index_map = map_file(self.index)
+
+    def __len__(self):
+        return self.count
+
+    def record(self, i):
+        if not 0 <= i < self.count:
+            raise IndexError(i)
+        if self.index_map is not None:
+            return RECORD.unpack_from(self.index_map, HEADER.size + i * RECORD.size)
+        self.index.seek(HEADER.size + i * RECORD.size)
+        return RECORD.unpack(self.index.read(RECORD.size))
+
+    def raw(self, start, length):
+        if self.text_map is not None:
+            return self.text_map[start:start + length]
+        self.text.seek(start)
+        return self.text.read(length)
+
+    def line(self, i):
+        start, length, _ = self.record(i)
+        return self.raw(start, length).decode("utf-8", "replace")
+
+    def get(self, i):
+        """Joke i as (setup, punchline), split at the stored "?" position."""
+        start, length, split = self.record(i)
+        raw = self.raw(start, length)
+        if split == NO_SPLIT:
+            return raw.decode("utf-8", "replace"), "(No punchline found)"
+        setup = raw[:split].decode("utf-8", "replace").strip() + "?"
+        return setup, raw[split + 1:].decode("utf-8", "replace").strip()
+
+    def random(self, rng=random):
+        return self.get(rng.randrange(self.count))
+
+    def close(self):
+        for m in (self.text_map, self.index_map):
+            if m is not None:
+                m.close()
+        self.index.close()
+        self.text.close()
+
+
+# ----------------------------
+# BENCHMARK
+# ----------------------------
+def memory_report():
+    """
+    Current resident memory split into private heap and mapped file pages
+    (Linux). Mapped pages belong to the page cache and can be dropped by
+    the OS at any time, so the heap figure is the one that should stay flat.
+    Elsewhere it falls back to peak RSS (Unix) or "n/a" (Windows).
+    """
+    try:
+        with open("/proc/self/status") as f:
+            fields = dict(line.split(":", 1) for line in f)
+        anon = int(fields["RssAnon"].split()[0]) / 1024
+        mapped = int(fields["RssFile"].split()[0]) / 1024
+        return f"heap {anon:.0f} MB, mapped file {mapped:.0f} MB"
+    except (OSError, KeyError):
+        pass
+    try:
+        import resource     # Unix only
+    except ImportError:
+        return "memory n/a"
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return f"peak RSS {peak:.0f} MB"
+
+
+def bench(count):
+    folder = tempfile.mkdtemp()
+    path = os.path.join(folder, "bench_jokes.txt")
+    rng = random.Random(0)
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(count):
+            f.write(f"Why did joke number {i} cross the {rng.random():.6f} road?"
+                    f"To reach punchline {i} on the other side.\n")
+    size_mb = os.path.getsize(path) / 1e6
+    print(f"corpus: {count:,} jokes, {size_mb:.0f} MB, {memory_report()}")
+
+    start = time.perf_counter()
+    build_index(path, index_path_for(path)).close()
+    took = time.perf_counter() - start
+    print(f"index build: {took:.2f}s ({size_mb / took:.0f} MB/s), {memory_report()}")
+
+    fetches = 200_000
+    picks = [rng.randrange(count) for _ in range(fetches)]
+    for use_mmap in (False, True):
+        start = time.perf_counter()
+        corpus = JokeCorpus(path, use_mmap=use_mmap)
+        opened = time.perf_counter() - start
+        start = time.perf_counter()
+        for i in picks:
+            corpus.get(i)
+        took = time.perf_counter() - start
+        mode = "mmap" if use_mmap else "seek"
+        print(f"{mode}: open {opened * 1000:.2f} ms, fetch {took / fetches * 1e6:.2f} us each, "
+              f"{memory_report()}")
+        corpus.close()
+
+    os.remove(path)
+    os.remove(index_path_for(path))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--bench":
+        bench(int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000)
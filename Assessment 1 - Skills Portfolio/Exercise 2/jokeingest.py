@@ -0,0 +1,188 @@
+"""
+Stream jokes from many files/folders into one deduplicated, indexed corpus.
+
+    python jokeingest.py more_jokes.txt joke_dumps/ --corpus jokes.corpus.txt
+
+Every line is split with the usual parse_joke rules and written back in
+normalised "setup?punchline" form. A 64-bit hash of each joke (case and
+spacing ignored) goes into a hash set, so repeats are dropped across all
+sources. Next to the corpus are kept:
+  - <corpus>.sources.json  files already ingested (path, size, mtime)
+  - <corpus>.seen          the hashes, as a flat array of uint64
+so running it again with a new file only reads that new file, appends its
+jokes and extends the offset index (see jokecorpus.extend_index) instead
+of reprocessing everything. Those two files are only written once the
+jokes they describe are safely in the corpus: if a source fails half-way,
+its jokes are cut off the corpus again and its hashes forgotten.
+
+Lines without a "?" can't be split into setup and punchline; they are
+counted and the first few are listed in the report.
+"""
+import argparse
+import hashlib
+import json
+import os
+import time
+from array import array
+
+from jokecorpus import JokeCorpus, parse_joke, extend_index
+from jokeratings import JokeRatings
+from jokesearch import JokeSearchIndex
+
+
+DEFAULT_CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "jokes.corpus.txt")
+SHOW_REJECTED = 10      # rejected lines listed in the report
+
+
+def joke_key(setup, punchline):
+    text = " ".join(f"{setup} {punchline}".lower().split())
+    return int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def fsync_path(path):
+    with open(path, "ab") as f:
+        os.fsync(f.fileno())
+
+
+def expand_sources(sources):
+    """Files as given, plus every *.txt inside given folders (sorted, recursive)."""
+    for src in sources:
+        if os.path.isdir(src):
+            for folder, _, names in sorted(os.walk(src)):
+                for name in sorted(names):
+                    if name.endswith(".txt"):
+                        yield os.path.join(folder, name)
+        else:
+            yield src
+
+
+class Ingestor:
+    def __init__(self, corpus_path=DEFAULT_CORPUS):
+        self.corpus_path = corpus_path
+        self.manifest_path = corpus_path + ".sources.json"
+        self.seen_path = corpus_path + ".seen"
+        self.stats = {"files": 0, "skipped_files": 0, "bytes": 0, "lines": 0,
+                      "added": 0, "duplicates": 0, "no_punchline": 0,
+                      "rejected": []}     # (path, line number, text), first SHOW_REJECTED only
+
+        self.manifest = {}
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, encoding="utf-8") as f:
+                self.manifest = json.load(f)
+
+        self.seen = set()
+        if os.path.exists(self.seen_path):
+            hashes = array("Q")
+            with open(self.seen_path, "rb") as f:
+                hashes.frombytes(f.read())
+            self.seen.update(hashes)
+        self.new_hashes = array("Q")
+
+    def already_ingested(self, path):
+        st = os.stat(path)
+        entry = self.manifest.get(os.path.abspath(path))
+        return entry == {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+    def ingest_file(self, path, out):
+        with open(path, "rb") as f:
+            for lineno, raw in enumerate(f, 1):
+                self.stats["bytes"] += len(raw)
+                line = raw.decode("utf-8", errors="replace").strip()
+                if not line:
+                    continue
+                self.stats["lines"] += 1
+                if "?" not in line:
+                    self.stats["no_punchline"] += 1
+                    if len(self.stats["rejected"]) < SHOW_REJECTED:
+                        self.stats["rejected"].append((path, lineno, line))
+                    continue
+                setup, punchline = parse_joke(line)
+                key = joke_key(setup, punchline)
+                if key in self.seen:
+                    self.stats["duplicates"] += 1
+                    continue
+                self.seen.add(key)
+                self.new_hashes.append(key)
+                out.write(f"{setup}{punchline}\n".encode("utf-8"))
+                self.stats["added"] += 1
+
+    def roll_back(self, out, mark, first_new):
+        """Cut a half-ingested file's jokes off the corpus and forget their hashes."""
+        try:
+            out.close()          # may fail again on the same write error
+        except OSError:
+            pass
+        os.truncate(self.corpus_path, mark)
+        for key in self.new_hashes[first_new:]:
+            self.seen.discard(key)
+        del self.new_hashes[first_new:]
+
+    def save_state(self):
+        with open(self.seen_path, "ab") as f:
+            self.new_hashes.tofile(f)
+        self.new_hashes = array("Q")
+        with open(self.manifest_path, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, indent=1)
+
+    def run(self, sources):
+        start = time.perf_counter()
+        out = open(self.corpus_path, "ab")
+        try:
+            for path in expand_sources(sources):
+                if os.path.abspath(path) == os.path.abspath(self.corpus_path):
+                    continue
+                if self.already_ingested(path):
+                    self.stats["skipped_files"] += 1
+                    continue
+                mark, first_new = out.tell(), len(self.new_hashes)
+                try:
+                    self.ingest_file(path, out)
+                    out.flush()
+                except BaseException:
+                    self.roll_back(out, mark, first_new)
+                    raise
+                st = os.stat(path)
+                self.manifest[os.path.abspath(path)] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+                self.stats["files"] += 1
+        finally:
+            # record as seen/ingested only what is on disk in the corpus,
+            # including the files that finished before a failure
+            out.close()
+            fsync_path(self.corpus_path)
+            self.save_state()
+
+        extend_index(self.corpus_path)
+        if os.path.exists(self.corpus_path + ".search") or os.path.exists(self.corpus_path + ".ratings"):
+            # only lines were appended: index just the new jokes and keep the ratings
+            corpus = JokeCorpus(self.corpus_path)
+            if os.path.exists(self.corpus_path + ".search"):
+                JokeSearchIndex.open(corpus, appended=True)
+            if os.path.exists(self.corpus_path + ".ratings"):
+                JokeRatings.open(corpus, appended=True).save()
+            corpus.close()
+        self.stats["seconds"] = time.perf_counter() - start
+        return self.stats
+
+
+def report(stats):
+    secs = max(stats["seconds"], 1e-9)
+    lines = max(stats["lines"], 1)
+    print(f"files ingested: {stats['files']} (unchanged, skipped: {stats['skipped_files']})")
+    print(f"read {stats['bytes'] / 1e6:.1f} MB, {stats['lines']:,} lines in {secs:.2f}s "
+          f"({stats['bytes'] / 1e6 / secs:.1f} MB/s, {stats['lines'] / secs:,.0f} lines/s)")
+    print(f"added {stats['added']:,}, duplicates {stats['duplicates']:,} "
+          f"({100 * stats['duplicates'] / lines:.1f}%), no punchline {stats['no_punchline']:,}")
+    if stats["rejected"]:
+        print("skipped lines without a '?':")
+        for path, lineno, text in stats["rejected"]:
+            print(f"  {path}:{lineno}: {text[:60]}")
+        if stats["no_punchline"] > len(stats["rejected"]):
+            print(f"  ... and {stats['no_punchline'] - len(stats['rejected']):,} more")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build/extend a deduplicated joke corpus.")
+    parser.add_argument("sources", nargs="+", help="joke files or folders of .txt files")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS)
+    args = parser.parse_args()
+    report(Ingestor(args.corpus).run(args.sources))
@@ -0,0 +1,266 @@
+"""
+Thumbs-up/down ratings and rating-weighted joke picks.
+
+Each joke has an up and a down counter (two flat uint32 arrays saved to
+<corpus>.ratings). Its weight is (1 + up) / (1 + down): unrated jokes
+weigh 1, every thumbs-up raises the weight and every thumbs-down lowers it.
+Counters are indexed by joke position, so the file records the joke
+file's size and mtime, like the search index, and is only reused while
+they match (or when jokeingest says it merely appended lines).
+
+Picks use Vose's alias method: after an O(n) table build every draw is
+one random number, one array lookup and one comparison, O(1) whatever
+the corpus size. Rebuilding the table for every click would cost O(n)
+per click, so ratings are only counted straight away and the table is
+rebuilt once REBUILD_EVERY ratings have piled up or REBUILD_SECONDS have
+passed since the first of them, on a background thread: the click only
+counts, and draws keep using the old table until the new one is ready.
+
+    python jokeratings.py --bench            # 1M jokes
+    python jokeratings.py --bench 5000000
+"""
+import os
+import random
+import struct
+import sys
+import threading
+import time
+from array import array
+
+from jokecorpus import source_fingerprint
+
+
+REBUILD_EVERY = 25
+REBUILD_SECONDS = 30.0
+MAGIC = b"JOKERAT1"
+HEADER = struct.Struct("<8sqQQ")   # magic, joke file mtime_ns, joke file size, joke count
+
+
+def weights(up, down):
+    return [(1 + u) / (1 + d) for u, d in zip(up, down)]
+
+
+class AliasTable:
+    """Vose's alias method over a list of non-negative weights."""
+
+    def __init__(self, weights):
+        n = len(weights)
+        self.n = n
+        self.prob = array("d", bytes(8 * n))
+        self.alias = array("I", bytes(4 * n))
+        total = sum(weights)
+        if not n or total <= 0:
+            raise ValueError("need at least one positive weight")
+
+        scaled = [w * n / total for w in weights]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        prob, alias = self.prob, self.alias
+        while small and large:
+            s = small.pop()
+            g = large[-1]
+            prob[s] = scaled[s]
+            alias[s] = g
+            scaled[g] = (scaled[g] + scaled[s]) - 1.0
+            if scaled[g] < 1.0:
+                small.append(large.pop())
+        for i in large:
+            prob[i] = 1.0
+        for i in small:          # only left over through rounding error
+            prob[i] = 1.0
+
+    def draw(self, rng=random):
+        u = rng.random() * self.n
+        i = int(u)
+        return i if u - i < self.prob[i] else self.alias[i]
+
+
+class JokeRatings:
+    """Per-joke up/down counts, persisted as two uint32 arrays."""
+
+    def __init__(self, count, path=None, source=None, appended=False):
+        self.path = path
+        self.source = source         # (mtime_ns, size) of the joke file the ids belong to
+        self.up = array("I")
+        self.down = array("I")
+        self.load(appended)
+        self.resize(count)
+
+    @classmethod
+    def open(cls, corpus, appended=False):
+        """
+        Ratings for corpus from <corpus>.ratings, dropped if they were made
+        against a different version of the joke file. appended=True keeps
+        them when the caller only added lines at the end.
+        """
+        return cls(len(corpus), corpus.path + ".ratings", source_fingerprint(corpus.path), appended)
+
+    def resize(self, count):
+        # joke ids only grow (jokeingest appends), so new jokes start unrated
+        if len(self.up) != count:
+            self.up = self.up[:count]
+            self.down = self.down[:count]
+            missing = count - len(self.up)
+            self.up.frombytes(bytes(4 * missing))
+            self.down.frombytes(bytes(4 * missing))
+
+    def __len__(self):
+        return len(self.up)
+
+    def rate(self, i, thumbs_up):
+        if thumbs_up:
+            self.up[i] += 1
+        else:
+            self.down[i] += 1
+
+    def weights(self):
+        return weights(self.up, self.down)
+
+    def load(self, appended=False):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "rb") as f:
+                magic, mtime, size, count = HEADER.unpack(f.read(HEADER.size))
+                if magic != MAGIC:
+                    return
+                if self.source is not None and (mtime, size) != self.source and not appended:
+                    return           # ids now point at different jokes: start afresh
+                up, down = array("I"), array("I")
+                up.fromfile(f, count)
+                down.fromfile(f, count)
+            self.up, self.down = up, down
+        except (OSError, EOFError, struct.error):
+            pass
+
+    def save(self, up=None, down=None):
+        """Write the counts (or a snapshot of them, from a background thread)."""
+        if not self.path:
+            return
+        up = self.up if up is None else up
+        down = self.down if down is None else down
+        tmp = self.path + ".tmp"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(HEADER.pack(MAGIC, *(self.source or (0, 0)), len(up)))
+                up.tofile(f)
+                down.tofile(f)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+
+
+class WeightedPicker:
+    """Rating-weighted joke picks with batched alias-table rebuilds."""
+
+    def __init__(self, ratings, rng=None, rebuild_every=REBUILD_EVERY,
+                 rebuild_seconds=REBUILD_SECONDS, clock=time.monotonic):
+        self.ratings = ratings
+        self.rng = rng or random.Random()
+        self.rebuild_every = rebuild_every
+        self.rebuild_seconds = rebuild_seconds
+        self.clock = clock
+        self.pending = 0
+        self.pending_since = None
+        self.worker = None
+        self.rebuild()
+
+    def rebuild(self):
+        """Fold every pending rating into a fresh table and save the counts, on this thread."""
+        self.wait()
+        self.table = AliasTable(self.ratings.weights())
+        if self.pending:
+            self.ratings.save()
+        self.pending = 0
+        self.pending_since = None
+
+    def rebuild_in_background(self):
+        """Snapshot the counts here and build/save from the copy on a worker thread."""
+        up, down = array("I", self.ratings.up), array("I", self.ratings.down)
+        self.pending = 0
+        self.pending_since = None
+
+        def work():
+            table = AliasTable(weights(up, down))
+            self.ratings.save(up, down)
+            self.table = table       # one reference swap: draws see the old or the new table
+        self.worker = threading.Thread(target=work, daemon=True)
+        self.worker.start()
+
+    def busy(self):
+        return self.worker is not None and self.worker.is_alive()
+
+    def wait(self):
+        if self.worker is not None:
+            self.worker.join()
+            self.worker = None
+
+    def rate(self, i, thumbs_up):
+        self.ratings.rate(i, thumbs_up)
+        if not self.pending:
+            self.pending_since = self.clock()
+        self.pending += 1
+        self.maybe_rebuild()
+
+    def maybe_rebuild(self):
+        # one rebuild at a time; ratings made meanwhile wait for the next one
+        if self.pending and not self.busy() and (
+                self.pending >= self.rebuild_every
+                or self.clock() - self.pending_since >= self.rebuild_seconds):
+            self.rebuild_in_background()
+
+    def next(self):
+        self.maybe_rebuild()
+        return self.table.draw(self.rng)
+
+    def close(self):
+        self.wait()
+        if self.pending:
+            self.ratings.save()
+            self.pending = 0
+
+
+# ----------------------------
+# BENCHMARK
+# ----------------------------
+def bench(count):
+    rng = random.Random(0)
+    ratings = JokeRatings(count)
+    for _ in range(count // 10):      # a tenth of the jokes have been rated
+        ratings.rate(rng.randrange(count), rng.random() < 0.6)
+
+    start = time.perf_counter()
+    picker = WeightedPicker(ratings, rng=rng)
+    took = time.perf_counter() - start
+    print(f"alias table for {count:,} jokes: rebuild {took:.2f}s")
+
+    draws = 1_000_000
+    draw = picker.table.draw
+    start = time.perf_counter()
+    for _ in range(draws):
+        draw(rng)
+    took = time.perf_counter() - start
+    print(f"draw: {took / draws * 1e9:.0f} ns each ({draws / took:,.0f}/s)")
+
+    clicks = 4 * picker.rebuild_every
+    start = time.perf_counter()
+    for _ in range(clicks):
+        picker.rate(rng.randrange(count), True)
+        picker.next()
+    took = time.perf_counter() - start
+    print(f"{clicks:,} rate+draw clicks (rebuild every {picker.rebuild_every}): "
+          f"{took / clicks * 1e3:.2f} ms each on average")
+
+    # draws should follow the weights: compare the heaviest joke's share with its weight
+    picker.rebuild()
+    draw = picker.table.draw
+    weights = ratings.weights()
+    top = max(range(count), key=weights.__getitem__)
+    hits = sum(draw(rng) == top for _ in range(draws))
+    expected = weights[top] / sum(weights) * draws
+    print(f"heaviest joke drawn {hits} times, expected ~{expected:.0f}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--bench":
+        bench(int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000)
@@ -0,0 +1,98 @@
+"""
+Non-repeating joke order that survives restarts.
+
+Instead of random.choice (which repeats long before the corpus is used
+up) the scheduler walks a pseudo-random permutation of 0..n-1. The
+permutation is never stored: a small Feistel network turns "position k
+of cycle s" into a joke index on demand, so memory is O(1) even for
+millions of jokes. Only (n, seed, position) is saved, in a tiny JSON
+file next to the joke file. When a cycle ends a new seed starts a fresh
+order.
+"""
+import json
+import os
+import random
+
+
+ROUNDS = 4
+
+
+class FeistelPermutation:
+    """Bijection on range(n) built from a keyed Feistel network plus cycle-walking."""
+
+    def __init__(self, n, seed):
+        self.n = n
+        bits = max(2, (n - 1).bit_length())
+        bits += bits % 2                 # even split into two halves
+        self.half = bits // 2
+        self.mask = (1 << self.half) - 1
+        rng = random.Random(seed)
+        self.keys = [rng.getrandbits(32) for _ in range(ROUNDS)]
+
+    def round(self, value, key):
+        x = (value * 0x9E3779B1 + key) & 0xFFFFFFFF
+        x ^= x >> 15
+        x = (x * 0x85EBCA6B) & 0xFFFFFFFF
+        x ^= x >> 13
+        return x & self.mask
+
+    def encrypt(self, x):
+        left, right = x >> self.half, x & self.mask
+        for key in self.keys:
+            left, right = right, left ^ self.round(right, key)
+        return (left << self.half) | right
+
+    def __getitem__(self, k):
+        # the network permutes 0..4**half; walk until we land inside range(n)
+        x = self.encrypt(k)
+        while x >= self.n:
+            x = self.encrypt(x)
+        return x
+
+
+class JokeScheduler:
+    def __init__(self, count, state_path=None):
+        self.count = count
+        self.state_path = state_path
+        self.seed = random.getrandbits(32)
+        self.pos = 0
+        self.load()
+        self.perm = FeistelPermutation(count, self.seed) if count else None
+
+    def load(self):
+        if not self.state_path or not os.path.exists(self.state_path):
+            return
+        try:
+            with open(self.state_path, encoding="utf-8") as f:
+                state = json.load(f)
+            # a different corpus size means a different permutation: start over
+            if state["n"] == self.count and 0 <= state["pos"] < self.count:
+                self.seed = state["seed"]
+                self.pos = state["pos"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    def save(self):
+        if not self.state_path:
+            return
+        # written aside and swapped in, so a crash mid-write keeps the last cursor
+        tmp = self.state_path + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"n": self.count, "seed": self.seed, "pos": self.pos}, f)
+            os.replace(tmp, self.state_path)
+        except OSError:
+            pass
+
+    def next(self):
+        """Index of the next joke; every joke comes up once per cycle."""
+        if not self.count:
+            raise IndexError("no jokes to schedule")
+        index = self.perm[self.pos]
+        self.pos += 1
+        if self.pos >= self.count:
+            self.seed = (self.seed + 1) & 0xFFFFFFFF
+            self.perm = FeistelPermutation(self.count, self.seed)
+            self.pos = 0
+        self.save()
+        return index
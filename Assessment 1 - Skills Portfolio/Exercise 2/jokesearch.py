@@ -0,0 +1,234 @@
+"""
+Keyword search over a joke corpus ("a joke about roads").
+
+Setups and punchlines are tokenised (lower-case words, common words
+dropped, simple plurals folded) into an inverted index: term -> posting
+list of (joke id, term count). Posting lists are kept as bytes of
+varint-encoded id gaps, which is a few bytes per posting, and the whole
+index is saved next to the corpus (<corpus>.search). Results are ranked
+with BM25. Terms are scored rarest first; a very common term only adds
+to the score when nothing rarer matched, and then only its first
+postings are read, so a query never decodes hundreds of thousands of
+postings just to rank jokes that all score alike.
+
+Joke ids are line positions, so the saved index records the joke file's
+size and mtime and is rebuilt from scratch whenever they no longer match
+(an edited line would otherwise map old words onto the wrong joke). The
+one exception is jokeingest.py, which only ever appends: it asks for the
+new jokes to be indexed on top of the existing ones.
+
+    python jokesearch.py "chicken road"
+"""
+import heapq
+import math
+import os
+import re
+import struct
+import sys
+import time
+from array import array
+
+from jokecorpus import source_fingerprint
+
+
+MAGIC = b"JOKESRC2"
+SOURCE = struct.Struct("<qQ")    # joke file mtime_ns and size the index was built from
+ENTRY = struct.Struct("<HIQI")   # term length, postings length, last doc id, doc frequency
+WORD = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset("""
+    a about an and are as at be but by did do does for from get got had has have he her his
+    how i if in is it its joke jokes me my no not of on or she so that the their them then
+    there they this to was we what when where which who why will with you your
+""".split())
+
+K1 = 1.2    # BM25 term-frequency saturation
+B = 0.75    # BM25 length normalisation
+COMMON_FRACTION = 0.05      # terms in more than 5% of jokes count as "common"
+COMMON_POSTINGS = 20_000    # most postings read from a common term
+
+
+def tokenize(text):
+    terms = []
+    for word in WORD.findall(text.lower()):
+        if word in STOPWORDS or len(word) < 2:
+            continue
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]         # roads -> road, cats -> cat
+        terms.append(word)
+    return terms
+
+
+def put_varint(buf, n):
+    while n >= 0x80:
+        buf.append((n & 0x7F) | 0x80)
+        n >>= 7
+    buf.append(n)
+
+
+def read_postings(data, limit=None):
+    """Decode a posting list (or its first `limit` entries) into (doc id, term count) pairs."""
+    doc = 0
+    i = 0
+    end = len(data)
+    values = []
+    stop = None if limit is None else 2 * limit
+    while i < end and len(values) != stop:
+        n = shift = 0
+        while True:
+            byte = data[i]
+            i += 1
+            n |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                break
+            shift += 7
+        values.append(n)
+    for gap, tf in zip(values[0::2], values[1::2]):
+        doc += gap
+        yield doc, tf
+
+
+class JokeSearchIndex:
+    def __init__(self, path=None):
+        self.path = path
+        self.source = None           # (mtime_ns, size) of the indexed joke file
+        self.postings = {}           # term -> bytearray of (gap, tf) varints
+        self.last_doc = {}           # term -> last doc id in its posting list
+        self.doc_freq = {}           # term -> number of jokes containing it
+        self.doc_len = array("I")    # terms per joke, for BM25
+        self.total_len = 0
+
+    @property
+    def doc_count(self):
+        return len(self.doc_len)
+
+    # ---- building ----
+    def add(self, doc_id, setup, punchline):
+        terms = tokenize(f"{setup} {punchline}")
+        self.doc_len.append(len(terms))
+        self.total_len += len(terms)
+        counts = {}
+        for t in terms:
+            counts[t] = counts.get(t, 0) + 1
+        for term, tf in counts.items():
+            buf = self.postings.get(term)
+            if buf is None:
+                buf = self.postings[term] = bytearray()
+                gap = doc_id
+            else:
+                gap = doc_id - self.last_doc[term]
+            put_varint(buf, gap)
+            put_varint(buf, tf)
+            self.last_doc[term] = doc_id
+            self.doc_freq[term] = self.doc_freq.get(term, 0) + 1
+
+    def clear(self):
+        self.postings.clear()
+        self.last_doc.clear()
+        self.doc_freq.clear()
+        self.doc_len = array("I")
+        self.total_len = 0
+
+    def update(self, corpus):
+        """Index jokes the index hasn't seen yet; returns how many were added."""
+        if len(corpus) < self.doc_count:      # corpus was replaced: start again
+            self.clear()
+        start = self.doc_count
+        for i in range(start, len(corpus)):
+            self.add(i, *corpus.get(i))
+        return len(corpus) - start
+
+    # ---- persistence ----
+    def save(self):
+        tmp = self.path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(MAGIC)
+            f.write(SOURCE.pack(*(self.source or (0, 0))))
+            f.write(struct.pack("<QQ", self.doc_count, len(self.postings)))
+            self.doc_len.tofile(f)
+            for term, buf in self.postings.items():
+                word = term.encode("utf-8")
+                f.write(ENTRY.pack(len(word), len(buf), self.last_doc[term], self.doc_freq[term]))
+                f.write(word)
+                f.write(buf)
+        os.replace(tmp, self.path)
+
+    def load(self):
+        with open(self.path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError("not a joke search index")
+            self.source = SOURCE.unpack(f.read(SOURCE.size))
+            docs, terms = struct.unpack("<QQ", f.read(16))
+            self.doc_len = array("I")
+            self.doc_len.fromfile(f, docs)
+            self.total_len = sum(self.doc_len)
+            for _ in range(terms):
+                wlen, plen, last, df = ENTRY.unpack(f.read(ENTRY.size))
+                term = f.read(wlen).decode("utf-8")
+                self.postings[term] = bytearray(f.read(plen))
+                self.last_doc[term] = last
+                self.doc_freq[term] = df
+
+    @classmethod
+    def open(cls, corpus, appended=False):
+        """
+        Load <corpus>.search if it was built from this exact joke file,
+        otherwise rebuild it; save if anything changed. appended=True means
+        the caller only added lines at the end (jokeingest), so the saved
+        postings are kept and just the new jokes are indexed.
+        """
+        source = source_fingerprint(corpus.path)
+        index = cls(corpus.path + ".search")
+        try:
+            index.load()
+        except (OSError, ValueError, struct.error, EOFError):
+            index = cls(corpus.path + ".search")
+        stale = index.source != source
+        if stale and not appended:
+            index.clear()
+        index.source = source
+        if index.update(corpus) or stale or not os.path.exists(index.path):
+            try:
+                index.save()
+            except OSError:
+                pass
+        return index
+
+    # ---- querying ----
+    def search(self, query, limit=20):
+        """Best matching joke ids for a query, highest BM25 score first."""
+        n = self.doc_count
+        if not n:
+            return []
+        avg_len = self.total_len / n or 1.0
+        common = max(COMMON_POSTINGS, COMMON_FRACTION * n)
+        terms = sorted((t for t in set(tokenize(query)) if t in self.postings), key=self.doc_freq.get)
+        scores = {}
+        for term in terms:
+            df = self.doc_freq[term]
+            if df > common:
+                if scores:
+                    break      # rarer terms already found the jokes worth ranking
+                postings = read_postings(self.postings[term], COMMON_POSTINGS)
+            else:
+                postings = read_postings(self.postings[term])
+            idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+            for doc, tf in postings:
+                norm = K1 * (1 - B + B * self.doc_len[doc] / avg_len)
+                scores[doc] = scores.get(doc, 0.0) + idf * tf * (K1 + 1) / (tf + norm)
+        return [doc for doc, _ in heapq.nlargest(limit, scores.items(), key=lambda kv: kv[1])]
+
+
+if __name__ == "__main__":
+    from jokecorpus import JokeCorpus
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    corpus = JokeCorpus(sys.argv[2] if len(sys.argv) > 2 else os.path.join(here, "randomJokes.txt"))
+    start = time.perf_counter()
+    index = JokeSearchIndex.open(corpus)
+    print(f"index ready in {time.perf_counter() - start:.2f}s "
+          f"({index.doc_count:,} jokes, {len(index.postings):,} terms)")
+    start = time.perf_counter()
+    hits = index.search(sys.argv[1] if len(sys.argv) > 1 else "road")
+    print(f"{len(hits)} hits in {(time.perf_counter() - start) * 1000:.2f} ms")
+    for doc in hits[:10]:
+        print(" -", " ".join(corpus.get(doc)))
@@ -1,9 +1,25 @@
 import os
+import sys
 import tkinter as tk
+from tkinter import filedialog
 from tkinter import messagebox
 from tkinter import ttk
+from array import array
+from collections import deque
 from dataclasses import dataclass
 
+# shared helpers (instrument.py, gradechart.py) live in the portfolio folder one level up;
+# launcher.py has already put it on sys.path, a direct run adds it here
+PORTFOLIO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PORTFOLIO not in sys.path:
+    sys.path.append(PORTFOLIO)
+from instrument import timed, install as install_instrumentation  # noqa: E402
+from gradechart import GradeChart  # noqa: E402
+from rosterdiff import ChangeSet, diff_rosters  # noqa: E402
+
+
+HISTORY_DEPTH = 50  # how many edits Undo can step back through
+
 
 # ------------------ Student ------------------
 @dataclass
@@ -36,6 +52,10 @@ class Student:
             return "D"
         return "F"
 
+    def valid(self) -> bool:
+        """Coursework marks 0-20 each and exam 0-100, as the Add form requires."""
+        return all(0 <= c <= 20 for c in (self.c1, self.c2, self.c3)) and 0 <= self.exam <= 100
+
     def to_line(self) -> str:
         return f"{self.code},{self.name},{self.c1},{self.c2},{self.c3},{self.exam}"
 
@@ -93,10 +113,113 @@ class StudentStore:
         del self.by_code[code]
         return True
 
+    def index_of(self, code: int) -> int:
+        return self.students.index(self.by_code[code])
+
+    def order(self) -> array | list:
+        """
+        Current row order as a compact array of student codes (signed 64-bit,
+        so negative codes fit too; a plain list if a code is even larger).
+        """
+        codes = [s.code for s in self.students]
+        try:
+            return array("q", codes)
+        except OverflowError:
+            return codes
+
+    def apply(self, change: tuple) -> tuple:
+        """
+        Apply one change record and return the record that reverses it.
+
+        Records are small tuples rather than copies of the roster:
+          ("insert", index, student)  - put student back at index
+          ("remove", index, student)  - take student out of index
+          ("update", index, student)  - replace the student at index
+          ("order", codes)            - rearrange rows to match codes
+          ("batch", records)          - apply several records in turn
+        """
+        kind = change[0]
+        if kind == "insert":
+            _, index, s = change
+            self.students.insert(index, s)
+            self.by_code[s.code] = s
+            return ("remove", index, s)
+        if kind == "remove":
+            _, index, s = change
+            del self.students[index]
+            del self.by_code[s.code]
+            return ("insert", index, s)
+        if kind == "update":
+            _, index, s = change
+            old = self.students[index]
+            self.students[index] = s
+            del self.by_code[old.code]
+            self.by_code[s.code] = s
+            return ("update", index, old)
+        if kind == "batch":
+            inverses = [self.apply(c) for c in change[1]]
+            return ("batch", inverses[::-1])
+        if kind == "order":
+            before = self.order()
+            self.students = [self.by_code[c] for c in change[1]]
+            return ("order", before)
+        raise ValueError(f"Unknown change record: {kind}")
+
+    def plan(self, changes: ChangeSet) -> tuple:
+        """
+        Turn a roster diff (see rosterdiff.py) into one "batch" record for
+        the current roster: changed marks become in-place updates, removals
+        go highest index first so earlier indices stay valid, and new
+        students are appended. Entries that no longer match the roster
+        (already removed, already added) are adapted or skipped.
+        """
+        position = {s.code: i for i, s in enumerate(self.students)}   # one pass, not one per row
+        records = []
+        removals = []
+        appended = {}
+        for _, new in changes.changed:
+            if new[0] in position:
+                records.append(("update", position[new[0]], Student(*new)))
+            else:
+                appended[new[0]] = Student(*new)
+        for row in changes.added:
+            if row[0] in position:
+                records.append(("update", position[row[0]], Student(*row)))
+            else:
+                appended[row[0]] = Student(*row)
+        for row in changes.removed:
+            if row[0] in position:
+                removals.append(position[row[0]])
+        for index in sorted(removals, reverse=True):
+            records.append(("remove", index, self.students[index]))
+        start = len(self.students) - len(removals)
+        records.extend(("insert", start + i, s) for i, s in enumerate(appended.values()))
+        return ("batch", records)
+
+
+# ------------------ Undo / Redo ------------------
+class History:
+    """Bounded undo/redo stacks holding inverse change records."""
+
+    def __init__(self, depth: int = HISTORY_DEPTH):
+        self.undo_stack: deque[tuple] = deque(maxlen=depth)
+        self.redo_stack: deque[tuple] = deque(maxlen=depth)
+
+    def record(self, inverse: tuple) -> None:
+        # a fresh edit makes the redo branch meaningless
+        self.undo_stack.append(inverse)
+        self.redo_stack.clear()
+
+    def can_undo(self) -> bool:
+        return bool(self.undo_stack)
+
+    def can_redo(self) -> bool:
+        return bool(self.redo_stack)
+
 
 # ------------------ Add Student Popup ------------------
 class AddStudentDialog(tk.Toplevel):
-    def __init__(self, parent: tk.Tk, on_submit):
+    def __init__(self, parent: tk.Misc, on_submit):
         super().__init__(parent)
         self.title("Add Student")
         self.geometry("320x360")
@@ -148,14 +271,16 @@ class AddStudentDialog(tk.Toplevel):
 
 
 # ------------------ App ------------------
-class App(tk.Tk):
-    def __init__(self, store: StudentStore):
-        super().__init__()
+class App(tk.Toplevel):
+    def __init__(self, store: StudentStore, history_depth: int = HISTORY_DEPTH,
+                 master: tk.Misc | None = None):
+        super().__init__(master)
         self.store = store
         self.sort_asc = True
+        self.history = History(history_depth)
 
         self.title("Student Manager - Table Edition")
-        self.geometry("950x520")
+        self.geometry("1050x720")
         self.configure(bg="#f2f2f2")
 
         # Header
@@ -208,6 +333,10 @@ class App(tk.Tk):
             tk.Label(line, text=f"{k}:", bg="white", width=12, anchor="w", font=("Segoe UI", 10, "bold")).pack(side="left")
             tk.Label(line, textvariable=self.detail_vars[k], bg="white", anchor="w", font=("Segoe UI", 10)).pack(side="left")
 
+        # Grade distribution, kept in step with every commit/undo/redo
+        self.chart = GradeChart(right, width=300, height=200)
+        self.chart.pack(padx=12, pady=(8, 10))
+
         # Buttons row
         buttons = tk.Frame(self, bg="#f2f2f2")
         buttons.pack(fill="x", padx=10, pady=(0, 10))
@@ -220,20 +349,72 @@ class App(tk.Tk):
         tk.Button(buttons, text="Sort by Total", command=self.sort_by_total, **btn).pack(side="left", padx=4)
         tk.Button(buttons, text="Add Student", command=self.add_student, **btn).pack(side="left", padx=4)
         tk.Button(buttons, text="Delete Selected", command=self.delete_selected, **btn).pack(side="left", padx=4)
+        tk.Button(buttons, text="Apply Revision", command=self.apply_revision, **btn).pack(side="left", padx=4)
+        tk.Button(buttons, text="Redo", command=self.redo, **btn).pack(side="right", padx=4)
+        tk.Button(buttons, text="Undo", command=self.undo, **btn).pack(side="right", padx=4)
+
+        self.bind("<Control-z>", lambda e: self.undo())
+        self.bind("<Control-y>", lambda e: self.redo())
 
         self.refresh_table()
 
     # -------------- UI helpers --------------
+    @timed
     def refresh_table(self):
         for item in self.tree.get_children():
             self.tree.delete(item)
 
         for s in self.store.students:
-            self.tree.insert("", "end", iid=str(s.code),
-                             values=(s.code, s.name, s.total(), s.pct(), s.grade()))
+            self.tree.insert("", "end", iid=str(s.code), values=self.row_values(s))
+
+        self.chart.reset(self.store.students)
+        self.clear_details()
 
+    def row_values(self, s: Student) -> tuple:
+        return (s.code, s.name, s.total(), s.pct(), s.grade())
+
+    def update_table(self, change: tuple):
+        """Mirror one applied change record in the table without rebuilding it."""
+        kind = change[0]
+        if kind == "insert":
+            _, index, s = change
+            self.tree.insert("", index, iid=str(s.code), values=self.row_values(s))
+        elif kind == "remove":
+            self.tree.delete(str(change[2].code))
+        elif kind == "update":
+            _, index, s = change
+            self.tree.item(str(s.code), values=self.row_values(s))
+        elif kind == "batch":
+            for c in change[1]:
+                self.update_table(c)
+        elif kind == "order":
+            for i, code in enumerate(change[1]):
+                self.tree.move(str(code), "", i)
         self.clear_details()
 
+    def update_chart(self, change: tuple, inverse: tuple):
+        """Move the chart's counts for one applied change (inverse holds what it replaced)."""
+        kind = change[0]
+        if kind == "insert":
+            self.chart.add(change[2])
+        elif kind == "remove":
+            self.chart.remove(change[2])
+        elif kind == "update":
+            self.chart.remove(inverse[2])
+            self.chart.add(change[2])
+        elif kind == "batch":
+            for c, inv in zip(change[1], reversed(inverse[1])):
+                self.update_chart(c, inv)
+
+    @timed
+    def commit(self, change: tuple) -> tuple:
+        """Apply a change to the store, table and chart, save, and return its inverse."""
+        inverse = self.store.apply(change)
+        self.update_table(change)
+        self.update_chart(change, inverse)
+        self.store.save()
+        return inverse
+
     def clear_details(self):
         for v in self.detail_vars.values():
             v.set("")
@@ -257,6 +438,7 @@ class App(tk.Tk):
         if s:
             self.set_details(s)
 
+    @timed
     def view_all_summary(self):
         if not self.store.students:
             messagebox.showinfo("Summary", "No students available.")
@@ -284,11 +466,11 @@ class App(tk.Tk):
         self.tree.see(str(s.code))
         self.set_details(s)
 
+    @timed
     def sort_by_total(self):
-        self.store.students.sort(key=lambda s: s.total(), reverse=not self.sort_asc)
+        ordered = sorted(self.store.students, key=lambda s: s.total(), reverse=not self.sort_asc)
+        self.history.record(self.commit(("order", [s.code for s in ordered])))
         self.sort_asc = not self.sort_asc
-        self.store.save()
-        self.refresh_table()
         order = "ascending" if self.sort_asc else "descending"
         messagebox.showinfo("Sorted", f"Sorted by total score ({order}).")
 
@@ -300,9 +482,7 @@ class App(tk.Tk):
             messagebox.showerror("Error", "Code already exists.")
             return
         s = Student(code, name, c1, c2, c3, exam)
-        self.store.add(s)
-        self.store.save()
-        self.refresh_table()
+        self.history.record(self.commit(("insert", len(self.store.students), s)))
         messagebox.showinfo("Added", "Student added successfully.")
 
     def delete_selected(self):
@@ -313,21 +493,76 @@ class App(tk.Tk):
 
         code = int(sel[0])
         if messagebox.askyesno("Confirm Delete", f"Delete student with code {code}?"):
-            ok = self.store.delete(code)
-            if ok:
-                self.store.save()
-                self.refresh_table()
-                messagebox.showinfo("Deleted", "Student removed.")
+            s = self.store.by_code.get(code)
+            if s:
+                self.history.record(self.commit(("remove", self.store.index_of(code), s)))
+                messagebox.showinfo("Deleted", "Student removed. (Ctrl+Z to undo)")
             else:
                 messagebox.showerror("Error", "Student not found.")
 
+    @timed
+    def apply_revision(self):
+        """Diff a revised marks file against the roster and apply it as one undoable edit."""
+        path = filedialog.askopenfilename(
+            parent=self, title="Revised student marks",
+            filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
+        )
+        if not path:
+            return
+        # the roster is saved after every edit, so its file is the "old" side
+        self.store.save()
+        try:
+            changes = ChangeSet.collect(diff_rosters(self.store.path, path))
+        except OSError as e:
+            messagebox.showerror("Error", f"Could not read {os.path.basename(path)}: {e}")
+            return
+        if not changes:
+            messagebox.showinfo("Apply Revision", "No differences found.")
+            return
+        # check every incoming row before anything in the roster changes
+        bad = [row for row in changes.added + [new for _, new in changes.changed]
+               if not Student(*row).valid()]
+        if bad:
+            messagebox.showerror(
+                "Apply Revision",
+                f"{len(bad)} student(s) in {os.path.basename(path)} have marks out of range "
+                f"(first: code {bad[0][0]}).\nCW must be 0–20 each, Exam must be 0–100. Nothing was changed."
+            )
+            return
+        if messagebox.askyesno("Apply Revision", f"{changes.summary()}.\nApply these changes?"):
+            self.history.record(self.commit(self.store.plan(changes)))
+            messagebox.showinfo("Apply Revision", "Revision applied. (Ctrl+Z to undo)")
+
+    @timed
+    def undo(self):
+        if not self.history.can_undo():
+            return
+        self.history.redo_stack.append(self.commit(self.history.undo_stack.pop()))
+
+    @timed
+    def redo(self):
+        if not self.history.can_redo():
+            return
+        self.history.undo_stack.append(self.commit(self.history.redo_stack.pop()))
+
 
 # ---------------- MAIN ----------------
-def main():
+def build_app(master: tk.Misc) -> App:
+    """Open the table edition as a window of master (used by the launcher too)."""
     base = os.path.dirname(os.path.abspath(__file__))
     path = os.path.join(base, "studentMarks.txt")
     store = StudentStore(path)
-    App(store).mainloop()
+    app = App(store, master=master)
+    install_instrumentation(app, "student_manager_ext")
+    return app
+
+
+def main():
+    root = tk.Tk()
+    root.withdraw()          # the app is a Toplevel; the hidden root just owns it
+    app = build_app(root)
+    app.protocol("WM_DELETE_WINDOW", root.destroy)
+    root.mainloop()
 
 
 if __name__ == "__main__":
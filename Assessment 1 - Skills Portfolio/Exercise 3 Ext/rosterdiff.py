@@ -0,0 +1,296 @@
+"""
+Compare two versions of a studentMarks.txt roster, keyed on student code.
+
+    python rosterdiff.py old.txt new.txt                 # summary + first changes
+    python rosterdiff.py old.txt new.txt --out diff.jsonl
+
+Both files are read as streams of rows (code, name, c1, c2, c3, exam) with
+the same rules as StudentStore.load. The smaller file is loaded into a
+dict keyed on code and the other one is streamed past it (a hash join).
+Matched codes stay in the dict as markers, and codes only the larger file
+has are remembered so their duplicates can be skipped, so memory grows
+with the smaller roster plus the students that were added or removed,
+i.e. with both files in the worst case. That memory goes with the number
+of rows, not the file size: each held row costs about HASH_BYTES_PER_ROW
+(a tuple of five ints and a str plus its dict or set slot, measured at
+300-370 bytes with tracemalloc), five to eight times the ~40-60 bytes it
+takes on disk. So the rows of both files are counted first, and when
+rows * HASH_BYTES_PER_ROW would pass MAX_HASH_MEMORY (256 MiB, about
+670,000 rows across the two files) both are sorted on disk in runs of
+RUN_ROWS and merge-joined instead, which keeps memory flat however large
+they are.
+
+Either way the result is a stream of change records:
+  ("added",   new_row)
+  ("removed", old_row)
+  ("changed", old_row, new_row)
+which the Table Edition applies as one undoable batch. When a code
+appears twice in a file the first row wins and later ones are ignored,
+just as the app refuses to add a code that already exists.
+"""
+import argparse
+import heapq
+import itertools
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator
+
+
+MAX_HASH_MEMORY = 256 * 1024 * 1024  # estimated hash join memory above this uses sort-merge
+HASH_BYTES_PER_ROW = 400            # worst-case memory per row held by the hash join
+RUN_ROWS = 200_000                  # rows per sorted run on disk
+FIELDS = ("code", "name", "c1", "c2", "c3", "exam")
+
+Row = tuple  # (code, name, c1, c2, c3, exam)
+MISSING = object()
+
+
+# ------------------ Reading ------------------
+def parse_row(line: str) -> Row | None:
+    parts = [p.strip() for p in line.split(",")]
+    if len(parts) != 6:
+        return None
+    try:
+        code, name, c1, c2, c3, exam = parts
+        return (int(code), name, int(c1), int(c2), int(c3), int(exam))
+    except ValueError:
+        return None
+
+
+def read_rows(path: str) -> Iterator[Row]:
+    """Stream valid rows; a leading student count line is skipped."""
+    with open(path, "r", encoding="utf-8") as f:
+        first = True
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if first and line.isdigit():
+                first = False
+                continue
+            first = False
+            row = parse_row(line)
+            if row is not None:
+                yield row
+
+
+def count_rows(path: str) -> int:
+    """Line count of a file, read in binary blocks; an upper bound on its rows."""
+    count = 0
+    last = b"\n"
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            count += block.count(b"\n")
+            last = block[-1:]
+    return count + (last != b"\n")
+
+
+def changed_fields(old: Row, new: Row) -> list[str]:
+    return [name for name, a, b in zip(FIELDS, old, new) if a != b]
+
+
+# ------------------ Hash join ------------------
+def hash_diff(old_path: str, new_path: str) -> Iterator[tuple]:
+    """Load the smaller file into a dict and stream the larger one past it."""
+    flipped = os.path.getsize(old_path) > os.path.getsize(new_path)
+    build_path, probe_path = (new_path, old_path) if flipped else (old_path, new_path)
+
+    table: dict[int, Row | None] = {}
+    for row in read_rows(build_path):
+        table.setdefault(row[0], row)
+    unmatched: set[int] = set()       # probe-only codes, to skip their duplicates
+    for row in read_rows(probe_path):
+        code = row[0]
+        other = table.get(code, MISSING)
+        if other is None:             # matched already: a duplicate
+            continue
+        if other is MISSING:
+            if code not in unmatched:
+                unmatched.add(code)
+                yield ("removed", row) if flipped else ("added", row)
+            continue
+        table[code] = None
+        old, new = (row, other) if flipped else (other, row)
+        if old != new:
+            yield ("changed", old, new)
+    for row in table.values():
+        if row is not None:
+            yield ("added", row) if flipped else ("removed", row)
+
+
+# ------------------ External sort-merge ------------------
+def write_run(rows: list, folder: str, n: int) -> str:
+    rows.sort()
+    path = os.path.join(folder, f"run{n}.txt")
+    with open(path, "w", encoding="utf-8") as f:
+        for (code, seq), row in rows:
+            f.write(f"{code},{seq},{','.join(map(str, row[1:]))}\n")
+    return path
+
+
+def read_run(path: str) -> Iterator[tuple]:
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            code, seq, rest = line.rstrip("\n").split(",", 2)
+            yield int(code), int(seq), parse_row(f"{code},{rest}")
+
+
+def sorted_unique(path: str, folder: str, run_rows: int = RUN_ROWS) -> Iterator[Row]:
+    """Rows of `path` in code order, first row per code only, using sorted runs on disk."""
+    runs = []
+    buf = []
+    for seq, row in enumerate(read_rows(path)):
+        buf.append(((row[0], seq), row))
+        if len(buf) >= run_rows:
+            runs.append(write_run(buf, folder, len(runs)))
+            buf = []
+    if buf:
+        runs.append(write_run(buf, folder, len(runs)))
+
+    last = None
+    for code, _, row in heapq.merge(*(read_run(r) for r in runs)):
+        if code != last:
+            last = code
+            yield row
+
+
+def merge_diff(old_path: str, new_path: str, run_rows: int = RUN_ROWS) -> Iterator[tuple]:
+    """Diff two rosters of any size by sorting both on disk and walking them together."""
+    folder = tempfile.mkdtemp(prefix="rosterdiff")
+    try:
+        os.mkdir(os.path.join(folder, "old"))
+        os.mkdir(os.path.join(folder, "new"))
+        old_rows = sorted_unique(old_path, os.path.join(folder, "old"), run_rows)
+        new_rows = sorted_unique(new_path, os.path.join(folder, "new"), run_rows)
+        old = next(old_rows, None)
+        new = next(new_rows, None)
+        while old is not None or new is not None:
+            if new is None or (old is not None and old[0] < new[0]):
+                yield ("removed", old)
+                old = next(old_rows, None)
+            elif old is None or new[0] < old[0]:
+                yield ("added", new)
+                new = next(new_rows, None)
+            else:
+                if old != new:
+                    yield ("changed", old, new)
+                old = next(old_rows, None)
+                new = next(new_rows, None)
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+# ------------------ Change sets ------------------
+def hash_memory(old_path: str, new_path: str) -> int:
+    """Worst-case bytes the hash join needs: every row of both files held at once."""
+    return (count_rows(old_path) + count_rows(new_path)) * HASH_BYTES_PER_ROW
+
+
+def diff_rosters(old_path: str, new_path: str, max_hash_memory: int = MAX_HASH_MEMORY) -> Iterator[tuple]:
+    """Stream change records, picking the hash join whenever its worst case fits in memory."""
+    if hash_memory(old_path, new_path) <= max_hash_memory:
+        return hash_diff(old_path, new_path)
+    return merge_diff(old_path, new_path)
+
+
+@dataclass
+class ChangeSet:
+    added: list[Row] = field(default_factory=list)
+    removed: list[Row] = field(default_factory=list)
+    changed: list[tuple[Row, Row]] = field(default_factory=list)
+
+    @classmethod
+    def collect(cls, changes: Iterable[tuple]) -> "ChangeSet":
+        cs = cls()
+        for change in changes:
+            if change[0] == "added":
+                cs.added.append(change[1])
+            elif change[0] == "removed":
+                cs.removed.append(change[1])
+            else:
+                cs.changed.append((change[1], change[2]))
+        return cs
+
+    def __len__(self) -> int:
+        return len(self.added) + len(self.removed) + len(self.changed)
+
+    def summary(self) -> str:
+        return f"{len(self.added)} added, {len(self.removed)} removed, {len(self.changed)} changed"
+
+
+def to_json(change: tuple) -> str:
+    kind = change[0]
+    if kind == "changed":
+        old, new = change[1], change[2]
+        return json.dumps({"op": kind, "code": old[0], "fields": changed_fields(old, new),
+                           "old": list(old), "new": list(new)})
+    return json.dumps({"op": kind, "code": change[1][0], "row": list(change[1])})
+
+
+# ------------------ CLI ------------------
+def make_roster(path: str, codes: Iterable[int], rng: random.Random, remark: float = 0.0) -> None:
+    """Synthetic roster; marks follow from the code except for a `remark` share of students."""
+    with open(path, "w", encoding="utf-8") as f:
+        for code in codes:
+            exam = rng.randint(0, 100) if rng.random() < remark else code % 101
+            f.write(f"{code},Student {code},{code % 21},{code * 7 % 21},{code * 13 % 21},{exam}\n")
+
+
+def bench(count: int) -> None:
+    folder = tempfile.mkdtemp()
+    old_path = os.path.join(folder, "old.txt")
+    new_path = os.path.join(folder, "new.txt")
+    rng = random.Random(0)
+    codes = list(range(1, count + 1))
+    rng.shuffle(codes)
+    make_roster(old_path, codes, rng)
+    # the revision drops 1% of students, adds 1% new ones and re-marks about 5%
+    make_roster(new_path, itertools.chain(codes[count // 100:], range(count + 1, count + 1 + count // 100)),
+                rng, remark=0.05)
+    for name, fn in (("hash join", hash_diff),
+                     ("sort-merge", lambda a, b: merge_diff(a, b, run_rows=max(1000, count // 20)))):
+        start = time.perf_counter()
+        cs = ChangeSet.collect(fn(old_path, new_path))
+        print(f"{name}: {cs.summary()} in {time.perf_counter() - start:.2f}s")
+    shutil.rmtree(folder, ignore_errors=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Diff two studentMarks.txt rosters by student code.")
+    parser.add_argument("old", nargs="?")
+    parser.add_argument("new", nargs="?")
+    parser.add_argument("--out", help="write every change as a JSON line to this file")
+    parser.add_argument("--bench", type=int, metavar="N", help="time both strategies on N synthetic students")
+    args = parser.parse_args()
+
+    if args.bench:
+        bench(args.bench)
+        return
+    if not (args.old and args.new):
+        parser.error("old and new roster files are required")
+
+    counts = {"added": 0, "removed": 0, "changed": 0}
+    out = open(args.out, "w", encoding="utf-8") if args.out else None
+    try:
+        for change in diff_rosters(args.old, args.new):
+            counts[change[0]] += 1
+            line = to_json(change)
+            if out:
+                out.write(line + "\n")
+            elif sum(counts.values()) <= 20:
+                print(line)
+    finally:
+        if out:
+            out.close()
+    print(f"{counts['added']} added, {counts['removed']} removed, {counts['changed']} changed",
+          file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,15 @@ import tkinter as tk
 from tkinter import messagebox
 from dataclasses import dataclass
 import os
+import sys
+
+# shared helpers (instrument.py, gradechart.py) live in the portfolio folder one level up;
+# launcher.py has already put it on sys.path, a direct run adds it here
+PORTFOLIO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PORTFOLIO not in sys.path:
+    sys.path.append(PORTFOLIO)
+from instrument import timed, install as install_instrumentation  # noqa: E402
+from gradechart import GradeChart  # noqa: E402
 
 # ------------------ Student ------------------
 @dataclass
@@ -100,9 +109,9 @@ class StudentStore:
 
 
 # ------------------ UI ------------------
-class StudentApp(tk.Tk):
-    def __init__(self, store: StudentStore):
-        super().__init__()
+class StudentApp(tk.Toplevel):
+    def __init__(self, store: StudentStore, master: tk.Misc | None = None):
+        super().__init__(master)
         self.store = store
 
         self.title("Student Manager")
@@ -158,6 +167,10 @@ class StudentApp(tk.Tk):
                 justify="left"
             ).pack(fill="x", padx=12, pady=2)
 
+        # Grade distribution of the whole roster
+        self.chart = GradeChart(right, width=340, height=200)
+        self.chart.pack(side="bottom", padx=12, pady=10)
+
         # Search + Actions bar
         actions = tk.Frame(self, bg="#f2f2f2")
         actions.pack(fill="x", padx=10, pady=(0, 10))
@@ -178,10 +191,12 @@ class StudentApp(tk.Tk):
         self.show_message("Select a student from the list.")
 
     # ---------------- Helpers ----------------
+    @timed
     def populate_list(self) -> None:
         self.listbox.delete(0, "end")
         for s in self.store.students:
             self.listbox.insert("end", f"{s.code} - {s.name}")
+        self.chart.reset(self.store.students)
 
     def show_student(self, s: Student) -> None:
         lines = s.as_lines()
@@ -203,6 +218,7 @@ class StudentApp(tk.Tk):
         s = self.store.students[idx]
         self.show_student(s)
 
+    @timed
     def search_code(self) -> None:
         raw = self.search_entry.get().strip()
         if not raw:
@@ -234,6 +250,7 @@ class StudentApp(tk.Tk):
             return
         self.show_student(s)
 
+    @timed
     def view_all_popup(self) -> None:
         if not self.store.students:
             messagebox.showinfo("No Data", "No student records available.")
@@ -270,6 +287,7 @@ class StudentApp(tk.Tk):
         box.insert("end", text)
         box.config(state="disabled")
 
+    @timed
     def reload(self) -> None:
         self.store.load()
         self.populate_list()
@@ -277,11 +295,21 @@ class StudentApp(tk.Tk):
 
 
 # ---------------- Main ----------------
-def main():
+def build_app(master: tk.Misc) -> StudentApp:
+    """Open the Student Manager as a window of master (used by the launcher too)."""
     filepath = os.path.join(os.path.dirname(os.path.abspath(__file__)), "studentMarks.txt")
     store = StudentStore(filepath)
-    app = StudentApp(store)
-    app.mainloop()
+    app = StudentApp(store, master)
+    install_instrumentation(app, "student_manager")
+    return app
+
+
+def main():
+    root = tk.Tk()
+    root.withdraw()          # the app is a Toplevel; the hidden root just owns it
+    app = build_app(root)
+    app.protocol("WM_DELETE_WINDOW", root.destroy)
+    root.mainloop()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,203 @@
+"""
+Grade distribution panel shared by both Student Managers.
+
+Every student's total is a whole number of marks out of 160, so the whole
+distribution fits in 161 counters. Adding or removing a student is one
+counter change; the 10%-wide percentage bins, the per-grade counts and
+the 25th-75th percentile band are all read off those counters, so the
+cost of an update never depends on how many students there are. The
+counters take Student objects and use their own pct() and grade(), so
+the chart always agrees with the table; a total outside 0-160 is left
+out rather than counted in the wrong place.
+
+The chart's canvas items are created once. An update only moves the bars
+whose counts changed (coalesced until the Tk loop is idle, so a batch of
+thousands of edits redraws once) and only rescales every bar when a count
+outgrows the axis or shrinks well below it.
+"""
+import tkinter as tk
+from typing import Iterable
+
+
+MAX_TOTAL = 160
+BINS = 10                       # percentage bins: 0-9%, 10-19%, ..., 90-100%
+GRADES = ("A", "B", "C", "D", "F")
+
+
+def bin_of(pct: float) -> int:
+    return min(int(pct // (100 / BINS)), BINS - 1)
+
+
+# ------------------ Counts ------------------
+class GradeDistribution:
+    """
+    Per-total counters with O(1) updates and O(161) percentile queries.
+    Students are anything with total(), pct() and grade().
+    """
+
+    def __init__(self, students: Iterable = ()):
+        self.reset(students)
+
+    def reset(self, students: Iterable = ()) -> None:
+        self.counts = [0] * (MAX_TOTAL + 1)
+        self.pct_at = [0.0] * (MAX_TOTAL + 1)   # a total's percentage, as the student reported it
+        self.bins = [0] * BINS
+        self.grades = {g: 0 for g in GRADES}
+        self.size = 0
+        for s in students:
+            self.add(s)
+
+    def add(self, student, n: int = 1) -> tuple[int, str] | None:
+        """
+        Count (or with n=-1 uncount) a student; returns the bin and grade it
+        touched, or None for a total outside 0-160, which isn't counted.
+        """
+        total = student.total()
+        if not 0 <= total <= MAX_TOTAL:
+            return None
+        pct, grade = student.pct(), student.grade()
+        b = bin_of(pct)
+        self.counts[total] += n
+        self.pct_at[total] = pct
+        self.bins[b] += n
+        self.grades[grade] += n
+        self.size += n
+        return b, grade
+
+    def remove(self, student) -> tuple[int, str] | None:
+        return self.add(student, -1)
+
+    def percentile(self, q: float) -> float:
+        """Percentage score below which a share q of the students fall."""
+        if not self.size:
+            return 0.0
+        target = q * self.size
+        seen = 0
+        for t, c in enumerate(self.counts):
+            seen += c
+            if seen >= target and c:
+                return self.pct_at[t]
+        return 100.0
+
+
+# ------------------ Chart ------------------
+class GradeChart(tk.Canvas):
+    """Percentage histogram plus per-grade bars, drawn from a GradeDistribution."""
+
+    BAR = "#4c57ff"
+    BAND = "#dfe2ff"
+
+    def __init__(self, master: tk.Misc, width: int = 300, height: int = 220, **kw):
+        super().__init__(master, width=width, height=height, bg="white", highlightthickness=0, **kw)
+        self.dist = GradeDistribution()
+        self.w, self.h = width, height
+        self.scale_max = 1
+        self.dirty_bins: set[int] = set()
+        self.dirty_grades: set[str] = set()
+        self.pending = None
+
+        # layout: histogram on the left two thirds, grade bars on the right
+        self.top, self.base = 24, height - 22
+        self.hist_x0, self.hist_x1 = 8, int(width * 0.64)
+        self.grade_x0, self.grade_x1 = int(width * 0.70), width - 8
+
+        self.create_text(self.hist_x0, 10, text="Percentage", anchor="w", font=("Segoe UI", 9, "bold"))
+        self.create_text(self.grade_x0, 10, text="Grades", anchor="w", font=("Segoe UI", 9, "bold"))
+        self.band = self.create_rectangle(0, self.top, 0, self.base, fill=self.BAND, outline="")
+        self.median = self.create_line(0, self.top, 0, self.base, fill="#ff6347", dash=(3, 2))
+        self.band_label = self.create_text(self.hist_x0, self.h - 8, anchor="w", font=("Segoe UI", 8))
+
+        step = (self.hist_x1 - self.hist_x0) / BINS
+        self.bin_items = []
+        for i in range(BINS):
+            x0 = self.hist_x0 + i * step
+            bar = self.create_rectangle(x0 + 1, self.base, x0 + step - 1, self.base, fill=self.BAR, outline="")
+            self.bin_items.append((bar, x0 + 1, x0 + step - 1))
+
+        step = (self.grade_x1 - self.grade_x0) / len(GRADES)
+        self.grade_items = {}
+        for i, g in enumerate(GRADES):
+            x0 = self.grade_x0 + i * step
+            bar = self.create_rectangle(x0 + 2, self.base, x0 + step - 2, self.base, fill=self.BAR, outline="")
+            count = self.create_text(x0 + step / 2, self.base, anchor="s", font=("Segoe UI", 8))
+            self.create_text(x0 + step / 2, self.base + 2, text=g, anchor="n", font=("Segoe UI", 9, "bold"))
+            self.grade_items[g] = (bar, count, x0 + 2, x0 + step - 2)
+        self.tag_lower(self.band)
+
+        self.redraw_all()
+
+    # -------------- updates --------------
+    def reset(self, students: Iterable) -> None:
+        self.dist.reset(students)
+        self.redraw_all()
+
+    def add(self, student) -> None:
+        self.mark(self.dist.add(student))
+
+    def remove(self, student) -> None:
+        self.mark(self.dist.remove(student))
+
+    def mark(self, touched: tuple[int, str] | None) -> None:
+        if touched is None:
+            return
+        b, g = touched
+        self.dirty_bins.add(b)
+        self.dirty_grades.add(g)
+        if self.pending is None:
+            self.pending = self.after_idle(self.flush)
+
+    def flush(self) -> None:
+        """Redraw only what changed since the last flush."""
+        self.pending = None
+        peak = max(max(self.dist.bins), max(self.dist.grades.values()), 1)
+        if peak > self.scale_max or peak < self.scale_max // 4:
+            self.redraw_all()
+            return
+        for b in self.dirty_bins:
+            self.draw_bin(b)
+        for g in self.dirty_grades:
+            self.draw_grade(g)
+        self.dirty_bins.clear()
+        self.dirty_grades.clear()
+        self.draw_band()
+
+    # -------------- drawing --------------
+    def bar_top(self, count: int) -> float:
+        return self.base - (self.base - self.top - 12) * count / self.scale_max
+
+    def draw_bin(self, b: int) -> None:
+        bar, x0, x1 = self.bin_items[b]
+        self.coords(bar, x0, self.bar_top(self.dist.bins[b]), x1, self.base)
+
+    def draw_grade(self, g: str) -> None:
+        bar, label, x0, x1 = self.grade_items[g]
+        count = self.dist.grades[g]
+        y = self.bar_top(count)
+        self.coords(bar, x0, y, x1, self.base)
+        self.coords(label, (x0 + x1) / 2, y - 1)
+        self.itemconfig(label, text=str(count) if count else "")
+
+    def draw_band(self) -> None:
+        width = self.hist_x1 - self.hist_x0
+        if not self.dist.size:
+            self.coords(self.band, 0, 0, 0, 0)
+            self.coords(self.median, 0, 0, 0, 0)
+            self.itemconfig(self.band_label, text="No students")
+            return
+        lo, mid, hi = (self.dist.percentile(q) for q in (0.25, 0.5, 0.75))
+        x = lambda p: self.hist_x0 + width * p / 100
+        self.coords(self.band, x(lo), self.top, x(hi), self.base)
+        self.coords(self.median, x(mid), self.top, x(mid), self.base)
+        self.itemconfig(self.band_label, text=f"Middle 50%: {lo:g}-{hi:g}%  median {mid:g}%")
+
+    def redraw_all(self) -> None:
+        peak = max(max(self.dist.bins), max(self.dist.grades.values()), 1)
+        # headroom so a few more students don't force a full rescale
+        self.scale_max = max(4, 1 << (peak + peak // 4).bit_length())
+        for b in range(BINS):
+            self.draw_bin(b)
+        for g in GRADES:
+            self.draw_grade(g)
+        self.dirty_bins.clear()
+        self.dirty_grades.clear()
+        self.draw_band()
@@ -0,0 +1,156 @@
+"""
+Opt-in timing for the Tk event handlers used by the portfolio apps.
+
+Run any app with PORTFOLIO_PROFILE=1 to switch it on. Wrapped callbacks
+then record a latency histogram, widget and canvas item creations are
+counted, a small overlay shows the slowest handlers, and everything is
+written to JSON on exit (PORTFOLIO_PROFILE_OUT, default profile_<app>.json).
+
+When the variable is not set `timed` returns the function untouched and
+`install` returns straight away, so a disabled build pays nothing.
+"""
+import atexit
+import json
+import os
+import time
+import tkinter as tk
+from functools import wraps
+
+
+ENABLED = os.environ.get("PORTFOLIO_PROFILE", "") not in ("", "0")
+
+BUCKETS = 24  # bucket i holds calls that took < 2**i microseconds (up to ~8s)
+
+handler_stats: dict[str, dict] = {}
+widgets_created: dict[str, int] = {}
+canvas_items_created = 0
+_installed = False
+
+
+# ------------------ Recording ------------------
+def record(name: str, seconds: float) -> None:
+    st = handler_stats.get(name)
+    if st is None:
+        st = handler_stats[name] = {"calls": 0, "total": 0.0, "max": 0.0, "buckets": [0] * BUCKETS}
+    st["calls"] += 1
+    st["total"] += seconds
+    if seconds > st["max"]:
+        st["max"] = seconds
+    bucket = min(int(seconds * 1_000_000).bit_length(), BUCKETS - 1)
+    st["buckets"][bucket] += 1
+
+
+def timed(fn=None, *, name: str | None = None):
+    """Decorator that times every call of a callback (no-op when disabled)."""
+    if fn is None:
+        return lambda f: timed(f, name=name)
+    if not ENABLED:
+        return fn
+
+    label = name or fn.__qualname__
+
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            record(label, time.perf_counter() - start)
+
+    return wrapper
+
+
+def percentile_ms(buckets: list[int], q: float) -> float:
+    """Approximate percentile from the log2 histogram (upper bucket edge)."""
+    total = sum(buckets)
+    if not total:
+        return 0.0
+    target = q * total
+    seen = 0
+    for i, count in enumerate(buckets):
+        seen += count
+        if seen >= target:
+            return (2 ** i) / 1000
+    return (2 ** (BUCKETS - 1)) / 1000
+
+
+def summary() -> dict:
+    handlers = {}
+    for name, st in handler_stats.items():
+        handlers[name] = {
+            "calls": st["calls"],
+            "total_ms": round(st["total"] * 1000, 3),
+            "mean_ms": round(st["total"] * 1000 / st["calls"], 3),
+            "max_ms": round(st["max"] * 1000, 3),
+            "p50_ms": percentile_ms(st["buckets"], 0.50),
+            "p95_ms": percentile_ms(st["buckets"], 0.95),
+            "histogram_us": {f"<{2 ** i}": c for i, c in enumerate(st["buckets"]) if c},
+        }
+    return {
+        "handlers": handlers,
+        "widgets_created": dict(widgets_created),
+        "canvas_items_created": canvas_items_created,
+    }
+
+
+def dump(path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(summary(), f, indent=2)
+    print("Profile written to", path)
+
+
+# ------------------ Tk hooks ------------------
+def _patch_tk() -> None:
+    """Count widget and canvas item creation by wrapping Tk's constructors."""
+    original_setup = tk.BaseWidget._setup
+    original_create = tk.Canvas._create
+
+    def counting_setup(self, master, cnf):
+        cls = type(self).__name__
+        widgets_created[cls] = widgets_created.get(cls, 0) + 1
+        return original_setup(self, master, cnf)
+
+    def counting_create(self, item_type, args, kw):
+        global canvas_items_created
+        canvas_items_created += 1
+        return original_create(self, item_type, args, kw)
+
+    tk.BaseWidget._setup = counting_setup
+    tk.Canvas._create = counting_create
+
+
+def overlay_text() -> str:
+    slowest = sorted(handler_stats.items(), key=lambda kv: kv[1]["total"], reverse=True)[:3]
+    lines = [
+        f"{name.split('.')[-1]}: {st['calls']}x p95 {percentile_ms(st['buckets'], 0.95):g}ms"
+        for name, st in slowest
+    ]
+    lines.append(f"widgets {sum(widgets_created.values())}  items {canvas_items_created}")
+    return "\n".join(lines)
+
+
+def install(root: tk.Misc, app_name: str) -> None:
+    """Attach the overlay to root and dump stats on exit (only when enabled)."""
+    global _installed
+    if not ENABLED:
+        return
+
+    if not _installed:
+        _patch_tk()
+        _installed = True
+
+    overlay = tk.Label(root, text="", justify="left", anchor="w",
+                       font=("Courier", 8), bg="#111111", fg="#A8FF60")
+    overlay.place(relx=1.0, rely=1.0, anchor="se")
+
+    def refresh():
+        if not overlay.winfo_exists():
+            return
+        overlay.config(text=overlay_text())
+        overlay.lift()
+        root.after(500, refresh)
+
+    refresh()
+
+    out = os.environ.get("PORTFOLIO_PROFILE_OUT", f"profile_{app_name}.json")
+    atexit.register(dump, out)
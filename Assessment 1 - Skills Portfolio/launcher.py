@@ -0,0 +1,201 @@
+"""
+One launcher for every app in the portfolio.
+
+A single Tk root shows a button per app. An app's module is only imported
+the first time its button is pressed (from its own folder, which is put
+on sys.path so its sibling modules resolve), and it is then built inside a
+window owned by the launcher's root. Pillow stays unimported unless the
+Maths Quiz actually has to resize its background.
+
+Import and build times for every launch are shown in the launcher and
+printed, so a slow import is visible straight away.
+
+The portfolio folder (instrument.py, gradechart.py) is put on sys.path
+here; each app also adds it itself when its script is run directly, so
+every exercise still runs on its own. One app can be started from here
+too:
+
+    python launcher.py                 # the launcher window
+    python launcher.py quiz            # just one app, through its main()
+    python launcher.py jokes more.txt  # arguments after the app go to it
+    python launcher.py --importtime    # -X importtime breakdown per app (no window)
+"""
+import argparse
+import importlib.util
+import os
+import subprocess
+import sys
+import time
+import tkinter as tk
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+MARKER = "-- app imports start --"
+if HERE not in sys.path:
+    sys.path.insert(0, HERE)
+
+# key: (button label, script, entry point, launcher makes the Toplevel?)
+# With the flag set, entry(toplevel) builds into a window the launcher made;
+# otherwise entry(root) creates and returns the app's own Toplevel.
+APPS = {
+    "quiz": ("Maths Quiz", os.path.join("Excercise 1", "Excercise1.py"), "buildApp", True),
+    "jokes": ("Joke Assistant", os.path.join("Exercise 2", "exercise2.py"), "build_app", True),
+    "students": ("Student Manager", os.path.join("Exercise 3", "Exerciee3.py"), "build_app", False),
+    "students_ext": ("Student Manager (Table)", os.path.join("Exercise 3 Ext", "Exercise3 Ext.py"),
+                     "build_app", False),
+}
+
+
+# ------------------ Loading ------------------
+def module_name(key: str) -> str:
+    return f"portfolio_{key}"
+
+
+def load_app_module(key: str):
+    """Import an app's script by path (once); returns (module, seconds spent importing)."""
+    name = module_name(key)
+    if name in sys.modules:
+        return sys.modules[name], 0.0
+    path = os.path.join(HERE, APPS[key][1])
+    folder = os.path.dirname(path)
+    if folder not in sys.path:
+        sys.path.insert(0, folder)
+
+    start = time.perf_counter()
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module      # dataclasses look the module up while it executes
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module, time.perf_counter() - start
+
+
+def import_report(key: str, top: int = 8) -> str:
+    """
+    Import one app in a fresh interpreter under -X importtime and list the
+    slowest top-level imports (cumulative microseconds).
+    """
+    path = os.path.join(HERE, APPS[key][1])
+    code = (
+        "import importlib.util, os, sys\n"
+        f"path = {path!r}\n"
+        f"sys.path.insert(0, {HERE!r})\n"
+        "sys.path.insert(0, os.path.dirname(path))\n"
+        f"spec = importlib.util.spec_from_file_location({module_name(key)!r}, path)\n"
+        "module = importlib.util.module_from_spec(spec)\n"
+        "sys.modules[spec.name] = module\n"
+        f"sys.stderr.write({MARKER!r} + '\\n')\n"
+        "spec.loader.exec_module(module)\n"
+    )
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                          capture_output=True, text=True)
+    # only count what the app imports, not interpreter startup or this harness
+    stderr = proc.stderr.split(MARKER, 1)[-1]
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, package = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue                    # the header line
+        if not package.startswith("  "):   # nested imports are indented further
+            rows.append((int(cumulative), package.strip()))
+    rows.sort(reverse=True)
+    lines = [f"{APPS[key][0]}: {sum(us for us, _ in rows) / 1000:.1f} ms in top-level imports"]
+    lines += [f"  {us / 1000:8.1f} ms  {pkg}" for us, pkg in rows[:top]]
+    if proc.returncode:
+        lines.append("  import failed:\n" + proc.stderr.strip().splitlines()[-1])
+    return "\n".join(lines)
+
+
+# ------------------ Launcher UI ------------------
+class Launcher:
+    def __init__(self, root: tk.Tk):
+        self.root = root
+        self.windows: dict[str, tk.Misc] = {}
+
+        root.title("Skills Portfolio")
+        root.geometry("420x380")
+        root.configure(bg="#f2f2f2")
+
+        tk.Label(
+            root, text="Skills Portfolio",
+            bg="#4c57ff", fg="white",
+            font=("Segoe UI", 18, "bold"),
+            pady=10
+        ).pack(fill="x")
+
+        for key, (label, *_) in APPS.items():
+            tk.Button(
+                root, text=label, width=26,
+                font=("Segoe UI", 11, "bold"),
+                command=lambda k=key: self.open(k)
+            ).pack(pady=5)
+
+        self.report = tk.Label(root, text="", justify="left", anchor="w",
+                               font=("Courier", 9), bg="#f2f2f2")
+        self.report.pack(fill="x", padx=10, pady=10)
+        self.timings: dict[str, str] = {}
+
+    def open(self, key: str) -> None:
+        """Show an app, importing and building it on first use."""
+        win = self.windows.get(key)
+        if win is not None and win.winfo_exists():
+            win.deiconify()
+            win.lift()
+            return
+
+        label, _, entry, make_toplevel = APPS[key]
+        module, import_seconds = load_app_module(key)
+        start = time.perf_counter()
+        if make_toplevel:
+            win = tk.Toplevel(self.root)
+            getattr(module, entry)(win)
+        else:
+            win = getattr(module, entry)(self.root)
+        win.update_idletasks()           # include first layout in the build time
+        build_seconds = time.perf_counter() - start
+        self.windows[key] = win
+
+        line = f"{label[:24]:<24} import {import_seconds * 1000:7.1f} ms  build {build_seconds * 1000:7.1f} ms"
+        print(line)
+        self.timings[key] = line
+        self.report.config(text="\n".join(self.timings.values()))
+
+
+def run_app(key: str, argv: list[str]) -> None:
+    """Run one app on its own, as if its script had been started with argv."""
+    module, _ = load_app_module(key)
+    sys.argv = [os.path.join(HERE, APPS[key][1])] + argv
+    module.main()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Launch the portfolio apps from one window.")
+    parser.add_argument("app", nargs="?", choices=APPS, help="run just this app")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="arguments for the app")
+    parser.add_argument("--importtime", action="store_true",
+                        help="print a -X importtime breakdown for every app and exit")
+    args = parser.parse_args()
+
+    if args.importtime:
+        for key in APPS:
+            print(import_report(key))
+        return
+    if args.app:
+        run_app(args.app, args.args)
+        return
+
+    start = time.perf_counter()
+    root = tk.Tk()
+    Launcher(root)
+    root.update_idletasks()
+    print(f"launcher ready in {(time.perf_counter() - start) * 1000:.1f} ms")
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+"""
+Long-run soak test for the portfolio's Tk apps.
+
+Each app is built under one hidden Tk root (the launcher's loading code is
+reused) and driven through thousands of cycles: a full quiz play and back
+to the menu, a round of jokes, View All popups opened and closed, or an
+add/delete/sort/undo/redo round on the Table Edition. Message boxes and
+file dialogs are patched to answer immediately, and every file the apps
+write goes to a temporary folder, never the real data files.
+
+Every --every cycles it records traced Python memory (tracemalloc), live
+Tk widgets, canvas items and Tcl commands (leaked after() callbacks and
+widget commands show up there). The baseline is taken after the warm-up
+and one more cycle run with tracing on, so first-use allocations aren't
+mistaken for leaks. Growth per cycle above
+the thresholds fails the run and prints the allocation sites that grew
+the most.
+
+Needs a display: run under Xvfb (xvfb-run python soak.py) or on a
+desktop. Without DISPLAY it starts Xvfb itself if it is installed, and
+otherwise skips with a message.
+
+    python soak.py                        # every app, 2000 cycles each
+    python soak.py quiz students_ext --cycles 5000 --every 250
+"""
+import argparse
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tkinter as tk
+import tracemalloc
+from functools import partial
+from tkinter import filedialog, messagebox
+
+from launcher import APPS, HERE, load_app_module
+
+
+MAX_BYTES_PER_CYCLE = 512      # traced Python memory
+MAX_WIDGETS_PER_CYCLE = 0.01   # i.e. no more than one leaked widget per 100 cycles
+MAX_ITEMS_PER_CYCLE = 0.01     # canvas items
+MAX_COMMANDS_PER_CYCLE = 0.01  # Tcl commands (callbacks, widget commands)
+WARMUP_CYCLES = 50
+
+
+# ------------------ Environment ------------------
+def ensure_display():
+    """Return (ok, Xvfb process or None, message)."""
+    if os.name == "nt" or sys.platform == "darwin" or os.environ.get("DISPLAY"):
+        return True, None, ""
+    xvfb = shutil.which("Xvfb")
+    if not xvfb:
+        return False, None, "no DISPLAY and Xvfb is not installed; skipping soak test"
+    display = ":99"
+    proc = subprocess.Popen([xvfb, display, "-screen", "0", "1280x1024x24", "-nolisten", "tcp"],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    os.environ["DISPLAY"] = display
+    for _ in range(50):                 # wait up to 5 s for the server to accept clients
+        try:
+            tk.Tk().destroy()
+            return True, proc, f"started Xvfb on {display}"
+        except tk.TclError:
+            time.sleep(0.1)
+    proc.terminate()
+    return False, None, "Xvfb did not start; skipping soak test"
+
+
+def patch_dialogs():
+    """Make every dialog answer straight away (OK / Yes / no file)."""
+    for name in ("showinfo", "showwarning", "showerror"):
+        setattr(messagebox, name, lambda *a, **kw: "ok")
+    for name in ("askyesno", "askokcancel", "askretrycancel"):
+        setattr(messagebox, name, lambda *a, **kw: True)
+    filedialog.askopenfilename = lambda *a, **kw: ""
+
+
+# ------------------ Measuring ------------------
+def count_widgets(widget: tk.Misc) -> tuple[int, int]:
+    """(widgets, canvas items) in the tree below widget."""
+    widgets, items = 0, 0
+    for child in widget.winfo_children():
+        w, i = count_widgets(child)
+        widgets += 1 + w
+        items += i
+    if isinstance(widget, tk.Canvas):
+        items += len(widget.find_all())
+    return widgets, items
+
+
+def sample(root: tk.Tk) -> dict:
+    widgets, items = count_widgets(root)
+    return {
+        "bytes": tracemalloc.get_traced_memory()[0],
+        "widgets": widgets,
+        "items": items,
+        "commands": len(root.tk.splitlist(root.tk.call("info", "commands"))),
+    }
+
+
+# ------------------ Drivers ------------------
+# Each driver builds its app inside `root` with data files in `tmp` and
+# returns (run one cycle, clean up).
+def close_popups(app: tk.Misc) -> None:
+    for child in app.winfo_children():
+        if isinstance(child, tk.Toplevel):
+            child.destroy()
+
+
+def find_button(widget: tk.Misc, text: str) -> tk.Button:
+    for child in widget.winfo_children():
+        if isinstance(child, tk.Button) and child.cget("text") == text:
+            return child
+        found = find_button(child, text)
+        if found is not None:
+            return found
+    return None
+
+
+def drive_quiz(root, tmp):
+    m, _ = load_app_module("quiz")
+    # keep attempt/leaderboard files out of the app folder
+    m.AttemptLogger = partial(m.AttemptLogger, os.path.join(tmp, "attempts.csv"))
+    m.Leaderboard = partial(m.Leaderboard, os.path.join(tmp, "leaderboard.csv"))
+    # an absolute cache dir wins over the script folder in os.path.join
+    m.BG_CACHE_DIR = os.path.join(tmp, "bgcache")
+    win = tk.Toplevel(root)
+    m.buildApp(win)
+    rng = random.Random(0)
+    levels = ("easy", "medium", "hard")
+
+    def cycle(i):
+        m.startQuiz(levels[i % 3])
+        while not m.session.finished:
+            given = m.session.answer if rng.random() < 0.8 else m.session.answer + 1
+            m.answerEntry.delete(0, "end")
+            m.answerEntry.insert(0, str(given))
+            m.isCorrect()
+        m.displayMenu()
+
+    return cycle, m.closeStores
+
+
+def drive_jokes(root, tmp):
+    m, _ = load_app_module("jokes")
+    src = os.path.join(HERE, "Exercise 2", "randomJokes.txt")
+    jokes = shutil.copy(src, os.path.join(tmp, "randomJokes.txt"))
+    win = tk.Toplevel(root)
+    before = set(threading.enumerate())
+    m.build_app(win, jokes)
+    # let the loader thread finish so its work isn't counted as growth
+    loaders = set(threading.enumerate()) - before
+    deadline = time.monotonic() + 60
+    while any(t.is_alive() for t in loaders) and time.monotonic() < deadline:
+        root.update()
+        time.sleep(0.01)
+    for _ in range(10):
+        root.update()
+        time.sleep(0.04)
+    buttons = [find_button(win, t) for t in ("Next Joke", "Show Punchline", "Thumbs Up", "Thumbs Down")]
+
+    def cycle(i):
+        for b in buttons:
+            b.invoke()
+    return cycle, None
+
+
+def student_store(m, tmp, folder):
+    path = os.path.join(tmp, f"{folder}.txt")
+    shutil.copy(os.path.join(HERE, folder, "studentMarks.txt"), path)
+    return m.StudentStore(path)
+
+
+def drive_students(root, tmp):
+    m, _ = load_app_module("students")
+    app = m.StudentApp(student_store(m, tmp, "Exercise 3"), root)
+
+    def cycle(i):
+        app.view_all_popup()
+        app.show_highest()
+        app.show_lowest()
+        app.reload()
+        close_popups(app)
+    return cycle, None
+
+
+def drive_students_ext(root, tmp):
+    m, _ = load_app_module("students_ext")
+    app = m.App(student_store(m, tmp, "Exercise 3 Ext"), master=root)
+    rng = random.Random(0)
+
+    def cycle(i):
+        code = 100000 + i
+        app._add_submit(code, f"Soak {i}", rng.randint(0, 20), rng.randint(0, 20),
+                        rng.randint(0, 20), rng.randint(0, 100))
+        app.sort_by_total()
+        app.tree.selection_set(str(code))
+        app.delete_selected()
+        app.undo()
+        app.redo()
+        app.view_all_summary()
+    return cycle, None
+
+
+DRIVERS = {
+    "quiz": drive_quiz,
+    "jokes": drive_jokes,
+    "students": drive_students,
+    "students_ext": drive_students_ext,
+}
+
+
+# ------------------ Soak loop ------------------
+def soak(key, cycles, every, limits):
+    """Drive one app; returns True if it stayed inside every limit."""
+    root = tk.Tk()
+    root.withdraw()
+    tmp = tempfile.mkdtemp(prefix=f"soak_{key}_")
+    close = None
+    try:
+        cycle, close = DRIVERS[key](root, tmp)
+        for i in range(WARMUP_CYCLES):
+            cycle(i)
+            root.update()
+        tracemalloc.start(10)
+        cycle(WARMUP_CYCLES)            # traced warm-up: caches filled under tracing don't count
+        root.update()
+        first = sample(root)
+        snapshot = tracemalloc.take_snapshot()
+        start = time.perf_counter()
+        last = first
+        for i in range(1, cycles + 1):
+            cycle(WARMUP_CYCLES + 1 + i)
+            root.update()
+            if i % every == 0 or i == cycles:
+                last = sample(root)
+                print(f"  {APPS[key][0]:<24} cycle {i:>6}: {last['bytes'] / 1024:8.1f} KiB  "
+                      f"widgets {last['widgets']:>4}  items {last['items']:>4}  tcl cmds {last['commands']:>5}")
+        took = time.perf_counter() - start
+
+        growth = {k: (last[k] - first[k]) / cycles for k in first}
+        failed = [k for k in growth if growth[k] > limits[k]]
+        print(f"{APPS[key][0]}: {cycles} cycles in {took:.1f}s, per cycle: "
+              + ", ".join(f"{k} {growth[k]:+.3f}" for k in growth)
+              + ("  FAIL (" + ", ".join(failed) + ")" if failed else "  ok"))
+        if failed:
+            top = tracemalloc.take_snapshot().compare_to(snapshot, "lineno")[:10]
+            print("  largest allocation growth:")
+            for stat in top:
+                print("   ", stat)
+        return not failed
+    finally:
+        tracemalloc.stop()
+        if close:
+            close()
+        root.destroy()
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Soak-test the portfolio apps for leaks.")
+    parser.add_argument("apps", nargs="*", metavar="app",
+                        help=f"apps to drive ({', '.join(DRIVERS)}); default all")
+    parser.add_argument("--cycles", type=int, default=2000)
+    parser.add_argument("--every", type=int, default=200, help="cycles between samples")
+    parser.add_argument("--max-bytes-per-cycle", type=float, default=MAX_BYTES_PER_CYCLE)
+    args = parser.parse_args()
+    unknown = [a for a in args.apps if a not in DRIVERS]
+    if unknown:
+        parser.error(f"unknown app: {', '.join(unknown)}")
+
+    ok, xvfb, message = ensure_display()
+    if message:
+        print(message)
+    if not ok:
+        return 0
+    patch_dialogs()
+    limits = {"bytes": args.max_bytes_per_cycle, "widgets": MAX_WIDGETS_PER_CYCLE,
+              "items": MAX_ITEMS_PER_CYCLE, "commands": MAX_COMMANDS_PER_CYCLE}
+    try:
+        results = [soak(key, args.cycles, args.every, limits) for key in (args.apps or DRIVERS)]
+    finally:
+        if xvfb:
+            xvfb.terminate()
+    return 0 if all(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,25 @@
+"""
+The apps live in folders with spaces in their names, so they can't be
+imported as packages: put the portfolio folder and every app folder on
+sys.path instead, the same way launcher.py does.
+"""
+import importlib.util
+import os
+import sys
+
+HERE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for folder in ("", "Excercise 1", "Exercise 2", "Exercise 3", "Exercise 3 Ext"):
+    path = os.path.join(HERE, folder)
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+
+def load_script(name, relpath):
+    """Import an app script whose file name isn't a valid module name."""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, os.path.join(HERE, relpath))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,50 @@
+import random
+
+from adaptive import DIGIT_RANGES, AdaptiveEngine
+
+
+def test_questions_match_the_current_digits():
+    engine = AdaptiveEngine(rng=random.Random(0), startDigits=3)
+    lo, hi = DIGIT_RANGES[3]
+    for _ in range(200):
+        num1, op, num2, answer = engine.nextQuestion()
+        assert lo <= num1 <= hi and lo <= num2 <= hi
+        assert answer == (num1 + num2 if op == "+" else num1 - num2)
+
+
+def test_fast_right_answers_step_up_after_patience():
+    engine = AdaptiveEngine(rng=random.Random(0), patience=3)
+    engine.record("+", True, 2.0)
+    engine.record("+", True, 2.0)
+    assert engine.digits == 1
+    engine.record("+", True, 2.0)
+    assert engine.digits == 2 and engine.streak == 0
+    for _ in range(20):
+        engine.record("+", True, 1.0)
+    assert engine.digits == max(DIGIT_RANGES)
+
+
+def test_wrong_answers_step_down_but_not_below_one_digit():
+    engine = AdaptiveEngine(rng=random.Random(0), startDigits=3, patience=3)
+    for _ in range(4):
+        engine.record("-", False, 5.0)
+    assert engine.digits == 2
+    for _ in range(20):
+        engine.record("-", False, 5.0)
+    assert engine.digits == min(DIGIT_RANGES)
+
+
+def test_slow_answers_step_down_even_when_right():
+    engine = AdaptiveEngine(rng=random.Random(0), startDigits=2, targetSeconds=5.0, patience=2)
+    for _ in range(10):
+        engine.record("+", True, 60.0)
+    assert engine.digits == 1
+
+
+def test_weaker_operation_comes_up_more_often():
+    engine = AdaptiveEngine(rng=random.Random(1))
+    for _ in range(10):
+        engine.record("-", False, 3.0)
+        engine.record("+", True, 3.0)
+    ops = [engine.nextQuestion()[1] for _ in range(2000)]
+    assert 0.75 < ops.count("-") / len(ops) <= 0.85
@@ -0,0 +1,54 @@
+import csv
+import math
+
+from attemptlog import FIELDS, AttemptLogger, Summary, analyse
+
+
+def test_logger_writes_header_once_and_every_row(tmp_path):
+    path = str(tmp_path / "attempts.csv")
+    log = AttemptLogger(path, batchSize=4, flushSeconds=0.05)
+    for i in range(10):
+        log.log("Ann", "easy", f"{i} + 1", "+", i + 1, i + 1, 1, 2.5)
+    log.close()
+    log = AttemptLogger(path, batchSize=4, flushSeconds=0.05)   # reopen: appends, no second header
+    log.log("Bob", "hard", "1000 - 1", "-", 1, 999, 2, 10.0)
+    log.close()
+
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == list(FIELDS)
+    assert [r[1] for r in rows[1:]] == ["Ann"] * 10 + ["Bob"]
+    assert rows[1][8:] == ["2500.0", "1"] and rows[-1][8:] == ["10000.0", "0"]
+
+
+def test_summary_percentiles_within_a_bucket():
+    s = Summary()
+    for ms in range(1, 1001):
+        s.add(float(ms), ms % 4 != 0)
+    assert s.answers == 1000 and s.right == 750
+    for q, exact in ((0.5, 500), (0.9, 900), (0.99, 990)):
+        assert exact <= s.percentile(q) <= exact * 1.05 ** 2
+    assert Summary().percentile(0.5) == 0.0
+    assert "75.0%" in s.row("all")
+
+
+def test_analyse_groups_by_op_difficulty_and_player(tmp_path):
+    path = str(tmp_path / "attempts.csv")
+    log = AttemptLogger(path)
+    log.log("Ann", "easy", "1 + 1", "+", 2, 2, 1, 1.0)
+    log.log("Ann", "hard", "9 - 1", "-", 7, 8, 1, 4.0)
+    log.log("Bob", "easy", "2 - 1", "-", 1, 1, 1, 2.0)
+    log.close()
+
+    groups = analyse(path)
+    assert {k: (g.answers, g.right) for k, g in groups.items()} == {
+        "op +": (1, 1), "op -": (2, 1), "easy": (2, 2), "hard": (1, 0), "all": (3, 2)}
+    ann = analyse(path, player="Ann")
+    assert ann["all"].answers == 2 and "op +" in ann and ann["op -"].right == 0
+    assert math.isclose(ann["hard"].percentile(1.0), 4000, rel_tol=0.06)
+
+
+def test_analyse_empty_log(tmp_path):
+    path = tmp_path / "attempts.csv"
+    path.write_text("", encoding="utf-8")
+    assert analyse(str(path)) == {}
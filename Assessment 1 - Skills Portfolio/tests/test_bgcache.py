@@ -0,0 +1,16 @@
+import os
+
+from conftest import load_script
+
+quiz = load_script("portfolio_quiz", "Excercise 1/Excercise1.py")
+
+
+def test_trim_drops_old_versions_then_least_recently_used(tmp_path):
+    names = ["bg_10x10_old.png"] + [f"bg_{n}x{n}_new.png" for n in (1, 2, 3, 4)]
+    for age, name in enumerate(names):
+        path = tmp_path / name
+        path.write_bytes(b"png")
+        os.utime(path, ns=(age * 10**9, age * 10**9))   # later in the list = used more recently
+
+    quiz.trimBackgroundCache(str(tmp_path), "new.png", keep=2)
+    assert sorted(os.listdir(tmp_path)) == ["bg_3x3_new.png", "bg_4x4_new.png"]
@@ -0,0 +1,29 @@
+import queue
+
+from conftest import load_script
+
+app = load_script("portfolio_jokes", "Exercise 2/exercise2.py")
+
+
+def drain(inbox):
+    msgs = []
+    while not inbox.empty():
+        msgs.append(inbox.get_nowait())
+    return msgs
+
+
+def test_loader_posts_jokes_then_done(tmp_path):
+    path = tmp_path / "jokes.txt"
+    path.write_text("Why did the chicken cross the road?To get across.\n", encoding="utf-8")
+    inbox = queue.Queue()
+    app.load_in_background(str(path), inbox)
+    kinds = [m[0] for m in drain(inbox)]
+    assert kinds[0] == "first" and "ready" in kinds and kinds[-1] == "done"
+
+
+def test_loader_reports_any_failure(tmp_path):
+    inbox = queue.Queue()
+    app.load_in_background(str(tmp_path), inbox)    # a folder, not a file
+    msgs = drain(inbox)
+    assert msgs[-1] == ("done",)
+    assert [m[0] for m in msgs[:-1]] == ["error"]
@@ -0,0 +1,35 @@
+from conftest import load_script
+from gradechart import GradeDistribution
+
+ext = load_script("portfolio_students_ext", "Exercise 3 Ext/Exercise3 Ext.py")
+Student = ext.Student
+
+
+def student(c1, c2, c3, exam):
+    return Student(1, "Test", c1, c2, c3, exam)
+
+
+def test_counts_follow_student_grades():
+    dist = GradeDistribution([student(20, 20, 20, 100), student(10, 10, 10, 40), student(0, 0, 0, 0)])
+    assert dist.size == 3
+    assert dist.grades == {"A": 1, "B": 0, "C": 0, "D": 1, "F": 1}
+    assert dist.bins[9] == 1 and dist.bins[4] == 1 and dist.bins[0] == 1
+    assert dist.percentile(0.5) == student(10, 10, 10, 40).pct()
+
+
+def test_out_of_range_totals_are_not_counted():
+    dist = GradeDistribution()
+    assert dist.add(student(20, 20, 20, 150)) is None   # 210 / 160
+    assert dist.add(student(-5, 0, 0, 0)) is None
+    assert dist.remove(student(20, 20, 20, 150)) is None
+    assert dist.size == 0 and sum(dist.bins) == 0
+
+
+def test_store_keeps_out_of_range_rows_and_chart_leaves_them_out(tmp_path):
+    # the Ext app rewrites the file on every edit, so dropping rows on load would delete them
+    path = tmp_path / "marks.txt"
+    path.write_text("3\n1,Ann,10,10,10,50\n2,Bob,25,10,10,150\n3,Cy,10,10,10,-50\n", encoding="utf-8")
+    store = ext.StudentStore(str(path))
+    store.save()
+    assert [s.code for s in ext.StudentStore(str(path)).students] == [1, 2, 3]
+    assert GradeDistribution(store.students).size == 1
@@ -0,0 +1,23 @@
+import importlib
+import sys
+
+import jokecorpus
+
+
+def test_imports_without_resource_module(monkeypatch):
+    # Windows has no `resource`; the corpus (and everything importing it) must still load
+    monkeypatch.setitem(sys.modules, "resource", None)
+    module = importlib.reload(jokecorpus)
+    assert module.memory_report()
+
+
+def test_get_splits_on_question_mark(tmp_path):
+    path = tmp_path / "jokes.txt"
+    path.write_text("Why?Because.\n\nNo punchline here\n", encoding="utf-8")
+    corpus = jokecorpus.JokeCorpus(str(path))
+    try:
+        assert len(corpus) == 2
+        assert corpus.get(0) == ("Why?", "Because.")
+        assert corpus.get(1) == ("No punchline here", "(No punchline found)")
+    finally:
+        corpus.close()
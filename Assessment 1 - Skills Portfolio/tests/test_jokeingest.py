@@ -0,0 +1,48 @@
+from array import array
+
+import pytest
+
+import jokeingest
+from jokeingest import Ingestor, joke_key
+
+
+def read_seen(corpus):
+    seen = array("Q")
+    seen.frombytes((corpus.parent / (corpus.name + ".seen")).read_bytes())
+    return set(seen)
+
+
+def test_counts_bytes_dedupes_and_lists_rejected_lines(tmp_path):
+    src = tmp_path / "src.txt"
+    src.write_text("Café joke?Très bon.\nno question mark here\nCAFÉ  joke?très bon.\n", encoding="utf-8")
+    corpus = tmp_path / "corpus.txt"
+    stats = Ingestor(str(corpus)).run([str(src)])
+    assert stats["bytes"] == src.stat().st_size          # bytes, not characters
+    assert stats["added"] == 1 and stats["duplicates"] == 1
+    assert stats["rejected"] == [(str(src), 2, "no question mark here")]
+    assert corpus.read_text(encoding="utf-8") == "Café joke?Très bon.\n"
+
+
+def test_failed_source_leaves_no_jokes_or_hashes_behind(tmp_path, monkeypatch):
+    good = tmp_path / "a.txt"
+    good.write_text("A?a.\n", encoding="utf-8")
+    bad = tmp_path / "b.txt"
+    bad.write_text("B?b.\nboom?x.\n", encoding="utf-8")
+    corpus = tmp_path / "corpus.txt"
+
+    parse = jokeingest.parse_joke
+
+    def failing(line):
+        if line.startswith("boom"):
+            raise OSError("disk full")
+        return parse(line)
+    monkeypatch.setattr(jokeingest, "parse_joke", failing)
+    with pytest.raises(OSError):
+        Ingestor(str(corpus)).run([str(good), str(bad)])
+    assert corpus.read_text(encoding="utf-8") == "A?a.\n"
+    assert read_seen(corpus) == {joke_key("A?", "a.")}
+
+    monkeypatch.setattr(jokeingest, "parse_joke", parse)
+    stats = Ingestor(str(corpus)).run([str(good), str(bad)])
+    assert stats["skipped_files"] == 1 and stats["added"] == 2
+    assert corpus.read_text(encoding="utf-8") == "A?a.\nB?b.\nboom?x.\n"
@@ -0,0 +1,65 @@
+import os
+import random
+
+from jokecorpus import JokeCorpus
+from jokeratings import AliasTable, JokeRatings, WeightedPicker
+
+
+def write(path, lines, mtime_ns):
+    path.write_text("".join(line + "\n" for line in lines), encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def open_ratings(path, appended=False):
+    corpus = JokeCorpus(str(path))
+    try:
+        return JokeRatings.open(corpus, appended)
+    finally:
+        corpus.close()
+
+
+def test_alias_draws_follow_weights():
+    table = AliasTable([1.0, 3.0, 0.0, 4.0])
+    rng = random.Random(0)
+    counts = [0] * 4
+    for _ in range(80_000):
+        counts[table.draw(rng)] += 1
+    assert counts[2] == 0
+    assert abs(counts[1] / 80_000 - 3 / 8) < 0.01
+    assert abs(counts[3] / 80_000 - 4 / 8) < 0.01
+
+
+def test_ratings_survive_reopen_but_not_an_edited_file(tmp_path):
+    path = tmp_path / "jokes.txt"
+    write(path, ["A?a.", "B?b."], 1_000_000_000)
+    ratings = open_ratings(path)
+    ratings.rate(1, True)
+    ratings.save()
+    assert list(open_ratings(path).up) == [0, 1]
+
+    # reordered lines: joke 1 is now a different joke, so its thumbs-up must go
+    write(path, ["B?b.", "A?a."], 2_000_000_000)
+    assert list(open_ratings(path).up) == [0, 0]
+
+
+def test_ratings_kept_when_lines_were_appended(tmp_path):
+    path = tmp_path / "jokes.txt"
+    write(path, ["A?a."], 1_000_000_000)
+    ratings = open_ratings(path)
+    ratings.rate(0, False)
+    ratings.save()
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("B?b.\n")
+    assert list(open_ratings(path, appended=True).down) == [1, 0]
+
+
+def test_rating_does_not_rebuild_on_the_calling_thread():
+    picker = WeightedPicker(JokeRatings(3), rng=random.Random(0), rebuild_every=2)
+    table = picker.table
+    picker.rate(0, True)
+    assert picker.table is table and picker.pending == 1
+    picker.rate(0, True)
+    assert picker.pending == 0           # handed to the worker
+    picker.wait()
+    assert picker.table is not table
+    assert picker.table.prob[0] == 1.0   # joke 0 now outweighs the others
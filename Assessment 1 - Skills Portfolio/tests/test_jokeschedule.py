@@ -0,0 +1,48 @@
+import json
+
+import pytest
+
+from jokeschedule import FeistelPermutation, JokeScheduler
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, 5, 16, 17, 100, 1000, 4099])
+def test_permutation_is_a_bijection(n):
+    for seed in (0, 1, 12345):
+        perm = FeistelPermutation(n, seed)
+        assert sorted(perm[k] for k in range(n)) == list(range(n))
+
+
+def test_seeds_give_different_orders():
+    assert [FeistelPermutation(100, 1)[k] for k in range(100)] != \
+           [FeistelPermutation(100, 2)[k] for k in range(100)]
+
+
+def test_every_joke_once_per_cycle():
+    schedule = JokeScheduler(50)
+    first = [schedule.next() for _ in range(50)]
+    second = [schedule.next() for _ in range(50)]
+    assert sorted(first) == sorted(second) == list(range(50))
+    assert first != second
+
+
+def test_cursor_survives_a_restart(tmp_path):
+    path = str(tmp_path / "jokes.txt.cursor")
+    schedule = JokeScheduler(30, path)
+    seen = [schedule.next() for _ in range(12)]
+    assert not (tmp_path / "jokes.txt.cursor.tmp").exists()
+
+    restarted = JokeScheduler(30, path)
+    seen += [restarted.next() for _ in range(18)]
+    assert sorted(seen) == list(range(30))
+
+
+def test_cursor_resets_for_a_different_corpus_or_a_bad_file(tmp_path):
+    path = tmp_path / "jokes.txt.cursor"
+    schedule = JokeScheduler(30, str(path))
+    for _ in range(5):
+        schedule.next()
+    assert json.loads(path.read_text())["pos"] == 5
+
+    assert JokeScheduler(31, str(path)).pos == 0
+    path.write_text("{not json", encoding="utf-8")
+    assert JokeScheduler(30, str(path)).pos == 0
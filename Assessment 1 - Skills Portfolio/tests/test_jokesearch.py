@@ -0,0 +1,52 @@
+import os
+
+from jokecorpus import JokeCorpus
+from jokesearch import JokeSearchIndex, tokenize
+
+
+def write(path, lines, mtime_ns):
+    path.write_text("".join(line + "\n" for line in lines), encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def search(path, query):
+    corpus = JokeCorpus(str(path))
+    try:
+        index = JokeSearchIndex.open(corpus)
+        return [corpus.get(i) for i in index.search(query)]
+    finally:
+        corpus.close()
+
+
+def test_tokenize_drops_stopwords_and_folds_plurals():
+    assert tokenize("Why did the chickens cross the roads?") == ["chicken", "cross", "road"]
+
+
+def test_edited_line_rebuilds_index(tmp_path):
+    path = tmp_path / "jokes.txt"
+    write(path, ["Why did the chicken cross the road?To get across.",
+                 "Knock knock?Who is there."], 1_000_000_000)
+    assert search(path, "chicken")[0][0].startswith("Why did the chicken")
+
+    # same number of lines, different content: positions now mean other jokes
+    write(path, ["Knock knock?Who is there.",
+                 "Why did the chicken cross the road?To get across."], 2_000_000_000)
+    hits = search(path, "chicken")
+    assert [setup for setup, _ in hits] == ["Why did the chicken cross the road?"]
+
+
+def test_appended_jokes_are_indexed_incrementally(tmp_path):
+    path = tmp_path / "jokes.txt"
+    write(path, ["Why did the chicken cross the road?To get across."], 1_000_000_000)
+    search(path, "chicken")
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("What do you call a sleeping dinosaur?A dino-snore.\n")
+
+    corpus = JokeCorpus(str(path))
+    try:
+        index = JokeSearchIndex.open(corpus, appended=True)
+        assert index.doc_count == 2
+        assert index.search("dinosaur") == [1]
+        assert index.search("chicken") == [0]
+    finally:
+        corpus.close()
@@ -0,0 +1,25 @@
+from leaderboard import Leaderboard
+
+
+def test_load_clamps_scores_outside_0_to_100(tmp_path):
+    path = tmp_path / "leaderboard.csv"
+    path.write_text("1,ann,easy,250\n2,bob,easy,-7\n3,cy,easy,oops\n4,dee,easy,50\n", encoding="utf-8")
+    lb = Leaderboard(str(path))
+    assert lb.top("easy") == [("ann", 100), ("dee", 50), ("bob", 0)]
+    assert lb.rank("easy", 50) == (2, 3)
+
+
+def test_malformed_file_counts_as_empty(tmp_path):
+    path = tmp_path / "leaderboard.csv"
+    path.write_bytes(b"1,ann,easy,90\n\xff\xfe\x00garbage\n")
+    lb = Leaderboard(str(path))
+    assert lb.boards == {}
+    assert lb.record("bob", "easy", 120) == (1, 1)
+
+
+def test_rank_counts_only_better_scores(tmp_path):
+    lb = Leaderboard(str(tmp_path / "leaderboard.csv"))
+    for player, score in (("a", 70), ("b", 90), ("c", 70)):
+        lb.record(player, "hard", score)
+    assert lb.rank("hard", 70) == (2, 3)
+    assert lb.top("hard")[0] == ("b", 90)
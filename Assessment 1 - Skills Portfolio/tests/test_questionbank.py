@@ -0,0 +1,42 @@
+import pytest
+
+from questionbank import LEVEL_RANGES, distinctQuestions, generateBank, generateSession
+
+
+def test_same_seed_same_questions():
+    assert list(generateBank("medium", 500, seed=7)) == list(generateBank("medium", 500, seed=7))
+    assert list(generateBank("medium", 500, seed=7)) != list(generateBank("medium", 500, seed=8))
+
+
+@pytest.mark.parametrize("level", list(LEVEL_RANGES))
+def test_questions_stay_in_range_and_add_up(level):
+    lo, hi = LEVEL_RANGES[level]
+    for num1, op, num2, answer in generateBank(level, 2000, seed=1):
+        assert lo <= num1 <= hi and lo <= num2 <= hi
+        assert answer == (num1 + num2 if op == "+" else num1 - num2)
+
+
+def test_dedupe_never_repeats_a_question():
+    # every easy question there is: the last few have to be found among many repeats
+    count = distinctQuestions("easy")
+    bank = generateBank("easy", count, seed=3, dedupe=True)
+    questions = [q[:3] for q in bank]
+    assert len(questions) == len(set(questions)) == count
+    with pytest.raises(ValueError):
+        generateBank("easy", count + 1, seed=3, dedupe=True)
+
+
+def test_no_negative_answers_when_disallowed():
+    bank = generateBank("hard", 5000, seed=2, allowNegative=False)
+    assert min(bank.answers) >= 0
+    assert min(generateBank("hard", 5000, seed=2).answers) < 0
+
+
+def test_distinct_counts_and_sessions():
+    assert distinctQuestions("easy") == 81 + 81
+    assert distinctQuestions("easy", allowNegative=False) == 81 + 45
+    session = generateSession("easy", seed=4, allowNegative=False)
+    assert len(session) == 10 and len({q[:3] for q in session}) == 10
+    assert min(session.answers) >= 0
+    with pytest.raises(ValueError):
+        generateBank("impossible", 1)
@@ -0,0 +1,61 @@
+import random
+from functools import partial
+
+import pytest
+
+import tkstub
+from conftest import load_script
+from questionbank import LEVEL_RANGES
+
+quiz = load_script("portfolio_quiz", "Excercise 1/Excercise1.py")
+
+
+@pytest.fixture
+def build(monkeypatch, tmp_path):
+    """Build the quiz into a stub window, with every file it writes in tmp_path."""
+    monkeypatch.setattr(quiz, "tk", tkstub.module())
+    monkeypatch.setattr(quiz, "AttemptLogger", partial(quiz.AttemptLogger, str(tmp_path / "attempts.csv")))
+    monkeypatch.setattr(quiz, "Leaderboard", partial(quiz.Leaderboard, str(tmp_path / "leaderboard.csv")))
+    monkeypatch.setattr(quiz, "BG_CACHE_DIR", str(tmp_path / "bgcache"))
+    monkeypatch.setattr(quiz, "player", "Player")
+    yield lambda: quiz.buildApp(tkstub.Widget())
+    quiz.closeStores()
+
+
+def test_quiz_builds_and_plays_headlessly(build):
+    build()
+    assert quiz.ids["player_entry"].get() == "Player"
+    quiz.ids["player_entry"].delete(0, "end")
+    quiz.ids["player_entry"].insert(0, "Ada")
+    quiz.startQuiz("easy")
+    while not quiz.session.finished:
+        quiz.answerEntry.delete(0, "end")
+        quiz.answerEntry.insert(0, str(quiz.session.answer))
+        quiz.isCorrect()
+    assert quiz.session.score == 100
+    assert quiz.leaderboard.top("easy") == [("Ada", 100)]
+
+
+def test_rebuilding_starts_from_a_clean_window(build):
+    build()
+    first_log = quiz.attemptLog
+    quiz.bg_item = 1                  # as if the first window showed a background
+    quiz.leaderboard.record("Ada", "easy", 90)
+    build()                           # the launcher reopening the quiz
+    assert not first_log.worker.is_alive()
+    assert quiz.attemptLog is not first_log
+    assert quiz.bg_item != 1          # the old canvas's item id is forgotten
+    assert quiz.leaderboard.top("easy") == [("Ada", 90)]   # flushed by the first close
+
+
+def test_random_int_stays_in_the_level_range():
+    rng = random.Random(0)
+    for level, (lo, hi) in LEVEL_RANGES.items():
+        values = {quiz.randomInt(level, rng) for _ in range(2000)}
+        assert min(values) >= lo and max(values) <= hi
+    assert {quiz.randomInt("easy", rng) for _ in range(500)} == set(range(1, 10))
+
+
+def test_decide_operation_picks_both_signs():
+    rng = random.Random(0)
+    assert {quiz.decideOperation(rng) for _ in range(200)} == {"+", "-"}
@@ -0,0 +1,34 @@
+import random
+
+from adaptive import AdaptiveEngine, SimulatedPlayer, simulate
+from quizengine import CORRECT, RESTARTED, WRONG, QuizSession, simulatePlay
+
+
+def test_three_wrong_answers_restart_the_play():
+    session = QuizSession("easy", rng=random.Random(0))
+    assert session.submit(session.answer) == CORRECT
+    assert session.submit(session.answer + 1) == WRONG
+    assert session.submit(session.answer + 1) == WRONG
+    assert session.submit(session.answer + 1) == RESTARTED
+    assert session.score == 0 and session.questionCount == 1
+
+
+def test_simulated_play_gives_up_when_it_never_finishes():
+    rng = random.Random(0)
+    session = QuizSession("easy", rng=rng)
+    assert simulatePlay(session, 0.0, rng, maxAnswers=50) == 50
+    assert not session.finished
+
+
+def test_adaptive_play_is_bounded_too():
+    rng = random.Random(0)
+    session = QuizSession("adaptive", rng=rng, adaptive=AdaptiveEngine(rng=rng))
+    assert simulatePlay(session, 0.0, rng, maxAnswers=50) == 50
+
+
+def test_engine_settles_near_player_skill():
+    for skill in (1, 3):
+        rng = random.Random(skill)
+        trace = simulate(SimulatedPlayer(skill, rng=rng), AdaptiveEngine(rng=rng))
+        settled = trace[len(trace) // 2:]
+        assert abs(sum(settled) / len(settled) - skill) < 1
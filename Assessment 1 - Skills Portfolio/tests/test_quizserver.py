@@ -0,0 +1,58 @@
+import asyncio
+import random
+
+from quizserver import QuizServer, handleCommand
+
+
+def test_start_then_answer():
+    rng = random.Random(0)
+    session, reply, keep = handleCommand(None, "START easy", rng)
+    assert reply.startswith("QUESTION 1 ") and keep
+    session, reply, _ = handleCommand(session, f"ANSWER {session.answer}", rng)
+    assert reply.startswith("CORRECT\nQUESTION 2 ")
+    assert handleCommand(session, "QUIT", rng)[1:] == ("BYE\n", False)
+
+
+async def settle(quiz):
+    """Wait for the server to finish with every connection; returns how many are left."""
+    for _ in range(100):
+        if not quiz.active:
+            break
+        await asyncio.sleep(0.01)
+    return quiz.active
+
+
+def test_overlong_line_closes_only_that_connection():
+    errors = []
+
+    async def run():
+        asyncio.get_running_loop().set_exception_handler(lambda loop, ctx: errors.append(ctx))
+        quiz = QuizServer(seed=0)
+        server = await quiz.serve("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"A" * 200_000 + b"\n")
+            try:
+                reply = await reader.readline()
+            except ConnectionResetError:
+                # the server closed with our unread bytes still queued, so the
+                # kernel may reset the socket before the ERROR line is read
+                reply = b""
+            writer.close()
+            active = await settle(quiz)
+
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"START easy\n")
+            question = await reader.readline()
+            writer.close()
+            await settle(quiz)
+            return reply, active, question
+        finally:
+            server.close()
+            await server.wait_closed()
+
+    reply, active, question = asyncio.run(run())
+    assert reply in (b"ERROR line too long\n", b"") and active == 0
+    assert errors == []
+    assert question.startswith(b"QUESTION 1 ")
@@ -0,0 +1,67 @@
+import pytest
+
+from conftest import load_script
+from rosterdiff import HASH_BYTES_PER_ROW, ChangeSet, count_rows, diff_rosters, hash_diff, merge_diff
+
+ext = load_script("portfolio_students_ext", "Exercise 3 Ext/Exercise3 Ext.py")
+
+OLD = ["3", "1,Ann,10,10,10,50", "2,Bob,5,5,5,40", "3,Cy,20,20,20,90"]
+NEW = ["1,Ann,10,10,10,55", "3,Cy,20,20,20,90", "4,Dee,1,2,3,4", "4,Dee twice,0,0,0,0",
+       "1,Ann again,0,0,0,0"]
+
+
+def write(path, lines):
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return str(path)
+
+
+def summary(changes):
+    cs = ChangeSet.collect(changes)
+    return sorted(cs.added), sorted(cs.removed), sorted(cs.changed)
+
+
+@pytest.mark.parametrize("old_lines, new_lines", [(OLD, NEW), (NEW, OLD)])
+def test_hash_and_merge_diffs_agree(tmp_path, old_lines, new_lines):
+    old = write(tmp_path / "old.txt", old_lines)
+    new = write(tmp_path / "new.txt", new_lines)
+    assert summary(hash_diff(old, new)) == summary(merge_diff(old, new, run_rows=2))
+
+
+def test_first_row_per_code_wins(tmp_path):
+    old = write(tmp_path / "old.txt", OLD)
+    new = write(tmp_path / "new.txt", NEW)
+    added, removed, changed = summary(diff_rosters(old, new))
+    assert added == [(4, "Dee", 1, 2, 3, 4)]
+    assert removed == [(2, "Bob", 5, 5, 5, 40)]
+    assert changed == [((1, "Ann", 10, 10, 10, 50), (1, "Ann", 10, 10, 10, 55))]
+
+
+def test_count_rows_with_and_without_final_newline(tmp_path):
+    assert count_rows(write(tmp_path / "a.txt", OLD)) == 4
+    (tmp_path / "b.txt").write_text("1,Ann,1,1,1,1\n2,Bob,1,1,1,1", encoding="utf-8")
+    assert count_rows(str(tmp_path / "b.txt")) == 2
+    (tmp_path / "c.txt").write_text("", encoding="utf-8")
+    assert count_rows(str(tmp_path / "c.txt")) == 0
+
+
+def test_fallback_counts_rows_of_both_files(tmp_path):
+    old = write(tmp_path / "old.txt", OLD)
+    new = write(tmp_path / "new.txt", NEW)
+    both = (len(OLD) + len(NEW)) * HASH_BYTES_PER_ROW
+    assert diff_rosters(old, new, max_hash_memory=both).__name__ == "hash_diff"
+    assert diff_rosters(old, new, max_hash_memory=both - 1).__name__ == "merge_diff"
+
+
+def test_plan_updates_removes_and_appends(tmp_path):
+    store = ext.StudentStore(write(tmp_path / "marks.txt", OLD))
+    changes = ChangeSet(
+        added=[(4, "Dee", 1, 2, 3, 4), (3, "Cy", 0, 0, 0, 0)],    # 3 already there: update
+        removed=[(2, "Bob", 5, 5, 5, 40), (9, "Gone", 0, 0, 0, 0)],  # 9 already gone: skipped
+        changed=[((1, "Ann", 10, 10, 10, 50), (1, "Ann", 10, 10, 10, 55))],
+    )
+    plan = store.plan(changes)
+    inverse = store.apply(plan)
+    assert [(s.code, s.exam) for s in store.students] == [(1, 55), (3, 0), (4, 4)]
+    store.apply(inverse)
+    assert [(s.code, s.exam) for s in store.students] == [(1, 50), (2, 40), (3, 90)]
+
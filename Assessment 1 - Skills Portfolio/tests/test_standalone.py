@@ -0,0 +1,22 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from conftest import HERE
+
+SCRIPTS = ["Excercise 1/Excercise1.py", "Exercise 2/exercise2.py",
+           "Exercise 3/Exerciee3.py", "Exercise 3 Ext/Exercise3 Ext.py"]
+
+
+@pytest.mark.parametrize("script", SCRIPTS)
+def test_script_imports_on_its_own(script, tmp_path):
+    """Each exercise runs as `python <script>`: only its own folder is on sys.path."""
+    path = os.path.join(HERE, script)
+    code = ("import runpy, sys\n"
+            f"sys.path[0] = {os.path.dirname(path)!r}\n"
+            f"runpy.run_path({path!r}, run_name='standalone_check')\n")
+    proc = subprocess.run([sys.executable, "-c", code], cwd=tmp_path, capture_output=True, text=True,
+                          env={**os.environ, "PYTHONPATH": ""})
+    assert proc.returncode == 0, proc.stderr
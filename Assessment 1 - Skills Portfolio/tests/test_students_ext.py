@@ -0,0 +1,127 @@
+from conftest import load_script
+from gradechart import GradeDistribution
+
+ext = load_script("portfolio_students_ext", "Exercise 3 Ext/Exercise3 Ext.py")
+Student = ext.Student
+
+ROSTER = ["3", "1,Ann,10,10,10,50", "2,Bob,5,5,5,40", "3,Cy,20,20,20,90"]
+
+
+class Tree:
+    """Just enough of ttk.Treeview to follow the rows update_table touches."""
+
+    def __init__(self):
+        self.rows = []
+        self.values = {}
+
+    def get_children(self):
+        return list(self.rows)
+
+    def insert(self, parent, index, iid, values):
+        self.rows.insert(len(self.rows) if index == "end" else index, iid)
+        self.values[iid] = values
+
+    def delete(self, iid):
+        self.rows.remove(iid)
+        del self.values[iid]
+
+    def item(self, iid, values):
+        self.values[iid] = values
+
+    def move(self, iid, parent, index):
+        self.rows.remove(iid)
+        self.rows.insert(index, iid)
+
+
+class Var:
+    def set(self, value):
+        pass
+
+
+def write(path, lines):
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return str(path)
+
+
+def make_app(tmp_path, depth=ext.HISTORY_DEPTH):
+    """An App wired to a stand-in table and chart, without opening a window."""
+    app = ext.App.__new__(ext.App)
+    app.store = ext.StudentStore(write(tmp_path / "marks.txt", ROSTER))
+    app.history = ext.History(depth)
+    app.sort_asc = True
+    app.tree = Tree()
+    app.chart = GradeDistribution()
+    app.detail_vars = {"Name": Var()}
+    app.refresh_table()
+    return app
+
+
+def snapshot(app):
+    """Roster as the store, the table, the chart and the saved file each see it."""
+    rows = [(s.code, s.name, s.exam) for s in app.store.students]
+    assert app.tree.rows == [str(code) for code, _, _ in rows]
+    assert app.chart.grades == GradeDistribution(app.store.students).grades
+    assert len(ext.StudentStore(app.store.path).students) == len(rows)
+    return rows
+
+
+def test_order_round_trips_codes_outside_uint32(tmp_path):
+    store = ext.StudentStore(write(tmp_path / "marks.txt", [
+        "-5,Neg,1,1,1,1", f"{2**40},Big,1,1,1,1", f"{2**70},Huge,1,1,1,1", "7,Small,1,1,1,1"]))
+    before = [s.code for s in store.students]
+    inverse = store.apply(("order", sorted(before)))
+    assert [s.code for s in store.students] == sorted(before)
+    store.apply(inverse)
+    assert [s.code for s in store.students] == before
+
+
+def test_history_keeps_only_the_last_depth_edits():
+    history = ext.History(depth=3)
+    for i in range(5):
+        history.record(("order", [i]))
+    assert list(history.undo_stack) == [("order", [2]), ("order", [3]), ("order", [4])]
+
+
+def test_new_edit_clears_redo(tmp_path):
+    app = make_app(tmp_path)
+    app.history.record(app.commit(("remove", 0, app.store.students[0])))
+    app.undo()
+    assert app.history.can_redo()
+    app.history.record(app.commit(("insert", 3, Student(4, "Dee", 1, 2, 3, 4))))
+    assert not app.history.can_redo()
+    app.redo()   # nothing to redo: no change
+    assert [code for code, _, _ in snapshot(app)] == [1, 2, 3, 4]
+
+
+def test_undo_and_redo_every_kind_of_edit(tmp_path):
+    app = make_app(tmp_path)
+    states = [snapshot(app)]
+    edits = [
+        ("insert", 3, Student(4, "Dee", 1, 2, 3, 4)),
+        ("remove", 1, app.store.students[1]),
+        ("update", 0, Student(1, "Ann", 20, 20, 20, 100)),
+        ("order", [4, 3, 1]),
+        ("batch", [("update", 1, Student(3, "Cy", 0, 0, 0, 0)), ("remove", 2, Student(1, "Ann", 20, 20, 20, 100))]),
+    ]
+    for edit in edits:
+        app.history.record(app.commit(edit))
+        states.append(snapshot(app))
+
+    for state in reversed(states[:-1]):
+        app.undo()
+        assert snapshot(app) == state
+    assert not app.history.can_undo()
+
+    for state in states[1:]:
+        app.redo()
+        assert snapshot(app) == state
+    assert not app.history.can_redo()
+
+
+def test_undo_beyond_depth_stops_at_oldest_kept_edit(tmp_path):
+    app = make_app(tmp_path, depth=2)
+    for code in (4, 5, 6):
+        app.history.record(app.commit(("insert", len(app.store.students), Student(code, "New", 1, 1, 1, 1))))
+    for _ in range(3):
+        app.undo()
+    assert [code for code, _, _ in snapshot(app)] == [1, 2, 3, 4]
@@ -0,0 +1,45 @@
+"""
+A stand-in for the parts of tkinter the apps touch, for building them
+headlessly (there is no display on CI). Widgets accept any call; canvas
+create_* calls hand out item ids, entries remember their text, and
+after() callbacks are queued for the test to run.
+"""
+import itertools
+import types
+
+
+class Widget:
+    ids = itertools.count(1)
+
+    def __init__(self, *args, **kwargs):
+        self.text = ""
+        self.pending = []
+
+    def __getattr__(self, name):
+        if name.startswith("create_"):
+            return lambda *a, **kw: next(Widget.ids)
+        if name.startswith("winfo_"):
+            return lambda *a, **kw: 500
+        return lambda *a, **kw: None
+
+    # Entry
+    def insert(self, index, text):
+        self.text = str(text) + self.text if index == 0 else self.text + str(text)
+
+    def delete(self, first, last=None):
+        self.text = ""
+
+    def get(self):
+        return self.text
+
+    # after()
+    def after(self, ms, fn=None, *args):
+        self.pending.append(fn)
+        return f"after#{len(self.pending)}"
+
+
+def module():
+    """A fake `tkinter` module to monkeypatch in as an app's `tk`."""
+    return types.SimpleNamespace(Tk=Widget, Toplevel=Widget, Canvas=Widget, Entry=Widget,
+                                 Button=Widget, Label=Widget, Frame=Widget, PhotoImage=Widget,
+                                 TclError=Exception)